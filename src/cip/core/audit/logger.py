@@ -15,6 +15,7 @@ import hashlib
 import json
 import logging
 import uuid
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
@@ -28,6 +29,10 @@ logger = logging.getLogger(__name__)
 # Input hashing (ported from HIPAA project's audit_middleware pattern)
 # ---------------------------------------------------------------------------
 
+# Built once: json.dumps() with non-default options constructs a new encoder per call.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
 def _hash_input(data: Any) -> str:
     """SHA-256 hash of canonical JSON — no PHI stored in audit logs.
 
@@ -38,7 +43,7 @@ def _hash_input(data: Any) -> str:
         Hex-encoded SHA-256 digest, or empty string on failure.
     """
     try:
-        canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
+        canonical = _CANONICAL_ENCODER.encode(data)
         return hashlib.sha256(canonical.encode()).hexdigest()
     except (TypeError, ValueError):
         return ""
@@ -65,15 +70,111 @@ class AuditEvent:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+_INSERT_EVENT_SQL = """INSERT INTO audit_log
+   (id, timestamp, action, tool_name, tool_input_hash,
+    privacy_mode, llm_provider, llm_disclosed, snapshot_id,
+    duration_ms, status, error_type, metadata_json)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def _utc_now_iso() -> str:
+    """Default audit clock: current UTC time as ISO 8601."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _event_row(event: AuditEvent, timestamp: str) -> tuple[Any, ...]:
+    """Build the ``audit_log`` insert parameters for an event (with a new UUID)."""
+    metadata_json = (
+        json.dumps(event.metadata, separators=(",", ":"))
+        if event.metadata
+        else None
+    )
+    return (
+        str(uuid.uuid4()),
+        timestamp,
+        event.action,
+        event.tool_name or None,
+        event.tool_input_hash or None,
+        event.privacy_mode,
+        event.llm_provider,
+        1 if event.llm_disclosed else 0,
+        event.snapshot_id,
+        event.duration_ms,
+        event.status,
+        event.error_type,
+        metadata_json,
+    )
+
+
+def _tool_call_event(
+    tool_name: str,
+    tool_input: Any = None,
+    *,
+    privacy_mode: str | None = None,
+    llm_provider: str | None = None,
+    llm_disclosed: bool = False,
+    snapshot_id: str | None = None,
+    duration_ms: float | None = None,
+    status: str = "success",
+    error_type: str | None = None,
+    metadata: dict[str, Any] | None = None,
+) -> AuditEvent:
+    return AuditEvent(
+        action="tool_invocation",
+        tool_name=tool_name,
+        tool_input_hash=_hash_input(tool_input) if tool_input else "",
+        privacy_mode=privacy_mode,
+        llm_provider=llm_provider,
+        llm_disclosed=llm_disclosed,
+        snapshot_id=snapshot_id,
+        duration_ms=duration_ms,
+        status=status,
+        error_type=error_type,
+        metadata=metadata or {},
+    )
+
+
 # ---------------------------------------------------------------------------
 # AuditLogger
 # ---------------------------------------------------------------------------
 
+def _events_query(
+    *,
+    action: str | None,
+    tool_name: str | None,
+    since: str | None,
+    limit: int,
+) -> tuple[str, list[Any]]:
+    """Build the parameterized ``get_events`` query.
+
+    Filtering, ordering and the limit all happen in SQLite so the
+    ``idx_audit_*`` indexes are usable and only the result rows are
+    materialized.
+    """
+    conditions: list[str] = []
+    params: list[Any] = []
+
+    if action:
+        conditions.append("action = ?")
+        params.append(action)
+    if tool_name:
+        conditions.append("tool_name = ?")
+        params.append(tool_name)
+    if since:
+        conditions.append("timestamp >= ?")
+        params.append(since)
+
+    where = (" WHERE " + " AND ".join(conditions)) if conditions else ""
+    params.append(limit)
+    return f"SELECT * FROM audit_log{where} ORDER BY timestamp DESC LIMIT ?", params
+
+
 class AuditLogger:
     """Records audit events to the ``audit_log`` SQLite table.
 
     Thread-safe via SQLite's internal locking. All writes are committed
-    immediately so no audit entry is lost on crash.
+    immediately so no audit entry is lost on crash. ``clock`` supplies event
+    timestamps (ISO 8601) and can be replaced for deterministic tests.
 
     Usage::
 
@@ -87,8 +188,14 @@ class AuditLogger:
         )
     """
 
-    def __init__(self, database: HealthDatabase) -> None:
+    def __init__(
+        self,
+        database: HealthDatabase,
+        *,
+        clock: Callable[[], str] = _utc_now_iso,
+    ) -> None:
         self._db = database
+        self._clock = clock
 
     # ---------------------------------------------------------------
     # Write
@@ -103,45 +210,45 @@ class AuditLogger:
         Returns:
             The generated event ID (UUID4 hex).
         """
-        event_id = str(uuid.uuid4())
-        now = datetime.now(timezone.utc).isoformat()
-
-        metadata_json = (
-            json.dumps(event.metadata, separators=(",", ":"))
-            if event.metadata
-            else None
-        )
+        row = _event_row(event, self._clock())
 
         try:
             conn = self._db.connection
-            conn.execute(
-                """INSERT INTO audit_log
-                   (id, timestamp, action, tool_name, tool_input_hash,
-                    privacy_mode, llm_provider, llm_disclosed, snapshot_id,
-                    duration_ms, status, error_type, metadata_json)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    event_id,
-                    now,
-                    event.action,
-                    event.tool_name or None,
-                    event.tool_input_hash or None,
-                    event.privacy_mode,
-                    event.llm_provider,
-                    1 if event.llm_disclosed else 0,
-                    event.snapshot_id,
-                    event.duration_ms,
-                    event.status,
-                    event.error_type,
-                    metadata_json,
-                ),
-            )
+            conn.execute(_INSERT_EVENT_SQL, row)
             conn.commit()
         except Exception:
             logger.exception("Failed to write audit event — event lost")
             return ""
 
-        return event_id
+        return row[0]
+
+    def log_events(self, events: Sequence[AuditEvent]) -> list[str]:
+        """Insert several audit events in one transaction.
+
+        Args:
+            events: Fully populated ``AuditEvent`` objects.
+
+        Returns:
+            The generated event IDs in input order (empty if the write failed).
+        """
+        rows = [_event_row(event, self._clock()) for event in events]
+        if not rows or not self._write_rows(rows):
+            return []
+        return [row[0] for row in rows]
+
+    def _write_rows(self, rows: list[tuple[Any, ...]]) -> bool:
+        """Insert prepared rows with one executemany + commit (all or nothing)."""
+        conn = self._db.connection
+        try:
+            conn.executemany(_INSERT_EVENT_SQL, rows)
+            conn.commit()
+        except Exception:
+            # Don't leave the rows before the failure pending on the shared
+            # connection, where the next unrelated commit would persist them.
+            conn.rollback()
+            logger.exception("Failed to write %d audit events — events lost", len(rows))
+            return False
+        return True
 
     def log_tool_call(
         self,
@@ -174,10 +281,9 @@ class AuditLogger:
         Returns:
             The generated event ID.
         """
-        return self.log_event(AuditEvent(
-            action="tool_invocation",
-            tool_name=tool_name,
-            tool_input_hash=_hash_input(tool_input) if tool_input else "",
+        return self.log_event(_tool_call_event(
+            tool_name,
+            tool_input,
             privacy_mode=privacy_mode,
             llm_provider=llm_provider,
             llm_disclosed=llm_disclosed,
@@ -185,7 +291,7 @@ class AuditLogger:
             duration_ms=duration_ms,
             status=status,
             error_type=error_type,
-            metadata=metadata or {},
+            metadata=metadata,
         ))
 
     def log_data_delete(
@@ -240,23 +346,9 @@ class AuditLogger:
         Returns:
             List of event dicts, newest first.
         """
-        conditions: list[str] = []
-        params: list[Any] = []
-
-        if action:
-            conditions.append("action = ?")
-            params.append(action)
-        if tool_name:
-            conditions.append("tool_name = ?")
-            params.append(tool_name)
-        if since:
-            conditions.append("timestamp >= ?")
-            params.append(since)
-
-        where = (" WHERE " + " AND ".join(conditions)) if conditions else ""
-        query = f"SELECT * FROM audit_log{where} ORDER BY timestamp DESC LIMIT ?"
-        params.append(limit)
-
+        query, params = _events_query(
+            action=action, tool_name=tool_name, since=since, limit=limit,
+        )
         rows = self._db.connection.execute(query, params).fetchall()
         return [dict(row) for row in rows]
 
@@ -11,7 +11,7 @@ import json
 import logging
 from typing import Any
 
-from cip.core.mantic.models import ManticEnvelope
+from cip.core.mantic.models import ManticEnvelope, decode_json
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +54,8 @@ class ManticMCPClient:
         Returns the full envelope dict.  Callers typically read
         ``envelope["result"]`` which has the same keys as the old
         ``generic_detect(mode="friction")`` return value.
+        ``result["layer_coupling"]`` is always normalized to a dict with a
+        ``coherence`` key.
         """
         args: dict[str, Any] = {
             "profile_name": profile_name,
@@ -64,7 +66,9 @@ class ManticMCPClient:
         if threshold_override is not None:
             args["threshold_override"] = threshold_override
 
-        return await self._call_tool("mantic_detect_friction", args)
+        envelope = await self._call_tool("mantic_detect_friction", args)
+        _normalize_layer_coupling(envelope["result"])
+        return envelope
 
     async def detect_emergence(
         self,
@@ -90,7 +94,9 @@ class ManticMCPClient:
         if threshold_override is not None:
             args["threshold_override"] = threshold_override
 
-        return await self._call_tool("mantic_detect_emergence", args)
+        envelope = await self._call_tool("mantic_detect_emergence", args)
+        _normalize_layer_coupling(envelope["result"])
+        return envelope
 
     async def health_check(self) -> dict[str, Any]:
         """Verify cip-mantic-core is reachable and report status."""
@@ -100,9 +106,11 @@ class ManticMCPClient:
         """List all registered domain profiles."""
         return await self._call_tool("list_domain_profiles", {})
 
-    def parse_envelope(self, raw: dict[str, Any]) -> ManticEnvelope:
-        """Parse a raw dict into a typed ManticEnvelope."""
-        return ManticEnvelope.from_dict(raw)
+    def parse_envelope(self, raw: dict[str, Any] | str | bytes) -> ManticEnvelope:
+        """Parse a raw dict, or the JSON text of one, into a typed ManticEnvelope."""
+        if isinstance(raw, dict):
+            return ManticEnvelope.from_dict(raw)
+        return ManticEnvelope.from_json(raw)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -140,7 +148,7 @@ class ManticMCPClient:
 
         if isinstance(payload, str):
             try:
-                parsed: Any = json.loads(payload)
+                parsed: Any = decode_json(payload)
             except (json.JSONDecodeError, TypeError) as exc:
                 raise ManticResponseError(
                     f"Invalid JSON from {tool_name}: {exc}"
@@ -197,6 +205,22 @@ class ManticDetectionError(ManticClientError):
 # Helpers
 # ------------------------------------------------------------------
 
+def _normalize_layer_coupling(result: dict[str, Any]) -> None:
+    """Rewrite ``result["layer_coupling"]`` in place to the dict form.
+
+    cip-mantic-core >= 1.0 returns ``{"coherence": 0.78}``; legacy servers
+    return ``[{"pair": [...], "delta": ..., "coherence": ...}, ...]``. Legacy
+    entries are kept under ``pairs`` so explicit-mode context loses nothing.
+    """
+    coupling = result.get("layer_coupling")
+    if isinstance(coupling, list):
+        first = coupling[0] if coupling else {}
+        result["layer_coupling"] = {
+            "coherence": first.get("coherence") if isinstance(first, dict) else None,
+            "pairs": coupling,
+        }
+
+
 def _extract_text(result: Any) -> str | None:
     """Extract text from a fastmcp tool result.
 
@@ -2,7 +2,29 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
+from typing import Any
+
+try:  # Optional speedup: `pip install cip-health[speedups]`
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def decode_json(text: str | bytes) -> Any:
+    """Decode JSON text (e.g. a cip-mantic-core response body), with orjson when available.
+
+    orjson rejects the NaN/Infinity literals that Python's json module emits,
+    so anything it refuses is re-parsed by the stdlib, which either accepts it
+    or raises the usual ``json.JSONDecodeError``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
 
 
 @dataclass
@@ -62,6 +84,19 @@ class ManticEnvelope:
             audit=data.get("audit", {}),
         )
 
+    @classmethod
+    def from_json(cls, text: str | bytes) -> ManticEnvelope:
+        """Parse the JSON text of a response straight into an envelope.
+
+        Raises:
+            ValueError: If the text is not valid JSON or not a JSON object
+                (``json.JSONDecodeError`` is a ValueError).
+        """
+        data = decode_json(text)
+        if not isinstance(data, dict):
+            raise ValueError(f"Expected a JSON object, got {type(data).__name__}")
+        return cls.from_dict(data)
+
     @property
     def ok(self) -> bool:
         return self.status == "ok"
@@ -15,64 +15,134 @@ from typing import Any, Literal
 
 PrivacyMode = Literal["strict", "standard", "explicit"]
 
+# Standard-mode extras: (output key, full_data_context key), or for grouped
+# metrics (output key, ((sub key, full_data_context key), ...)). Missing
+# source keys are emitted as None.
+_STANDARD_METRICS: tuple[tuple[str, str | tuple[tuple[str, str], ...]], ...] = (
+    ("resting_heart_rate_bpm", "resting_heart_rate"),
+    ("blood_pressure", (
+        ("systolic_avg", "blood_pressure_systolic"),
+        ("diastolic_avg", "blood_pressure_diastolic"),
+    )),
+    ("hrv_ms", "hrv_ms"),
+    ("sleep_duration_hours", "sleep_duration_hours"),
+    ("exercise_sessions_per_week", "exercise_sessions_per_week"),
+    ("bmi", "bmi"),
+    ("lab_count", "lab_count"),
+)
+
 
 def _round_floats(obj: Any, ndigits: int = 2) -> Any:
-    if isinstance(obj, float):
-        return round(obj, ndigits)
-    if isinstance(obj, dict):
-        return {k: _round_floats(v, ndigits=ndigits) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_round_floats(v, ndigits=ndigits) for v in obj]
-    return obj
+    """Return a copy of *obj* with every float rounded to *ndigits*.
 
+    Dicts and lists are rebuilt (as plain dict/list); other values pass
+    through. Walks the tree with an explicit stack instead of recursing, and
+    checks ``type(v) is float`` before falling back to ``isinstance`` (which
+    still catches float/dict/list subclasses).
+    """
+    if not isinstance(obj, (dict, list)):
+        return round(obj, ndigits) if isinstance(obj, float) else obj
 
-def build_llm_data_context(
+    root: dict[Any, Any] | list[Any] = {} if isinstance(obj, dict) else []
+    stack: list[tuple[Any, Any]] = [(obj, root)]
+    while stack:
+        src, dst = stack.pop()
+        if isinstance(src, dict):
+            for k, v in src.items():
+                t = type(v)
+                if t is float:
+                    dst[k] = round(v, ndigits)
+                elif t is dict or t is list or isinstance(v, (dict, list)):
+                    child = {} if isinstance(v, dict) else []
+                    dst[k] = child
+                    stack.append((v, child))
+                else:
+                    dst[k] = round(v, ndigits) if isinstance(v, float) else v
+        else:
+            for v in src:
+                t = type(v)
+                if t is float:
+                    dst.append(round(v, ndigits))
+                elif t is dict or t is list or isinstance(v, (dict, list)):
+                    child = {} if isinstance(v, dict) else []
+                    dst.append(child)
+                    stack.append((v, child))
+                else:
+                    dst.append(round(v, ndigits) if isinstance(v, float) else v)
+    return root
+
+
+def build_strict_llm_data_context(
     *,
-    full_data_context: dict[str, Any],
-    privacy_mode: PrivacyMode,
-    include_mantic_raw: bool,
+    period: str | None,
+    signals: dict[str, Any],
+    mantic_summary: dict[str, Any],
+    data_source: str | None = None,
+    data_source_note: str | None = None,
 ) -> dict[str, Any]:
-    """Build the minimized data_context that will be rendered into the LLM prompt."""
-    period = full_data_context.get("period")
-    signals = full_data_context.get("signals", {})
-    mantic_summary = full_data_context.get("mantic_summary", {})
-    provenance = {
-        "data_source": full_data_context.get("data_source"),
-        "data_source_note": full_data_context.get("data_source_note"),
-    }
+    """Build the strict-mode LLM context directly from the known-safe fields.
 
-    base: dict[str, Any] = {
+    Lets callers skip assembling the full (PHI-bearing) data_context when the
+    privacy mode is strict. This is also the base for the other modes.
+    """
+    provenance = {"data_source": data_source, "data_source_note": data_source_note}
+    return {
         "period": period,
         "signals": _round_floats(signals, ndigits=4),
         "mantic": mantic_summary,
         "provenance": {k: v for k, v in provenance.items() if v},
     }
 
-    if privacy_mode == "strict":
-        # No raw vitals/labs/activity; no raw Mantic outputs.
-        return base
-
-    if privacy_mode == "standard":
-        # Include a small set of user-friendly metrics (still not raw lab panels).
-        base.update(
-            {
-                "resting_heart_rate_bpm": full_data_context.get("resting_heart_rate"),
-                "blood_pressure": {
-                    "systolic_avg": full_data_context.get("blood_pressure_systolic"),
-                    "diastolic_avg": full_data_context.get("blood_pressure_diastolic"),
-                },
-                "hrv_ms": full_data_context.get("hrv_ms"),
-                "sleep_duration_hours": full_data_context.get("sleep_duration_hours"),
-                "exercise_sessions_per_week": full_data_context.get("exercise_sessions_per_week"),
-                "bmi": full_data_context.get("bmi"),
-                "lab_count": full_data_context.get("lab_count"),
-            }
-        )
-        return _round_floats(base, ndigits=2)
-
-    # explicit
+
+def _strict_llm_context(
+    full_data_context: dict[str, Any], include_mantic_raw: bool
+) -> dict[str, Any]:
+    # No raw vitals/labs/activity; no raw Mantic outputs.
+    return build_strict_llm_data_context(
+        period=full_data_context.get("period"),
+        signals=full_data_context.get("signals", {}),
+        mantic_summary=full_data_context.get("mantic_summary", {}),
+        data_source=full_data_context.get("data_source"),
+        data_source_note=full_data_context.get("data_source_note"),
+    )
+
+
+def _standard_llm_context(
+    full_data_context: dict[str, Any], include_mantic_raw: bool
+) -> dict[str, Any]:
+    # Include a small set of user-friendly metrics (still not raw lab panels).
+    base = _strict_llm_context(full_data_context, include_mantic_raw)
+    get = full_data_context.get
+    for dst, src in _STANDARD_METRICS:
+        base[dst] = get(src) if type(src) is str else {k: get(s) for k, s in src}
+    return _round_floats(base, ndigits=2)
+
+
+def _explicit_llm_context(
+    full_data_context: dict[str, Any], include_mantic_raw: bool
+) -> dict[str, Any]:
     # Allow essentially everything the tool computed, with optional raw Mantic outputs.
     explicit_ctx = dict(full_data_context)
     if not include_mantic_raw:
         explicit_ctx.pop("mantic_raw", None)
     return explicit_ctx
+
+
+_MODE_BUILDERS = {
+    "strict": _strict_llm_context,
+    "standard": _standard_llm_context,
+    "explicit": _explicit_llm_context,
+}
+
+
+def build_llm_data_context(
+    *,
+    full_data_context: dict[str, Any],
+    privacy_mode: PrivacyMode,
+    include_mantic_raw: bool,
+) -> dict[str, Any]:
+    """Build the minimized data_context that will be rendered into the LLM prompt."""
+    # Unrecognized modes have always been treated as explicit; callers validate
+    # privacy_mode before getting here.
+    builder = _MODE_BUILDERS.get(privacy_mode, _explicit_llm_context)
+    return builder(full_data_context, include_mantic_raw)
@@ -14,6 +14,16 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_SCAFFOLD_ID = "personal_health_signal"
 
+# Mantic routing for personal_health_signal, indexed by
+# (emergence_window << 1) | at_risk. Each entry lists scaffold ids to try in
+# order; growth wins over risk, and a missing scaffold falls through.
+_MANTIC_ROUTES: tuple[tuple[str, ...], ...] = (
+    (),
+    ("personal_health_signal.risk",),
+    ("personal_health_signal.growth",),
+    ("personal_health_signal.growth", "personal_health_signal.risk"),
+)
+
 
 class ScaffoldNotFoundError(Exception):
     """Raised when no scaffold can be selected for a request."""
@@ -44,18 +54,15 @@ class ScaffoldEngine:
         if tool_context and tool_name == "personal_health_signal" and not caller_scaffold_id:
             ms = tool_context.get("mantic_summary") if isinstance(tool_context, dict) else None
             if isinstance(ms, dict):
-                if ms.get("emergence_window") is True:
-                    growth = self.registry.get("personal_health_signal.growth")
-                    if growth:
-                        return growth
                 coherence = ms.get("coherence")
-                friction_level = ms.get("friction_level")
-                if friction_level == "high" or (
+                at_risk = ms.get("friction_level") == "high" or (
                     isinstance(coherence, (int, float)) and coherence < 0.6
-                ):
-                    risk = self.registry.get("personal_health_signal.risk")
-                    if risk:
-                        return risk
+                )
+                route = _MANTIC_ROUTES[((ms.get("emergence_window") is True) << 1) | at_risk]
+                for scaffold_id in route:
+                    routed = self.registry.get(scaffold_id)
+                    if routed:
+                        return routed
 
         scaffold = match_scaffold(
             registry=self.registry,
@@ -180,7 +180,13 @@ class HealthDatabase:
             self._conn = sqlite3.connect(":memory:")
 
         self._conn.row_factory = sqlite3.Row
-        self._conn.execute("PRAGMA journal_mode=WAL")
+        if self._db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        else:
+            # Nothing to make durable in memory; skip journal/sync bookkeeping.
+            self._conn.execute("PRAGMA journal_mode=MEMORY")
+            self._conn.execute("PRAGMA synchronous=OFF")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
         self._conn.execute("PRAGMA foreign_keys=ON")
 
         self._ensure_schema()
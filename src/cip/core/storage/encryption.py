@@ -13,8 +13,17 @@ from typing import Any
 
 from cryptography.fernet import Fernet, InvalidToken
 
+try:  # Optional speedup: `pip install cip-health[speedups]`
+    import rfernet
+except ImportError:  # pragma: no cover - exercised only without rfernet
+    rfernet = None
+
 logger = logging.getLogger(__name__)
 
+_INVALID_TOKEN_ERRORS: tuple[type[Exception], ...] = (
+    (InvalidToken, rfernet.DecryptionError) if rfernet is not None else (InvalidToken,)
+)
+
 
 class EncryptionError(Exception):
     """Raised when encryption/decryption fails."""
@@ -47,6 +56,12 @@ class FieldEncryptor:
         except (ValueError, Exception) as exc:
             raise EncryptionError(f"Invalid encryption key: {exc}") from exc
 
+        # rfernet reads and writes the same tokens; the key was validated above.
+        self._rfernet = None
+        if rfernet is not None:
+            self._rfernet = rfernet.Fernet(key if isinstance(key, str) else key.decode())
+        self._backend = "rfernet" if self._rfernet is not None else "cryptography"
+
     def encrypt(self, data: Any) -> str:
         """Encrypt a JSON-serializable value to a Fernet token string.
 
@@ -63,6 +78,8 @@ class FieldEncryptor:
             return ""
         try:
             plaintext = json.dumps(data, separators=(",", ":")).encode("utf-8")
+            if self._rfernet is not None:
+                return self._rfernet.encrypt(plaintext)
             return self._fernet.encrypt(plaintext).decode("utf-8")
         except Exception as exc:
             raise EncryptionError(f"Encryption failed: {exc}") from exc
@@ -82,9 +99,12 @@ class FieldEncryptor:
         if not token:
             return None
         try:
-            plaintext = self._fernet.decrypt(token.encode("utf-8"))
+            if self._rfernet is not None:
+                plaintext = self._rfernet.decrypt(token)
+            else:
+                plaintext = self._fernet.decrypt(token.encode("utf-8"))
             return json.loads(plaintext)
-        except InvalidToken as exc:
+        except _INVALID_TOKEN_ERRORS as exc:
             raise EncryptionError("Decryption failed: invalid token or wrong key") from exc
         except Exception as exc:
             raise EncryptionError(f"Decryption failed: {exc}") from exc
@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthSnapshot:
     """A single point-in-time health data collection and analysis result.
 
@@ -54,7 +54,7 @@ class HealthSnapshot:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class StoredLabResult:
     """A denormalized lab result for time-series queries."""
 
@@ -68,7 +68,7 @@ class StoredLabResult:
     created_at: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class StoredVitalReading:
     """A denormalized vital sign reading for time-series queries."""
 
@@ -80,7 +80,7 @@ class StoredVitalReading:
     created_at: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DataSource:
     """Connector state tracking."""
 
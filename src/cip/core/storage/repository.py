@@ -9,6 +9,7 @@ from __future__ import annotations
 import json
 import logging
 import uuid
+from collections.abc import Iterable
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -23,6 +24,28 @@ from cip.core.storage.models import (
 
 logger = logging.getLogger(__name__)
 
+# Computed signal columns on health_snapshots, in LAYER_NAMES order.
+_SIGNAL_COLUMNS = (
+    "vital_stability",
+    "metabolic_balance",
+    "activity_recovery",
+    "preventive_readiness",
+)
+_VALID_SIGNALS = frozenset(_SIGNAL_COLUMNS)
+
+_UPSERT_DATA_SOURCE_SQL = """INSERT INTO data_sources
+   (id, source_type, display_name, connected_at, last_sync, config_enc, is_active)
+   VALUES (?, ?, ?, ?, ?, ?, ?)
+   ON CONFLICT(source_type) DO UPDATE SET
+       display_name = excluded.display_name,
+       last_sync = excluded.last_sync,
+       config_enc = excluded.config_enc,
+       is_active = excluded.is_active"""
+
+_SNAPSHOT_STATS_SQL = """SELECT COUNT(*), MIN(timestamp), MAX(timestamp),
+       (SELECT source FROM health_snapshots ORDER BY timestamp DESC LIMIT 1)
+   FROM health_snapshots"""
+
 
 class RepositoryError(Exception):
     """Raised when repository operations fail."""
@@ -45,6 +68,17 @@ class HealthRepository:
     def __init__(self, database: HealthDatabase, encryptor: FieldEncryptor) -> None:
         self._db = database
         self._enc = encryptor
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every committed snapshot write or deletion.
+
+        Lets callers cache results derived from stored snapshots and tell
+        when they have gone stale. Only writes made through this repository
+        instance are counted.
+        """
+        return self._version
 
     @staticmethod
     def _new_id() -> str:
@@ -68,6 +102,33 @@ class HealthRepository:
         Returns:
             The snapshot ID.
         """
+        sid = self._insert_snapshot(snapshot)
+        self._db.connection.commit()
+        self._version += 1
+        logger.info("Saved snapshot %s (source=%s, period=%s)", sid, snapshot.source, snapshot.period)
+        return sid
+
+    def save_snapshots(self, snapshots: Iterable[HealthSnapshot]) -> list[str]:
+        """Persist several snapshots in one transaction.
+
+        Either every snapshot is stored or, if any insert fails, none are.
+
+        Returns:
+            The snapshot IDs in input order.
+        """
+        conn = self._db.connection
+        try:
+            ids = [self._insert_snapshot(snapshot) for snapshot in snapshots]
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        self._version += 1
+        logger.info("Saved %d snapshots", len(ids))
+        return ids
+
+    def _insert_snapshot(self, snapshot: HealthSnapshot) -> str:
+        """Insert a snapshot and its denormalized rows without committing."""
         conn = self._db.connection
         sid = snapshot.id or self._new_id()
         now = snapshot.created_at or self._now_iso()
@@ -107,11 +168,11 @@ class HealthRepository:
 
         # Denormalize lab results
         if snapshot.labs_data:
-            for lab in snapshot.labs_data:
-                conn.execute(
-                    """INSERT INTO lab_results
-                       (id, snapshot_id, test_name, value, unit, status, test_date)
-                       VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            conn.executemany(
+                """INSERT INTO lab_results
+                   (id, snapshot_id, test_name, value, unit, status, test_date)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                [
                     (
                         self._new_id(),
                         sid,
@@ -120,15 +181,15 @@ class HealthRepository:
                         lab.get("unit", ""),
                         lab.get("status", ""),
                         lab.get("date", lab.get("test_date", "")),
-                    ),
-                )
+                    )
+                    for lab in snapshot.labs_data
+                ],
+            )
 
         # Denormalize key vital readings
         if snapshot.vitals_data:
             self._denormalize_vitals(sid, snapshot.vitals_data, snapshot.timestamp)
 
-        conn.commit()
-        logger.info("Saved snapshot %s (source=%s, period=%s)", sid, snapshot.source, snapshot.period)
         return sid
 
     def _denormalize_vitals(
@@ -157,13 +218,15 @@ class HealthRepository:
         if isinstance(spo2, dict) and spo2.get("avg_pct") is not None:
             mappings.append(("spo2_pct", spo2["avg_pct"]))
 
-        for metric, value in mappings:
-            conn.execute(
-                """INSERT INTO vital_readings
-                   (id, snapshot_id, metric, value, reading_date)
-                   VALUES (?, ?, ?, ?, ?)""",
-                (self._new_id(), snapshot_id, metric, value, reading_date),
-            )
+        conn.executemany(
+            """INSERT INTO vital_readings
+               (id, snapshot_id, metric, value, reading_date)
+               VALUES (?, ?, ?, ?, ?)""",
+            [
+                (self._new_id(), snapshot_id, metric, value, reading_date)
+                for metric, value in mappings
+            ],
+        )
 
     def get_snapshot(self, snapshot_id: str) -> HealthSnapshot | None:
         """Retrieve a snapshot by ID, decrypting raw data fields.
@@ -234,6 +297,24 @@ class HealthRepository:
         row = conn.execute("SELECT COUNT(*) FROM health_snapshots").fetchone()
         return row[0]
 
+    def get_snapshot_stats(self) -> dict[str, Any]:
+        """Return count, time range and latest source of stored snapshots.
+
+        Aggregated in SQL, so no snapshot is loaded or decrypted.
+
+        Returns:
+            Dict with: count, oldest_timestamp, latest_timestamp, latest_source
+            (the timestamps and source are None when no snapshots exist).
+        """
+        conn = self._db.connection
+        row = conn.execute(_SNAPSHOT_STATS_SQL).fetchone()
+        return {
+            "count": row[0],
+            "oldest_timestamp": row[1],
+            "latest_timestamp": row[2],
+            "latest_source": row[3],
+        }
+
     # ------------------------------------------------------------------
     # Signal history (unencrypted, indexed)
     # ------------------------------------------------------------------
@@ -256,15 +337,9 @@ class HealthRepository:
         Returns:
             List of (timestamp, value) tuples, newest first.
         """
-        valid_signals = {
-            "vital_stability",
-            "metabolic_balance",
-            "activity_recovery",
-            "preventive_readiness",
-        }
-        if signal_name not in valid_signals:
+        if signal_name not in _VALID_SIGNALS:
             raise RepositoryError(
-                f"Invalid signal name: {signal_name!r}. Valid: {valid_signals}"
+                f"Invalid signal name: {signal_name!r}. Valid: {', '.join(_SIGNAL_COLUMNS)}"
             )
 
         conditions = [f"{signal_name} IS NOT NULL"]
@@ -282,6 +357,53 @@ class HealthRepository:
         rows = self._db.connection.execute(query, params).fetchall()
         return [(row[0], row[1]) for row in rows]
 
+    def get_signal_histories(
+        self,
+        signal_names: tuple[str, ...] | list[str] = _SIGNAL_COLUMNS,
+        *,
+        since: str | None = None,
+        limit: int = 90,
+    ) -> dict[str, list[tuple[str, float]]]:
+        """Get time-series for several computed signals in one query.
+
+        Equivalent to calling :meth:`get_signal_history` once per signal
+        (each signal gets its own ``limit`` of non-NULL values), but issues a
+        single ``UNION ALL`` statement instead of one round-trip per signal.
+
+        Returns:
+            Dict mapping each signal name to (timestamp, value) tuples, newest first.
+        """
+        for name in signal_names:
+            if name not in _VALID_SIGNALS:
+                raise RepositoryError(
+                    f"Invalid signal name: {name!r}. Valid: {', '.join(_SIGNAL_COLUMNS)}"
+                )
+
+        histories: dict[str, list[tuple[str, float]]] = {name: [] for name in signal_names}
+        if not histories:
+            return histories
+
+        parts: list[str] = []
+        params: list[Any] = []
+        for name in histories:
+            # Column name is safe — validated above against known set
+            where = f"{name} IS NOT NULL"
+            params.append(name)
+            if since:
+                where += " AND timestamp >= ?"
+                params.append(since)
+            params.append(limit)
+            parts.append(
+                f"SELECT * FROM (SELECT ? AS signal, timestamp, {name} AS value "
+                f"FROM health_snapshots WHERE {where} ORDER BY timestamp DESC LIMIT ?)"
+            )
+
+        query = " UNION ALL ".join(parts) + " ORDER BY timestamp DESC"
+        rows = self._db.connection.execute(query, params).fetchall()
+        for row in rows:
+            histories[row[0]].append((row[1], row[2]))
+        return histories
+
     # ------------------------------------------------------------------
     # Lab history (denormalized)
     # ------------------------------------------------------------------
@@ -385,6 +507,7 @@ class HealthRepository:
         conn.execute("DELETE FROM vital_readings WHERE snapshot_id = ?", (snapshot_id,))
         conn.execute("DELETE FROM health_snapshots WHERE id = ?", (snapshot_id,))
         conn.commit()
+        self._version += 1
         logger.info("Deleted snapshot %s", snapshot_id)
         return True
 
@@ -426,6 +549,7 @@ class HealthRepository:
             snapshot_ids,
         )
         conn.commit()
+        self._version += 1
         logger.info("Purged %d snapshots older than %s", len(snapshot_ids), before_timestamp)
         return len(snapshot_ids)
 
@@ -460,6 +584,7 @@ class HealthRepository:
         conn.execute("DELETE FROM health_snapshots")
         conn.execute("DELETE FROM data_sources")
         conn.commit()
+        self._version += 1
         logger.warning("Deleted ALL health data: %d snapshots removed", count)
         return count
 
@@ -469,15 +594,12 @@ class HealthRepository:
 
     def upsert_data_source(self, source: DataSource) -> None:
         """Insert or update a data source record."""
+        self.upsert_data_sources((source,))
+
+    def upsert_data_sources(self, sources: Iterable[DataSource]) -> None:
+        """Insert or update several data source records in one transaction."""
         conn = self._db.connection
-        conn.execute(
-            """INSERT INTO data_sources (id, source_type, display_name, connected_at, last_sync, config_enc, is_active)
-               VALUES (?, ?, ?, ?, ?, ?, ?)
-               ON CONFLICT(source_type) DO UPDATE SET
-                   display_name = excluded.display_name,
-                   last_sync = excluded.last_sync,
-                   config_enc = excluded.config_enc,
-                   is_active = excluded.is_active""",
+        rows = [
             (
                 source.id or self._new_id(),
                 source.source_type,
@@ -486,9 +608,15 @@ class HealthRepository:
                 source.last_sync,
                 source.config_enc,
                 int(source.is_active),
-            ),
-        )
-        conn.commit()
+            )
+            for source in sources
+        ]
+        try:
+            conn.executemany(_UPSERT_DATA_SOURCE_SQL, rows)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
 
     def get_data_sources(self, *, active_only: bool = True) -> list[DataSource]:
         """List registered data sources."""
@@ -25,7 +25,7 @@ import xml.etree.ElementTree as ET
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 logger = logging.getLogger(__name__)
 
@@ -81,7 +81,7 @@ def _period_to_cutoff(period: str) -> datetime:
 
 
 def parse_apple_health_export(
-    export_path: str | Path,
+    export_path: str | Path | BinaryIO,
     period: str = "last_30_days",
 ) -> dict[str, list[dict[str, Any]]]:
     """Parse an Apple Health export.xml and return records grouped by type.
@@ -89,7 +89,8 @@ def parse_apple_health_export(
     Uses iterparse for memory-efficient processing of large exports.
 
     Args:
-        export_path: Path to the Apple Health export.xml file.
+        export_path: Path to the Apple Health export.xml file, or an open
+            binary file object positioned at its start.
         period: Time period filter (e.g., 'last_30_days').
 
     Returns:
@@ -99,9 +100,13 @@ def parse_apple_health_export(
     Raises:
         AppleHealthParseError: If the file cannot be parsed.
     """
-    path = Path(export_path)
-    if not path.exists():
-        raise AppleHealthParseError(f"Export file not found: {path}")
+    if hasattr(export_path, "read"):
+        source: str | BinaryIO = export_path
+    else:
+        path = Path(export_path)
+        if not path.exists():
+            raise AppleHealthParseError(f"Export file not found: {path}")
+        source = str(path)
 
     cutoff = _period_to_cutoff(period)
     records: dict[str, list[dict[str, Any]]] = defaultdict(list)
@@ -109,7 +114,7 @@ def parse_apple_health_export(
     sleep_records: list[dict[str, Any]] = []
 
     try:
-        for event, elem in ET.iterparse(str(path), events=("end",)):
+        for event, elem in ET.iterparse(source, events=("end",)):
             tag = elem.tag
 
             if tag == "Record":
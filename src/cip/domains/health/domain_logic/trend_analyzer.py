@@ -7,13 +7,24 @@ directions), and identifies opportunities from historical data.
 from __future__ import annotations
 
 import logging
+import math
 import statistics
+from collections import OrderedDict
+from itertools import combinations
 from typing import Any
 
 from cip.core.storage.repository import HealthRepository
 
 logger = logging.getLogger(__name__)
 
+_SIGNAL_NAMES = (
+    "vital_stability",
+    "metabolic_balance",
+    "activity_recovery",
+    "preventive_readiness",
+)
+_TREND_CACHE_SIZE = 64
+
 
 class TrendAnalyzer:
     """Computes trends and patterns from stored health signal history.
@@ -27,6 +38,21 @@ class TrendAnalyzer:
 
     def __init__(self, repository: HealthRepository) -> None:
         self._repo = repository
+        # (signal, limit, repository version) -> trend dict. The version bumps
+        # on every snapshot write, so stale entries are never hit. Callers get
+        # shallow copies (the values are scalars), so they can't alter entries.
+        self._trend_cache: OrderedDict[tuple[str, int, int], dict[str, Any]] = OrderedDict()
+
+    def _cached_trend(self, key: tuple[str, int, int]) -> dict[str, Any] | None:
+        trend = self._trend_cache.get(key)
+        if trend is not None:
+            self._trend_cache.move_to_end(key)
+        return trend
+
+    def _store_trend(self, key: tuple[str, int, int], trend: dict[str, Any]) -> None:
+        self._trend_cache[key] = trend
+        if len(self._trend_cache) > _TREND_CACHE_SIZE:
+            self._trend_cache.popitem(last=False)
 
     def compute_signal_trend(
         self,
@@ -46,54 +72,33 @@ class TrendAnalyzer:
             Dict with: current, mean, median, min, max, std_dev, direction,
             volatility, data_points.
         """
-        history = self._repo.get_signal_history(signal_name, limit=limit)
-
-        if not history:
-            return {
-                "signal": signal_name,
-                "data_points": 0,
-                "status": "no_data",
-            }
-
-        values = [v for _, v in history]
-        current = values[0]  # Most recent (history is newest-first)
-        oldest = values[-1]
-
-        # Direction: compare first half vs second half means
-        if len(values) >= 4:
-            mid = len(values) // 2
-            recent_mean = statistics.mean(values[:mid])
-            older_mean = statistics.mean(values[mid:])
-            diff = recent_mean - older_mean
-            if diff > 0.03:
-                direction = "improving"
-            elif diff < -0.03:
-                direction = "declining"
-            else:
-                direction = "stable"
-        elif len(values) >= 2:
-            diff = current - oldest
-            direction = "improving" if diff > 0.03 else ("declining" if diff < -0.03 else "stable")
-        else:
-            direction = "insufficient_data"
-
-        # Volatility: coefficient of variation
-        mean_val = statistics.mean(values)
-        std_val = statistics.stdev(values) if len(values) > 1 else 0.0
-        volatility = std_val / mean_val if mean_val > 0 else 0.0
+        key = (signal_name, limit, self._repo.version)
+        trend = self._cached_trend(key)
+        if trend is None:
+            history = self._repo.get_signal_history(signal_name, limit=limit)
+            trend = _trend_from_history(signal_name, history)
+            self._store_trend(key, trend)
+        return dict(trend)
+
+    def compute_all_signal_trends(
+        self,
+        *,
+        days: int = 90,
+        limit: int = 90,
+    ) -> dict[str, dict[str, Any]]:
+        """Compute trend statistics for all 4 signals from a single history fetch.
 
-        return {
-            "signal": signal_name,
-            "current": round(current, 4),
-            "mean": round(mean_val, 4),
-            "median": round(statistics.median(values), 4),
-            "min": round(min(values), 4),
-            "max": round(max(values), 4),
-            "std_dev": round(std_val, 4),
-            "direction": direction,
-            "volatility": round(volatility, 4),
-            "data_points": len(values),
-        }
+        Same output as calling :meth:`compute_signal_trend` once per signal,
+        keyed by signal name, but reads the repository only once.
+        """
+        version = self._repo.version
+        trends = {name: self._cached_trend((name, limit, version)) for name in _SIGNAL_NAMES}
+        if any(trend is None for trend in trends.values()):
+            histories = self._repo.get_signal_histories(_SIGNAL_NAMES, limit=limit)
+            for name, history in histories.items():
+                trends[name] = _trend_from_history(name, history)
+                self._store_trend((name, limit, version), trends[name])
+        return {name: dict(trend) for name, trend in trends.items()}
 
     def compute_lab_trend(
         self,
@@ -159,71 +164,102 @@ class TrendAnalyzer:
         Returns:
             List of divergence dicts with signal_a, signal_b, and description.
         """
-        signal_names = [
-            "vital_stability",
-            "metabolic_balance",
-            "activity_recovery",
-            "preventive_readiness",
-        ]
-
-        trends = {}
-        for name in signal_names:
-            trend = self.compute_signal_trend(name, days=days)
-            if trend.get("data_points", 0) >= 2:
-                trends[name] = trend
+        trends = {
+            name: trend
+            for name, trend in self.compute_all_signal_trends(days=days).items()
+            if trend.get("data_points", 0) >= 2
+        }
 
         divergences = []
-        checked = set()
-
-        for a_name, a_trend in trends.items():
-            for b_name, b_trend in trends.items():
-                if a_name == b_name:
-                    continue
-                pair = tuple(sorted([a_name, b_name]))
-                if pair in checked:
-                    continue
-                checked.add(pair)
-
-                a_dir = a_trend["direction"]
-                b_dir = b_trend["direction"]
-
-                if (a_dir == "improving" and b_dir == "declining") or \
-                   (a_dir == "declining" and b_dir == "improving"):
-                    improving = a_name if a_dir == "improving" else b_name
-                    declining = a_name if a_dir == "declining" else b_name
-                    divergences.append({
-                        "improving_signal": improving,
-                        "declining_signal": declining,
-                        "improving_current": trends[improving]["current"],
-                        "declining_current": trends[declining]["current"],
-                        "description": (
-                            f"{_display(improving)} is improving while "
-                            f"{_display(declining)} is declining — "
-                            f"this divergence may deserve attention."
-                        ),
-                    })
+
+        for (a_name, a_trend), (b_name, b_trend) in combinations(trends.items(), 2):
+            a_dir = a_trend["direction"]
+            b_dir = b_trend["direction"]
+
+            if (a_dir == "improving" and b_dir == "declining") or \
+               (a_dir == "declining" and b_dir == "improving"):
+                improving = a_name if a_dir == "improving" else b_name
+                declining = a_name if a_dir == "declining" else b_name
+                divergences.append({
+                    "improving_signal": improving,
+                    "declining_signal": declining,
+                    "improving_current": trends[improving]["current"],
+                    "declining_current": trends[declining]["current"],
+                    "description": (
+                        f"{_display(improving)} is improving while "
+                        f"{_display(declining)} is declining — "
+                        f"this divergence may deserve attention."
+                    ),
+                })
 
         return divergences
 
     def get_snapshot_summary(self) -> dict[str, Any]:
         """Get a summary of stored data for longitudinal context."""
-        count = self._repo.count_snapshots()
-        if count == 0:
+        stats = self._repo.get_snapshot_stats()
+        if stats["count"] == 0:
             return {"snapshots_available": 0, "status": "no_history"}
 
-        latest = self._repo.get_latest_snapshot()
-        oldest_list = self._repo.get_snapshots(limit=1)  # Will be the newest
-        # Get actual oldest by getting all and taking last
-        all_snaps = self._repo.get_snapshots(limit=count)
-        oldest = all_snaps[-1] if all_snaps else latest
+        return {
+            "snapshots_available": stats["count"],
+            "latest_timestamp": stats["latest_timestamp"],
+            "oldest_timestamp": stats["oldest_timestamp"],
+            "latest_source": stats["latest_source"],
+        }
+
 
+def _trend_from_history(
+    signal_name: str, history: list[tuple[str, float]]
+) -> dict[str, Any]:
+    """Compute trend statistics from a newest-first (timestamp, value) history."""
+    if not history:
         return {
-            "snapshots_available": count,
-            "latest_timestamp": latest.timestamp if latest else None,
-            "oldest_timestamp": oldest.timestamp if oldest else None,
-            "latest_source": latest.source if latest else None,
+            "signal": signal_name,
+            "data_points": 0,
+            "status": "no_data",
         }
 
+    values = [v for _, v in history]
+    n = len(values)
+    current = values[0]  # Most recent (history is newest-first)
+    oldest = values[-1]
+
+    # Direction: compare first half vs second half means
+    if n >= 4:
+        mid = n // 2
+        diff = statistics.fmean(values[:mid]) - statistics.fmean(values[mid:])
+        if diff > 0.03:
+            direction = "improving"
+        elif diff < -0.03:
+            direction = "declining"
+        else:
+            direction = "stable"
+    elif n >= 2:
+        diff = current - oldest
+        direction = "improving" if diff > 0.03 else ("declining" if diff < -0.03 else "stable")
+    else:
+        direction = "insufficient_data"
+
+    # Plain float arithmetic: statistics.mean/stdev go through exact
+    # Fractions, which is far slower and buys nothing at 4-decimal rounding.
+    mean_val = statistics.fmean(values)
+    std_val = math.sqrt(sum((v - mean_val) ** 2 for v in values) / (n - 1)) if n > 1 else 0.0
+    # Volatility: coefficient of variation
+    volatility = std_val / mean_val if mean_val > 0 else 0.0
+
+    return {
+        "signal": signal_name,
+        "current": round(current, 4),
+        "mean": round(mean_val, 4),
+        "median": round(statistics.median(values), 4),
+        "min": round(min(values), 4),
+        "max": round(max(values), 4),
+        "std_dev": round(std_val, 4),
+        "direction": direction,
+        "volatility": round(volatility, 4),
+        "data_points": n,
+    }
+
 
 def _display(signal_name: str) -> str:
     """Convert signal_name to display form."""
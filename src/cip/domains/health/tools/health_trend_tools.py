@@ -62,16 +62,8 @@ def register_health_trend_tools(
                 ),
             })
 
-        # Compute trends for all 4 signals
-        signal_names = [
-            "vital_stability",
-            "metabolic_balance",
-            "activity_recovery",
-            "preventive_readiness",
-        ]
-        signal_trends = {}
-        for name in signal_names:
-            signal_trends[name] = trend_analyzer.compute_signal_trend(name, days=days)
+        # Compute trends for all 4 signals (single history fetch)
+        signal_trends = trend_analyzer.compute_all_signal_trends(days=days)
 
         # Detect divergence patterns
         divergences = trend_analyzer.detect_divergence_patterns(days=days)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import time
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
 from fastmcp import Context, FastMCP
@@ -17,7 +18,13 @@ if TYPE_CHECKING:
     from cip.core.storage.repository import HealthRepository
     from cip.domains.health.connectors import HealthDataProvider
 
-from cip.core.privacy.policy import PrivacyMode, build_llm_data_context
+from cip.core.mantic.models import decode_json
+from cip.core.privacy.policy import (
+    PrivacyMode,
+    build_llm_data_context,
+    build_strict_llm_data_context,
+)
+from cip.core.storage.models import HealthSnapshot
 from cip.domains.health.domain_logic.signal_models import (
     LAYER_NAMES,
     PROFILE_NAME,
@@ -25,9 +32,14 @@ from cip.domains.health.domain_logic.signal_models import (
 from cip.domains.health.domain_logic.signal_translator import (
     translate_health_to_mantic,
 )
+from cip.domains.health.domain_logic.trend_analyzer import TrendAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# Immutable layer order and per-layer rounding digits for the signal snapshot.
+_LAYER_NAMES_TUPLE = tuple(LAYER_NAMES)
+_SIGNAL_ROUND_DIGITS = (4,) * len(LAYER_NAMES)
+
 
 # ---------------------------------------------------------------------------
 # Validation helpers
@@ -53,6 +65,22 @@ def _friction_level_from_score(m_score: float | None) -> str:
     return "high"
 
 
+def _extrema_indices(values: list[float]) -> tuple[int, int]:
+    """Return ``(argmin, argmax)`` of a non-empty list in a single pass.
+
+    Ties resolve to the first occurrence, matching ``min``/``max``/``list.index``.
+    """
+    lo_i = hi_i = 0
+    lo = hi = values[0]
+    for i in range(1, len(values)):
+        v = values[i]
+        if v < lo:
+            lo, lo_i = v, i
+        elif v > hi:
+            hi, hi_i = v, i
+    return lo_i, hi_i
+
+
 def _compute_exports(
     *, signals: dict[str, float], mantic_summary: dict[str, Any]
 ) -> dict[str, Any]:
@@ -60,8 +88,10 @@ def _compute_exports(
     if not signals:
         return {}
 
-    strongest = max(signals.items(), key=lambda kv: kv[1])[0]
-    weakest = min(signals.items(), key=lambda kv: kv[1])[0]
+    names = list(signals)
+    lo_i, hi_i = _extrema_indices(list(signals.values()))
+    strongest = names[hi_i]
+    weakest = names[lo_i]
 
     risk = ""
     opportunity = ""
@@ -108,7 +138,7 @@ def _detect_escalation_triggers(
     layer_values: list[float],
     vitals_data: dict[str, Any],
     signal_details: dict[str, Any] | None = None,
-) -> list[str]:
+) -> tuple[list[str], dict[str, float | None]]:
     """Return escalation trigger identifiers derived from raw data/signals.
 
     ``signal_details`` is the ``HealthSignals.details`` dict produced by the
@@ -116,12 +146,16 @@ def _detect_escalation_triggers(
     rather than real measurements, its sub-dict contains a ``"fallback"`` key.
     We only fire the all-signals-low trigger when every signal is backed by
     *real* data — not when data is simply absent.
+
+    Also returns the parsed blood pressure readings (``systolic``/``diastolic``)
+    so the escalation renderer does not have to walk ``vitals_data`` again.
     """
     triggers: list[str] = []
 
     # Trigger: all four signals are very low (system-wide risk)
     # Guard: skip if any signal used a fallback value (missing data ≠ danger).
-    if len(layer_values) == 4 and all(isinstance(v, (int, float)) and v < 0.3 for v in layer_values):
+    # Layer values come from translate_health_to_mantic, so they are always floats.
+    if len(layer_values) == 4 and next((v for v in layer_values if v >= 0.3), None) is None:
         has_fallback = False
         if signal_details:
             for layer_name in LAYER_NAMES:
@@ -133,73 +167,85 @@ def _detect_escalation_triggers(
             triggers.append("all_signals_below_0.3")
 
     # Trigger: very high systolic BP reading (vitals safety guardrail)
-    systolic = _safe_float(
-        (vitals_data.get("blood_pressure") or {}).get("systolic_avg")
-        if isinstance(vitals_data, dict)
-        else None
-    )
+    bp = (vitals_data.get("blood_pressure") or {}) if isinstance(vitals_data, dict) else {}
+    parsed = {
+        "systolic": _safe_float(bp.get("systolic_avg")),
+        "diastolic": _safe_float(bp.get("diastolic_avg")),
+    }
+    systolic = parsed["systolic"]
     if systolic is not None and systolic > 180:
         triggers.append("systolic_over_180")
 
-    return triggers
+    return triggers, parsed
+
+
+# Static parts of the escalation response, assembled once at import.
+_ESCALATION_PREFIX = "\n".join([
+    "Safety escalation: please seek professional help",
+    "",
+    "This tool detected one or more safety triggers in your health signals/vitals. "
+    "This is not a diagnosis, but it is a strong reason to contact a qualified healthcare "
+    "professional promptly.",
+    "",
+    "Detected triggers:",
+])
+_ESCALATION_GUIDANCE = "\n".join([
+    "",
+    "What to do now:",
+    "1. If you have severe symptoms (e.g., chest pain, trouble breathing, fainting, "
+    "confusion), call local emergency services immediately.",
+    "2. Otherwise, contact your healthcare provider or an urgent care clinic promptly "
+    "to review these readings.",
+    "3. If you can, re-check the measurement(s) under calm conditions (rest ~5 minutes, "
+    "correct cuff fit/position) and share repeated readings with a clinician.",
+])
+_ESCALATION_SUFFIX = "\n".join([
+    "",
+    "---",
+    "Disclaimers:",
+    "- This is a personal health assessment, not medical advice. Consult a qualified "
+    "healthcare provider for medical recommendations.",
+])
 
 
 def _render_escalation_response(
-    *, triggers: list[str], vitals_data: dict[str, Any], signals: dict[str, float]
+    *,
+    triggers: list[str],
+    parsed: dict[str, float | None],
+    signals: dict[str, float],
 ) -> str:
-    """Build a deterministic escalation response (no LLM)."""
-    lines: list[str] = []
-    lines.append("Safety escalation: please seek professional help")
-    lines.append("")
-    lines.append(
-        "This tool detected one or more safety triggers in your health signals/vitals. "
-        "This is not a diagnosis, but it is a strong reason to contact a qualified healthcare "
-        "professional promptly."
-    )
+    """Build a deterministic escalation response (no LLM).
 
-    systolic = _safe_float((vitals_data.get("blood_pressure") or {}).get("systolic_avg"))
-    diastolic = _safe_float((vitals_data.get("blood_pressure") or {}).get("diastolic_avg"))
+    ``parsed`` is the blood pressure dict returned by ``_detect_escalation_triggers``.
+    """
+    systolic = parsed.get("systolic")
 
-    lines.append("")
-    lines.append("Detected triggers:")
+    trigger_lines: list[str] = []
     for t in triggers:
         if t == "systolic_over_180":
             extra = f" (systolic_avg={systolic:g} mmHg)" if systolic is not None else ""
-            lines.append(f"- Very high systolic blood pressure (> 180 mmHg){extra}")
+            trigger_lines.append(f"- Very high systolic blood pressure (> 180 mmHg){extra}")
         elif t == "all_signals_below_0.3":
-            lines.append("- All four computed health signals are very low (< 0.3)")
+            trigger_lines.append("- All four computed health signals are very low (< 0.3)")
         else:
-            lines.append(f"- {t}")
-
-    lines.append("")
-    lines.append("What to do now:")
-    lines.append(
-        "1. If you have severe symptoms (e.g., chest pain, trouble breathing, fainting, confusion), "
-        "call local emergency services immediately."
-    )
-    lines.append(
-        "2. Otherwise, contact your healthcare provider or an urgent care clinic promptly to review these readings."
-    )
-    lines.append(
-        "3. If you can, re-check the measurement(s) under calm conditions (rest ~5 minutes, correct cuff fit/position) "
-        "and share repeated readings with a clinician."
-    )
+            trigger_lines.append(f"- {t}")
 
     # Include the four signals (these are already consumer-friendly abstractions).
+    signal_lines: list[str] = []
     if signals:
-        lines.append("")
-        lines.append("Current signal snapshot (0-1):")
+        signal_lines.append("")
+        signal_lines.append("Current signal snapshot (0-1):")
         for name in LAYER_NAMES:
             if name in signals:
-                lines.append(f"- {name}: {signals[name]:.4f}")
+                signal_lines.append(f"- {name}: {signals[name]:.4f}")
 
-    lines.append("")
-    lines.append("---")
-    lines.append("Disclaimers:")
-    lines.append(
-        "- This is a personal health assessment, not medical advice. Consult a qualified healthcare provider for medical recommendations."
-    )
-    return "\n".join(lines)
+    return "\n".join([
+        _ESCALATION_PREFIX,
+        *trigger_lines,
+        _ESCALATION_GUIDANCE,
+        *signal_lines,
+        _ESCALATION_SUFFIX,
+    ])
 
 
 def _local_mantic_summary_from_signals(layer_values: list[float]) -> dict[str, Any]:
@@ -214,9 +260,9 @@ def _local_mantic_summary_from_signals(layer_values: list[float]) -> dict[str, A
             "note": "mantic_unavailable",
         }
 
-    lo = min(layer_values)
-    hi = max(layer_values)
-    signal_range = hi - lo
+    lo_i, hi_i = _extrema_indices(layer_values)
+    lo = layer_values[lo_i]
+    signal_range = layer_values[hi_i] - lo
     coherence = max(0.0, min(1.0, 1.0 - signal_range))
 
     # Divergence severity is driven by spread; keep thresholds coarse.
@@ -229,11 +275,10 @@ def _local_mantic_summary_from_signals(layer_values: list[float]) -> dict[str, A
 
     limiting_factor = None
     if len(layer_values) == len(LAYER_NAMES):
-        limiting_factor = LAYER_NAMES[layer_values.index(lo)]
+        limiting_factor = LAYER_NAMES[lo_i]
 
-    emergence_window = bool(
-        coherence >= 0.7 and all(v >= _DETECTION_THRESHOLD_FALLBACK for v in layer_values)
-    )
+    # Every layer clears the detection threshold iff the minimum does.
+    emergence_window = bool(coherence >= 0.7 and lo >= _DETECTION_THRESHOLD_FALLBACK)
 
     return {
         "friction_level": friction_level,
@@ -253,6 +298,13 @@ _SIGNAL_CORE_TO_HEALTH_LAYER: dict[str, str] = {
     "meta": "preventive_readiness",
 }
 
+# Health-order indices for each profile whose layer order differs from ours.
+# health order: [vital, metabolic, activity, preventive]
+# signal_core:  [micro, meso, macro, meta] -> [vital, activity, metabolic, preventive]
+_PROFILE_PERMUTATIONS: dict[str, tuple[int, ...]] = {
+    _SIGNAL_CORE_PROFILE: (0, 2, 1, 3),
+}
+
 
 def _extract_profile_names(resp: dict[str, Any]) -> set[str]:
     """Extract profile names from list_domain_profiles output (supports multiple shapes)."""
@@ -269,11 +321,9 @@ def _extract_profile_names(resp: dict[str, Any]) -> set[str]:
 
 def _mantic_layer_values_for_profile(profile_name: str, layer_values: list[float]) -> list[float]:
     """Reorder layer values to match the target Mantic profile's layer order."""
-    if profile_name == _SIGNAL_CORE_PROFILE:
-        # health order: [vital, metabolic, activity, preventive]
-        # signal_core:  [micro, meso, macro, meta] -> [vital, activity, metabolic, preventive]
-        if len(layer_values) == 4:
-            return [layer_values[0], layer_values[2], layer_values[1], layer_values[3]]
+    perm = _PROFILE_PERMUTATIONS.get(profile_name)
+    if perm is not None and len(layer_values) == len(perm):
+        return [layer_values[i] for i in perm]
     return layer_values
 
 
@@ -286,6 +336,51 @@ def _map_mantic_factor(profile_name: str, factor: str | None) -> str | None:
     return factor
 
 
+def _make_snapshot(
+    *,
+    source: str,
+    period: str,
+    vitals_data: dict[str, Any],
+    lab_results: list[dict[str, Any]],
+    activity_data: dict[str, Any],
+    preventive_care: dict[str, Any],
+    biometrics: dict[str, Any],
+    layer_values: list[float],
+    provenance: dict[str, Any],
+    friction_result: dict[str, Any] | None = None,
+    emergence_result: dict[str, Any] | None = None,
+) -> HealthSnapshot:
+    """Build a HealthSnapshot for persistence.
+
+    Mantic fields are only filled when detection results are provided (the
+    escalation path skips Mantic entirely).
+    """
+    snapshot = HealthSnapshot(
+        id="",  # auto-generated UUID
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        source=source,
+        period=period,
+        vitals_data=vitals_data,
+        labs_data=lab_results,
+        activity_data=activity_data,
+        preventive_data=preventive_care,
+        biometrics_data=biometrics,
+        vital_stability=layer_values[0],
+        metabolic_balance=layer_values[1],
+        activity_recovery=layer_values[2],
+        preventive_readiness=layer_values[3],
+        provenance=provenance,
+    )
+    if friction_result is not None:
+        snapshot.friction_m_score = friction_result.get("m_score")
+        snapshot.friction_detected = friction_result.get("alert") is not None
+    if emergence_result is not None:
+        snapshot.emergence_m_score = emergence_result.get("m_score")
+        snapshot.emergence_detected = emergence_result.get("window_detected", False)
+        snapshot.emergence_window_type = emergence_result.get("window_type")
+    return snapshot
+
+
 def register_personal_health_signal_tools(
     mcp: FastMCP,
     engine: ScaffoldEngine,
@@ -317,6 +412,31 @@ def register_personal_health_signal_tools(
             _mantic_profiles_cache = set()
         return _mantic_profiles_cache
 
+    # One analyzer per registration so its trend cache outlives a single call.
+    trend_analyzer = TrendAnalyzer(repository) if repository is not None else None
+
+    # In-process snapshot count hint: avoids a COUNT(*) on every tool call.
+    # Valid for the repository version it was read at; any other write or
+    # delete through the repository (manual entry, deletion, retention purge)
+    # bumps the version and forces a re-read.
+    _snapshot_count_hint: int | None = None
+    _snapshot_count_version = -1
+
+    def _get_snapshot_count() -> int:
+        nonlocal _snapshot_count_hint, _snapshot_count_version
+        if _snapshot_count_hint is None or _snapshot_count_version != repository.version:
+            _snapshot_count_version = repository.version
+            _snapshot_count_hint = repository.count_snapshots()
+        return _snapshot_count_hint
+
+    def _note_snapshot_saved() -> None:
+        # Our own save_snapshot() bumps the version by exactly one; if nothing
+        # else wrote in between, keep the hint current instead of re-reading.
+        nonlocal _snapshot_count_hint, _snapshot_count_version
+        if _snapshot_count_hint is not None and _snapshot_count_version == repository.version - 1:
+            _snapshot_count_hint += 1
+            _snapshot_count_version = repository.version
+
     @mcp.tool
     async def personal_health_signal(
         ctx: Context,
@@ -369,6 +489,7 @@ def register_personal_health_signal_tools(
             activity_data = await health_data_provider.get_activity_data(period)
             preventive_care = await health_data_provider.get_preventive_care()
             biometrics = await health_data_provider.get_biometrics()
+            provenance = health_data_provider.get_provenance()
 
             # -----------------------------------------------------------
             # 2. Translate to Mantic signals (deterministic, no LLM)
@@ -385,49 +506,41 @@ def register_personal_health_signal_tools(
             # -----------------------------------------------------------
             # 3. Deterministic safety escalation (before any LLM call)
             # -----------------------------------------------------------
-            escalation_triggers = _detect_escalation_triggers(
+            escalation_triggers, parsed_vitals = _detect_escalation_triggers(
                 layer_values=layer_values,
                 vitals_data=vitals_data,
                 signal_details=signals.details,
             )
 
             # Precompute deterministic signal snapshot for both LLM and deterministic responses.
-            signal_snapshot = {
-                name: round(value, 4) for name, value in zip(LAYER_NAMES, layer_values)
-            }
+            signal_snapshot = dict(
+                zip(_LAYER_NAMES_TUPLE, map(round, layer_values, _SIGNAL_ROUND_DIGITS))
+            )
 
             if escalation_triggers:
                 # Skip Mantic + LLM; return deterministic escalation guidance.
                 content = _render_escalation_response(
                     triggers=escalation_triggers,
-                    vitals_data=vitals_data,
+                    parsed=parsed_vitals,
                     signals=signal_snapshot,
                 )
 
                 # Persist snapshot even on escalation (if storage enabled).
                 if repository is not None and effective_store_mode != "none":
                     try:
-                        from datetime import datetime, timezone
-
-                        from cip.core.storage.models import HealthSnapshot
-
-                        snapshot = HealthSnapshot(
-                            id="",  # auto-generated UUID
-                            timestamp=datetime.now(timezone.utc).isoformat(),
+                        snapshot = _make_snapshot(
                             source=health_data_provider.data_source,
                             period=period,
                             vitals_data=vitals_data,
-                            labs_data=lab_results,
+                            lab_results=lab_results,
                             activity_data=activity_data,
-                            preventive_data=preventive_care,
-                            biometrics_data=biometrics,
-                            vital_stability=layer_values[0],
-                            metabolic_balance=layer_values[1],
-                            activity_recovery=layer_values[2],
-                            preventive_readiness=layer_values[3],
-                            provenance=health_data_provider.get_provenance(),
+                            preventive_care=preventive_care,
+                            biometrics=biometrics,
+                            layer_values=layer_values,
+                            provenance=provenance,
                         )
                         snapshot_id = repository.save_snapshot(snapshot)
+                        _note_snapshot_saved()
                         logger.info("Persisted health snapshot %s (escalation)", snapshot_id)
                     except Exception:
                         logger.exception("Failed to persist health snapshot — continuing")
@@ -483,17 +596,8 @@ def register_personal_health_signal_tools(
                 # -----------------------------------------------------------
                 # 4b. Build structured Mantic summary
                 # -----------------------------------------------------------
-                coupling_data = friction_result.get("layer_coupling")
-                # layer_coupling can be either:
-                #   - dict  {"coherence": 0.78}           (cip-mantic-core ≥ 1.0)
-                #   - list  [{"pair": [...], "delta": …}] (legacy / future)
-                if isinstance(coupling_data, dict):
-                    coherence_val = coupling_data.get("coherence")
-                elif isinstance(coupling_data, list) and coupling_data:
-                    first = coupling_data[0]
-                    coherence_val = first.get("coherence") if isinstance(first, dict) else None
-                else:
-                    coherence_val = None
+                # ManticMCPClient normalizes layer_coupling to {"coherence": ...}.
+                coherence_val = (friction_result.get("layer_coupling") or {}).get("coherence")
 
                 limiting = _map_mantic_factor(
                     mantic_profile_used, emergence_result.get("limiting_factor")
@@ -515,76 +619,89 @@ def register_personal_health_signal_tools(
                 mantic_profile_used = "unavailable"
                 mantic_profile_fallback = False
 
-            # -----------------------------------------------------------
-            # 5. Build full data_context
-            # -----------------------------------------------------------
-            data_context: dict[str, Any] = {
-                "period": period,
-                "resting_heart_rate": vitals_data.get("resting_heart_rate", {}).get("current_bpm"),
-                "blood_pressure_systolic": vitals_data.get("blood_pressure", {}).get("systolic_avg"),
-                "blood_pressure_diastolic": vitals_data.get("blood_pressure", {}).get("diastolic_avg"),
-                "hrv_ms": vitals_data.get("hrv", {}).get("avg_ms"),
-                "exercise_sessions_per_week": activity_data.get("exercise", {}).get(
-                    "sessions_per_week"
-                ),
-                "sleep_duration_hours": activity_data.get("sleep", {}).get("avg_duration_hours"),
-                "bmi": biometrics.get("bmi"),
-                "lab_count": len(lab_results),
-                "signals": signal_snapshot,
-                "signal_details": signals.details,
-                "mantic_summary": mantic_summary,
-                "mantic_raw": {"friction": friction_result, "emergence": emergence_result},
-                "mantic_profile": mantic_profile_used,
-                "mantic_profile_fallback": mantic_profile_fallback,
-                "friction": {
-                    "m_score": friction_result.get("m_score"),
-                    "detected": friction_result.get("alert") is not None,
-                    "layer_attribution": friction_result.get("layer_attribution"),
-                    "layer_coupling": friction_result.get("layer_coupling"),
-                    "layer_visibility": friction_result.get("layer_visibility"),
-                },
-                "emergence": {
-                    "m_score": emergence_result.get("m_score"),
-                    "detected": emergence_result.get("window_detected", False),
-                    "window_type": emergence_result.get("window_type"),
-                    "alignment_floor": emergence_result.get("alignment_floor"),
-                    "layer_attribution": emergence_result.get("layer_attribution"),
-                    "layer_coupling": emergence_result.get("layer_coupling"),
-                },
-                **health_data_provider.get_provenance(),
-            }
-
-            # Deterministic context exports (for cross-domain sharing)
-            data_context.update(
-                _compute_exports(signals=data_context["signals"], mantic_summary=mantic_summary)
-            )
+            # Strict mode only exposes signals, the Mantic summary and provenance
+            # to the LLM, so skip assembling the PHI-bearing full context (and the
+            # historical trends, which strict filtering would drop anyway).
+            data_context: dict[str, Any] | None = None
+            if effective_privacy_mode != "strict":
+                # -----------------------------------------------------------
+                # 5. Build full data_context
+                # -----------------------------------------------------------
+                rhr = vitals_data.get("resting_heart_rate") or {}
+                bp = vitals_data.get("blood_pressure") or {}
+                hrv = vitals_data.get("hrv") or {}
+                exercise = activity_data.get("exercise") or {}
+                sleep = activity_data.get("sleep") or {}
+                data_context = {
+                    "period": period,
+                    "resting_heart_rate": rhr.get("current_bpm"),
+                    "blood_pressure_systolic": bp.get("systolic_avg"),
+                    "blood_pressure_diastolic": bp.get("diastolic_avg"),
+                    "hrv_ms": hrv.get("avg_ms"),
+                    "exercise_sessions_per_week": exercise.get("sessions_per_week"),
+                    "sleep_duration_hours": sleep.get("avg_duration_hours"),
+                    "bmi": biometrics.get("bmi"),
+                    "lab_count": len(lab_results),
+                    "signals": signal_snapshot,
+                    "signal_details": signals.details,
+                    "mantic_summary": mantic_summary,
+                }
+                # Raw Mantic output and the detail blocks only survive the
+                # privacy filter in explicit mode (raw only when opted in).
+                if effective_privacy_mode == "explicit" and include_mantic_raw:
+                    data_context["mantic_raw"] = {
+                        "friction": friction_result,
+                        "emergence": emergence_result,
+                    }
+                data_context["mantic_profile"] = mantic_profile_used
+                data_context["mantic_profile_fallback"] = mantic_profile_fallback
+                if effective_privacy_mode == "explicit":
+                    data_context["friction"] = {
+                        "m_score": friction_result.get("m_score"),
+                        "detected": friction_result.get("alert") is not None,
+                        "layer_attribution": friction_result.get("layer_attribution"),
+                        "layer_coupling": friction_result.get("layer_coupling"),
+                        "layer_visibility": friction_result.get("layer_visibility"),
+                    }
+                    data_context["emergence"] = {
+                        "m_score": emergence_result.get("m_score"),
+                        "detected": emergence_result.get("window_detected", False),
+                        "window_type": emergence_result.get("window_type"),
+                        "alignment_floor": emergence_result.get("alignment_floor"),
+                        "layer_attribution": emergence_result.get("layer_attribution"),
+                        "layer_coupling": emergence_result.get("layer_coupling"),
+                    }
+                data_context.update(provenance)
+
+                # Deterministic context exports (for cross-domain sharing)
+                if signal_snapshot:
+                    data_context.update(
+                        _compute_exports(signals=signal_snapshot, mantic_summary=mantic_summary)
+                    )
 
-            # -----------------------------------------------------------
-            # 5b. Inject historical context (if snapshots exist)
-            # -----------------------------------------------------------
-            if repository is not None:
-                try:
-                    snapshot_count = repository.count_snapshots()
-                    if snapshot_count > 1:
-                        from cip.domains.health.domain_logic.trend_analyzer import TrendAnalyzer
-
-                        trend_analyzer = TrendAnalyzer(repository)
-                        signal_trends = {}
-                        for sname in LAYER_NAMES:
-                            signal_trends[sname] = trend_analyzer.compute_signal_trend(sname)
-                        divergences = trend_analyzer.detect_divergence_patterns()
-
-                        data_context["historical"] = {
-                            "snapshots_available": snapshot_count,
-                            "signal_trends": signal_trends,
-                            "divergence_patterns": divergences,
-                        }
-                        logger.info(
-                            "Injected historical context: %d snapshots, %d divergences",
-                            snapshot_count, len(divergences),
+                # -----------------------------------------------------------
+                # 5b. Inject historical context (if snapshots exist)
+                # -----------------------------------------------------------
+                if trend_analyzer is not None:
+                    try:
+                        snapshot_count = _get_snapshot_count()
+                        if snapshot_count > 1:
+                            signal_trends = trend_analyzer.compute_all_signal_trends()
+                            divergences = trend_analyzer.detect_divergence_patterns()
+
+                            data_context["historical"] = {
+                                "snapshots_available": snapshot_count,
+                                "signal_trends": signal_trends,
+                                "divergence_patterns": divergences,
+                            }
+                            logger.info(
+                                "Injected historical context: %d snapshots, %d divergences",
+                                snapshot_count, len(divergences),
+                            )
+                    except Exception:
+                        logger.exception(
+                            "Failed to compute historical context — continuing without it"
                         )
-                except Exception:
-                    logger.exception("Failed to compute historical context — continuing without it")
 
             # -----------------------------------------------------------
             # 6. Select scaffold -> privacy filter -> apply -> invoke LLM
@@ -600,18 +717,27 @@ def register_personal_health_signal_tools(
             xd_context = None
             if cross_domain_context:
                 try:
-                    xd_context = json.loads(cross_domain_context)
+                    xd_context = decode_json(cross_domain_context)
                 except (json.JSONDecodeError, TypeError):
                     logger.warning(
                         "Invalid cross_domain_context JSON, ignoring input"
                     )
 
             # Apply privacy filter
-            llm_data_context = build_llm_data_context(
-                full_data_context=data_context,
-                privacy_mode=effective_privacy_mode,
-                include_mantic_raw=include_mantic_raw,
-            )
+            if data_context is None:
+                llm_data_context = build_strict_llm_data_context(
+                    period=period,
+                    signals=signal_snapshot,
+                    mantic_summary=mantic_summary,
+                    data_source=provenance.get("data_source"),
+                    data_source_note=provenance.get("data_source_note"),
+                )
+            else:
+                llm_data_context = build_llm_data_context(
+                    full_data_context=data_context,
+                    privacy_mode=effective_privacy_mode,
+                    include_mantic_raw=include_mantic_raw,
+                )
 
             assembled = engine.apply(
                 scaffold=scaffold,
@@ -639,32 +765,21 @@ def register_personal_health_signal_tools(
             # -----------------------------------------------------------
             if repository is not None and effective_store_mode != "none":
                 try:
-                    from datetime import datetime, timezone
-
-                    from cip.core.storage.models import HealthSnapshot
-
-                    snapshot = HealthSnapshot(
-                        id="",  # auto-generated UUID
-                        timestamp=datetime.now(timezone.utc).isoformat(),
+                    snapshot = _make_snapshot(
                         source=health_data_provider.data_source,
                         period=period,
                         vitals_data=vitals_data,
-                        labs_data=lab_results,
+                        lab_results=lab_results,
                         activity_data=activity_data,
-                        preventive_data=preventive_care,
-                        biometrics_data=biometrics,
-                        vital_stability=layer_values[0],
-                        metabolic_balance=layer_values[1],
-                        activity_recovery=layer_values[2],
-                        preventive_readiness=layer_values[3],
-                        friction_m_score=friction_result.get("m_score"),
-                        friction_detected=friction_result.get("alert") is not None,
-                        emergence_m_score=emergence_result.get("m_score"),
-                        emergence_detected=emergence_result.get("window_detected", False),
-                        emergence_window_type=emergence_result.get("window_type"),
-                        provenance=health_data_provider.get_provenance(),
+                        preventive_care=preventive_care,
+                        biometrics=biometrics,
+                        layer_values=layer_values,
+                        provenance=provenance,
+                        friction_result=friction_result,
+                        emergence_result=emergence_result,
                     )
                     snapshot_id = repository.save_snapshot(snapshot)
+                    _note_snapshot_saved()
                     logger.info("Persisted health snapshot %s", snapshot_id)
                 except Exception:
                     logger.exception("Failed to persist health snapshot — continuing")
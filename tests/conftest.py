@@ -3,38 +3,79 @@
 from __future__ import annotations
 
 import json
-import sys
-from dataclasses import dataclass
-from pathlib import Path
+import os
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, replace
+from types import MappingProxyType
 from typing import Any
 
 import pytest
 
+from cip.core.scaffold.engine import ScaffoldEngine
+from cip.core.scaffold.models import (
+    Scaffold,
+    ScaffoldApplicability,
+    ScaffoldFraming,
+    ScaffoldGuardrails,
+    ScaffoldOutputCalibration,
+)
+from cip.core.scaffold.registry import ScaffoldRegistry
+
 # ---------------------------------------------------------------------------
 # Test hermeticity
 # ---------------------------------------------------------------------------
 
-@pytest.fixture(autouse=True)
-def _force_hermetic_test_env(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("LLM_PROVIDER", "mock")
-    monkeypatch.setenv("ANTHROPIC_API_KEY", "")
-    monkeypatch.setenv("OPENAI_API_KEY", "")
+_HERMETIC_ENV = {
+    "LLM_PROVIDER": "mock",
+    "ANTHROPIC_API_KEY": "",
+    "OPENAI_API_KEY": "",
+}
 
-# Allow running tests without `pip install -e .` by making `src/` importable.
-_PROJECT_ROOT = Path(__file__).resolve().parent.parent
-_SRC_DIR = _PROJECT_ROOT / "src"
-if str(_SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(_SRC_DIR))
 
-from cip.core.scaffold.engine import ScaffoldEngine  # noqa: E402
-from cip.core.scaffold.models import (  # noqa: E402
-    Scaffold,
-    ScaffoldApplicability,
-    ScaffoldFraming,
-    ScaffoldGuardrails,
-    ScaffoldOutputCalibration,
+def pytest_configure(config: pytest.Config) -> None:
+    # Constant for the whole run, so set once instead of monkeypatching per test.
+    # Assigned (not setdefault) so a developer's real API keys never leak in.
+    os.environ.update(_HERMETIC_ENV)
+
+
+# Built once at import; make_test_scaffold() only swaps the per-scaffold fields.
+# Nested sections (framing, guardrails, ...) are shared between copies, so
+# treat returned scaffolds as read-only.
+_BASE_SCAFFOLD = Scaffold(
+    id="test_scaffold",
+    version="1.0.0",
+    domain="personal_health",
+    display_name="Test: test_scaffold",
+    description="Test scaffold test_scaffold",
+    applicability=ScaffoldApplicability(
+        tools=["default_tool"],
+        keywords=["default"],
+        intent_signals=[],
+    ),
+    framing=ScaffoldFraming(
+        role="Test analyst",
+        perspective="Test perspective",
+        tone="neutral",
+        tone_variants={"formal": "Very formal", "casual": "Very casual"},
+    ),
+    reasoning_framework={"steps": ["Analyze data", "Draw conclusions"]},
+    domain_knowledge_activation=["General health knowledge"],
+    output_calibration=ScaffoldOutputCalibration(
+        format="structured_narrative",
+        format_options=["structured_narrative", "bullet_points"],
+        max_length_guidance="200-400 words",
+        must_include=["health summary"],
+        never_include=["medical diagnoses"],
+    ),
+    guardrails=ScaffoldGuardrails(
+        disclaimers=["Not medical advice."],
+        escalation_triggers=["emergency"],
+        prohibited_actions=["diagnose conditions"],
+    ),
+    context_accepts=[],
+    context_exports=[],
+    tags=["test"],
 )
-from cip.core.scaffold.registry import ScaffoldRegistry  # noqa: E402
 
 
 def make_test_scaffold(
@@ -43,46 +84,23 @@ def make_test_scaffold(
     keywords: list[str] | None = None,
 ) -> Scaffold:
     """Create a test scaffold with sensible defaults."""
-    return Scaffold(
+    base = _BASE_SCAFFOLD
+    return replace(
+        base,
         id=id,
-        version="1.0.0",
-        domain="personal_health",
         display_name=f"Test: {id}",
         description=f"Test scaffold {id}",
-        applicability=ScaffoldApplicability(
-            tools=tools or ["default_tool"],
-            keywords=keywords or ["default"],
-            intent_signals=[],
-        ),
-        framing=ScaffoldFraming(
-            role="Test analyst",
-            perspective="Test perspective",
-            tone="neutral",
-            tone_variants={"formal": "Very formal", "casual": "Very casual"},
+        applicability=replace(
+            base.applicability,
+            tools=tools or base.applicability.tools,
+            keywords=keywords or base.applicability.keywords,
         ),
-        reasoning_framework={"steps": ["Analyze data", "Draw conclusions"]},
-        domain_knowledge_activation=["General health knowledge"],
-        output_calibration=ScaffoldOutputCalibration(
-            format="structured_narrative",
-            format_options=["structured_narrative", "bullet_points"],
-            max_length_guidance="200-400 words",
-            must_include=["health summary"],
-            never_include=["medical diagnoses"],
-        ),
-        guardrails=ScaffoldGuardrails(
-            disclaimers=["Not medical advice."],
-            escalation_triggers=["emergency"],
-            prohibited_actions=["diagnose conditions"],
-        ),
-        context_accepts=[],
-        context_exports=[],
-        tags=["test"],
     )
 
 
-@pytest.fixture
-def registry() -> ScaffoldRegistry:
-    """Create a registry with test scaffolds (neutral + risk + growth)."""
+@pytest.fixture(scope="session")
+def registry() -> Iterator[ScaffoldRegistry]:
+    """Registry with test scaffolds (neutral + risk + growth), shared read-only."""
     reg = ScaffoldRegistry()
     reg.register(make_test_scaffold(
         id="personal_health_signal",
@@ -99,12 +117,14 @@ def registry() -> ScaffoldRegistry:
         tools=["personal_health_signal"],
         keywords=["health", "growth"],
     ))
-    return reg
+    registered = [s.id for s in reg.all()]
+    yield reg
+    assert [s.id for s in reg.all()] == registered, "shared test registry was mutated"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def engine(registry: ScaffoldRegistry) -> ScaffoldEngine:
-    """Create a scaffold engine with test registry."""
+    """Scaffold engine over the shared test registry (stateless, so session-scoped)."""
     return ScaffoldEngine(registry)
 
 
@@ -112,8 +132,18 @@ def engine(registry: ScaffoldRegistry) -> ScaffoldEngine:
 # Mock Mantic MCP client
 # ---------------------------------------------------------------------------
 
-# Sample envelopes matching cip-mantic-core response format
-_FRICTION_ENVELOPE: dict[str, Any] = {
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Sample envelopes matching cip-mantic-core response format. Frozen so the
+# shared module-level copies can be aliased without defensive copying.
+_FRICTION_ENVELOPE: Mapping[str, Any] = _freeze({
     "status": "ok",
     "contract_version": "1.0.0",
     "domain_profile": {"domain_name": "consumer_health", "version": "1.0.0"},
@@ -137,9 +167,9 @@ _FRICTION_ENVELOPE: dict[str, Any] = {
         "overrides_applied": {},
     },
     "audit": {"clamped_fields": [], "rejected_fields": []},
-}
+})
 
-_EMERGENCE_ENVELOPE: dict[str, Any] = {
+_EMERGENCE_ENVELOPE: Mapping[str, Any] = _freeze({
     "status": "ok",
     "contract_version": "1.0.0",
     "domain_profile": {"domain_name": "consumer_health", "version": "1.0.0"},
@@ -165,10 +195,10 @@ _EMERGENCE_ENVELOPE: dict[str, Any] = {
         "overrides_applied": {},
     },
     "audit": {"clamped_fields": [], "rejected_fields": []},
-}
+})
 
 
-@dataclass
+@dataclass(frozen=True)
 class _TextBlock:
     """Mimics fastmcp content block structure."""
 
@@ -176,6 +206,26 @@ class _TextBlock:
     text: str
 
 
+def _text_response(payload: Mapping[str, Any]) -> list[_TextBlock]:
+    # default=dict lets json serialize the frozen MappingProxyType envelopes.
+    return [_TextBlock(type="text", text=json.dumps(payload, default=dict))]
+
+
+# Default responses, built once; callers only read the returned block lists.
+_FRICTION_RESPONSE = _text_response(_FRICTION_ENVELOPE)
+_EMERGENCE_RESPONSE = _text_response(_EMERGENCE_ENVELOPE)
+_HEALTH_RESPONSE = _text_response({"status": "ok", "profiles_loaded": 1})
+_PROFILES_RESPONSE = _text_response({"profiles": ["consumer_health"]})
+
+# Tool name -> response for a MockMCPClient built with the default envelopes.
+_DEFAULT_RESPONSES: dict[str, list[_TextBlock]] = {
+    "mantic_detect_friction": _FRICTION_RESPONSE,
+    "mantic_detect_emergence": _EMERGENCE_RESPONSE,
+    "health_check": _HEALTH_RESPONSE,
+    "list_domain_profiles": _PROFILES_RESPONSE,
+}
+
+
 class MockMCPClient:
     """Mock fastmcp.Client that returns canned Mantic envelopes.
 
@@ -188,23 +238,24 @@ class MockMCPClient:
         friction_envelope: dict[str, Any] | None = None,
         emergence_envelope: dict[str, Any] | None = None,
     ) -> None:
-        self._friction = friction_envelope or _FRICTION_ENVELOPE
-        self._emergence = emergence_envelope or _EMERGENCE_ENVELOPE
+        # Responses are constant per instance: share the default table, and only
+        # build a private one when a custom envelope is supplied.
+        self._responses = _DEFAULT_RESPONSES
+        if friction_envelope or emergence_envelope:
+            self._responses = dict(_DEFAULT_RESPONSES)
+            if friction_envelope:
+                self._responses["mantic_detect_friction"] = _text_response(friction_envelope)
+            if emergence_envelope:
+                self._responses["mantic_detect_emergence"] = _text_response(emergence_envelope)
         self.calls: list[tuple[str, dict[str, Any]]] = []
 
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> list[Any]:
+        # Async only to match fastmcp.Client; the body never awaits.
         self.calls.append((tool_name, arguments))
-        if tool_name == "mantic_detect_friction":
-            payload = self._friction
-        elif tool_name == "mantic_detect_emergence":
-            payload = self._emergence
-        elif tool_name == "health_check":
-            payload = {"status": "ok", "profiles_loaded": 1}
-        elif tool_name == "list_domain_profiles":
-            payload = {"profiles": ["consumer_health"]}
-        else:
-            payload = {"error": f"Unknown tool: {tool_name}"}
-        return [_TextBlock(type="text", text=json.dumps(payload))]
+        response = self._responses.get(tool_name)
+        if response is None:
+            return _text_response({"error": f"Unknown tool: {tool_name}"})
+        return response
 
     async def __aenter__(self):
         return self
@@ -213,27 +264,50 @@ class MockMCPClient:
         pass
 
 
-@pytest.fixture
-def mock_mcp_client() -> MockMCPClient:
-    """Create a MockMCPClient with default envelopes."""
+@pytest.fixture(scope="session")
+def _session_mock_mcp_client() -> MockMCPClient:
+    """One MockMCPClient with default envelopes for the whole session."""
     return MockMCPClient()
 
 
 @pytest.fixture
-def mock_mantic_client(mock_mcp_client: MockMCPClient):
+def mock_mcp_client(_session_mock_mcp_client: MockMCPClient) -> MockMCPClient:
+    """The shared MockMCPClient, with its recorded calls cleared for this test."""
+    _session_mock_mcp_client.calls.clear()
+    return _session_mock_mcp_client
+
+
+@pytest.fixture(scope="session")
+def mock_mantic_client(_session_mock_mcp_client: MockMCPClient):
     """Create a ManticMCPClient backed by MockMCPClient."""
     from cip.core.mantic.client import ManticMCPClient
 
-    return ManticMCPClient(mock_mcp_client)
+    return ManticMCPClient(_session_mock_mcp_client)
+
+
+@pytest.fixture(scope="session")
+def mock_mantic_app(mock_mantic_client):
+    """FastMCP app wired to the mock Mantic client, built once per session.
+
+    ``pytest_configure`` has already applied the hermetic env, so the settings
+    ``create_app`` reads are the test ones.
+    """
+    from cip.core.server.app import create_app
+
+    return create_app(mantic_client_override=mock_mantic_client)
 
 
 # ---------------------------------------------------------------------------
 # In-memory storage fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
-def health_db():
-    """Create an in-memory HealthDatabase for testing."""
+# Child tables first so foreign keys are satisfied while clearing.
+_DATA_TABLES = ("lab_results", "vital_readings", "health_snapshots", "data_sources", "audit_log")
+
+
+@pytest.fixture(scope="session")
+def _session_health_db():
+    """One schema-initialized in-memory HealthDatabase for the whole session."""
     from cip.core.storage.database import HealthDatabase
 
     db = HealthDatabase(":memory:")
@@ -243,8 +317,24 @@ def health_db():
 
 
 @pytest.fixture
+def health_db(_session_health_db):
+    """In-memory HealthDatabase that is empty at the start of every test.
+
+    The schema is created once per session. Code under test commits its own
+    writes, so isolation comes from clearing the data tables afterwards
+    rather than from rolling back a wrapping transaction.
+    """
+    yield _session_health_db
+    conn = _session_health_db.connection
+    conn.rollback()
+    for table in _DATA_TABLES:
+        conn.execute(f"DELETE FROM {table}")
+    conn.commit()
+
+
+@pytest.fixture(scope="session")
 def field_encryptor():
-    """Create a FieldEncryptor with a test key."""
+    """FieldEncryptor with one test key for the whole session (it holds no other state)."""
     from cryptography.fernet import Fernet
 
     from cip.core.storage.encryption import FieldEncryptor
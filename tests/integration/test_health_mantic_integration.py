@@ -8,10 +8,10 @@ No running cip-mantic-core server required.
 from __future__ import annotations
 
 import asyncio
+import atexit
 
 import pytest
 
-from cip.core.mantic.client import ManticMCPClient
 from cip.domains.health.connectors.mock_data import (
     get_mock_activity_data,
     get_mock_biometrics,
@@ -27,104 +27,87 @@ from cip.domains.health.domain_logic.signal_translator import (
     translate_health_to_mantic,
 )
 
+# One runner (and event loop) for the whole module, closed at exit.
+_RUNNER = asyncio.Runner()
+atexit.register(_RUNNER.close)
+
 
 def _run(coro):
     """Run an async coroutine synchronously (no pytest-asyncio required)."""
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+    return _RUNNER.run(coro)
+
+
+@pytest.fixture(scope="session")
+def mock_signals():
+    """Mock-data signals and layer values, translated once per session."""
+    signals = translate_health_to_mantic(
+        get_mock_vitals_data(), get_mock_lab_results(),
+        get_mock_activity_data(), get_mock_preventive_care(),
+        get_mock_biometrics(),
+    )
+    return signals, signals.as_layer_values()
 
 
 class TestSignalTranslationDeterminism:
-    def test_same_inputs_same_signals(self):
+    def test_same_inputs_same_signals(self, mock_signals):
+        # Fresh translation compared against the session-cached one.
         a = translate_health_to_mantic(
             get_mock_vitals_data(), get_mock_lab_results(),
             get_mock_activity_data(), get_mock_preventive_care(),
             get_mock_biometrics(),
         ).as_layer_values()
-        b = translate_health_to_mantic(
-            get_mock_vitals_data(), get_mock_lab_results(),
-            get_mock_activity_data(), get_mock_preventive_care(),
-            get_mock_biometrics(),
-        ).as_layer_values()
+        _, b = mock_signals
         assert a == b
 
-    def test_signal_values_in_expected_range(self):
-        values = translate_health_to_mantic(
-            get_mock_vitals_data(), get_mock_lab_results(),
-            get_mock_activity_data(), get_mock_preventive_care(),
-            get_mock_biometrics(),
-        ).as_layer_values()
+    def test_signal_values_in_expected_range(self, mock_signals):
+        _, values = mock_signals
         for v in values:
             assert 0.0 <= v <= 1.0, f"Signal value {v} out of [0, 1] range"
 
 
-class TestManticMCPDetection:
-    """Test Mantic detection via MCP client (mock transport)."""
+@pytest.fixture(scope="class")
+def friction_envelope(mock_mantic_client, mock_signals):
+    """One friction round-trip shared by the envelope checks."""
+    return _run(mock_mantic_client.detect_friction(
+        profile_name=PROFILE_NAME,
+        layer_values=mock_signals[1],
+    ))
 
-    def _signals(self):
-        return translate_health_to_mantic(
-            get_mock_vitals_data(), get_mock_lab_results(),
-            get_mock_activity_data(), get_mock_preventive_care(),
-            get_mock_biometrics(),
-        ).as_layer_values()
 
-    def test_friction_via_mcp_returns_envelope(self, mock_mantic_client):
-        vals = self._signals()
-        envelope = _run(mock_mantic_client.detect_friction(
-            profile_name=PROFILE_NAME,
-            layer_values=vals,
-        ))
-        assert envelope["status"] == "ok"
-        assert "result" in envelope
-        result = envelope["result"]
-        assert "m_score" in result
-        assert "layer_attribution" in result
+@pytest.fixture(scope="class")
+def emergence_envelope(mock_mantic_client, mock_signals):
+    """One emergence round-trip shared by the envelope checks."""
+    return _run(mock_mantic_client.detect_emergence(
+        profile_name=PROFILE_NAME,
+        layer_values=mock_signals[1],
+    ))
 
-    def test_emergence_via_mcp_returns_envelope(self, mock_mantic_client):
-        vals = self._signals()
-        envelope = _run(mock_mantic_client.detect_emergence(
-            profile_name=PROFILE_NAME,
-            layer_values=vals,
-        ))
-        assert envelope["status"] == "ok"
-        assert "result" in envelope
-        result = envelope["result"]
-        assert "m_score" in result
-        assert "window_detected" in result
-        assert "alignment_floor" in result
 
-    def test_friction_result_has_expected_keys(self, mock_mantic_client):
-        envelope = _run(mock_mantic_client.detect_friction(
-            profile_name=PROFILE_NAME,
-            layer_values=self._signals(),
-        ))
-        result = envelope["result"]
-        for key in ("m_score", "alert", "layer_attribution", "layer_coupling"):
-            assert key in result, f"Missing key in friction result: {key}"
+class TestManticMCPDetection:
+    """Test Mantic detection via MCP client (mock transport)."""
 
-    def test_emergence_result_has_expected_keys(self, mock_mantic_client):
-        envelope = _run(mock_mantic_client.detect_emergence(
-            profile_name=PROFILE_NAME,
-            layer_values=self._signals(),
-        ))
+    @pytest.mark.parametrize(
+        ("envelope_fixture", "required"),
+        [
+            ("friction_envelope", ("m_score", "alert", "layer_attribution", "layer_coupling")),
+            ("emergence_envelope", ("m_score", "window_detected", "alignment_floor",
+                                    "layer_attribution")),
+        ],
+    )
+    def test_via_mcp_returns_envelope(self, request, envelope_fixture, required):
+        envelope = request.getfixturevalue(envelope_fixture)
+        assert envelope["status"] == "ok"
+        assert "result" in envelope
         result = envelope["result"]
-        for key in ("m_score", "window_detected", "alignment_floor", "layer_attribution"):
-            assert key in result, f"Missing key in emergence result: {key}"
+        for key in required:
+            assert key in result, f"Missing key in {envelope_fixture}: {key}"
 
 
 class TestFullFlowE2E:
     """Full pipeline: mock data → translation → MCP Mantic detection → envelope."""
 
-    def test_full_flow_data_to_output(self, mock_mantic_client):
-        signals = translate_health_to_mantic(
-            get_mock_vitals_data(), get_mock_lab_results(),
-            get_mock_activity_data(), get_mock_preventive_care(),
-            get_mock_biometrics(),
-        )
-        vals = signals.as_layer_values()
+    def test_full_flow_data_to_output(self, mock_mantic_client, mock_signals):
+        _, vals = mock_signals
 
         friction = _run(mock_mantic_client.detect_friction(
             profile_name=PROFILE_NAME,
@@ -140,14 +123,12 @@ class TestFullFlowE2E:
         assert 0.0 <= friction["result"]["m_score"] <= 1.0
         assert 0.0 <= emergence["result"]["m_score"] <= 1.0
 
-    def test_mcp_client_records_correct_tool_calls(self, mock_mcp_client):
+    def test_mcp_client_records_correct_tool_calls(
+        self, mock_mcp_client, mock_mantic_client, mock_signals,
+    ):
         """Verify the MCP client calls the correct cip-mantic-core tools."""
-        client = ManticMCPClient(mock_mcp_client)
-        vals = translate_health_to_mantic(
-            get_mock_vitals_data(), get_mock_lab_results(),
-            get_mock_activity_data(), get_mock_preventive_care(),
-            get_mock_biometrics(),
-        ).as_layer_values()
+        client = mock_mantic_client
+        _, vals = mock_signals
 
         _run(client.detect_friction(profile_name=PROFILE_NAME, layer_values=vals))
         _run(client.detect_emergence(profile_name=PROFILE_NAME, layer_values=vals))
@@ -156,9 +137,9 @@ class TestFullFlowE2E:
         assert "mantic_detect_friction" in tool_names
         assert "mantic_detect_emergence" in tool_names
 
-    def test_profile_name_passed_to_mantic(self, mock_mcp_client):
+    def test_profile_name_passed_to_mantic(self, mock_mcp_client, mock_mantic_client):
         """Verify profile_name is correctly passed in MCP tool arguments."""
-        client = ManticMCPClient(mock_mcp_client)
+        client = mock_mantic_client
         vals = [0.7, 0.55, 0.65, 0.5]
 
         _run(client.detect_friction(profile_name=PROFILE_NAME, layer_values=vals))
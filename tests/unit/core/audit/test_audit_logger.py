@@ -3,25 +3,19 @@
 from __future__ import annotations
 
 import json
-import time
 
 import pytest
 
-from cip.core.audit.logger import AuditEvent, AuditLogger, _hash_input
-from cip.core.storage.database import HealthDatabase
-
+from cip.core.audit.logger import AuditEvent, AuditLogger, _events_query, _hash_input
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
 @pytest.fixture
-def audit_db():
-    """In-memory database with V2 schema for audit tests."""
-    db = HealthDatabase(":memory:")
-    db.initialize()
-    yield db
-    db.close()
+def audit_db(health_db):
+    """In-memory database with V2 schema for audit tests (shared, cleared per test)."""
+    return health_db
 
 
 @pytest.fixture
@@ -84,6 +78,12 @@ class TestLogEvent:
         )
         assert len(eid) == 36
 
+    def test_log_tool_call_commits_immediately(self, audit_logger, health_db):
+        audit_logger.log_tool_call("personal_health_signal", {"period": "last_30_days"})
+        conn = health_db.connection
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0] == 1
+
     def test_logged_event_retrievable(self, audit_logger):
         audit_logger.log_tool_call(
             tool_name="test_tool",
@@ -122,6 +122,37 @@ class TestLogEvent:
         assert meta["extra_key"] == "extra_val"
 
 
+# ---------------------------------------------------------------------------
+# AuditLogger.log_events (bulk)
+# ---------------------------------------------------------------------------
+
+class TestLogEvents:
+    def test_log_events_returns_ids_in_order(self, audit_logger):
+        ids = audit_logger.log_events([
+            AuditEvent(action="tool_invocation", tool_name="a"),
+            AuditEvent(action="data_delete", tool_name="b"),
+        ])
+        assert len(ids) == 2
+        stored = {e["id"]: e["tool_name"] for e in audit_logger.get_events()}
+        assert stored == {ids[0]: "a", ids[1]: "b"}
+
+    def test_log_events_empty(self, audit_logger):
+        assert audit_logger.log_events([]) == []
+        assert audit_logger.count_events() == 0
+
+    def test_failed_batch_rolls_back(self, audit_logger, health_db):
+        # action is NOT NULL, so the second row fails after the first is inserted.
+        ids = audit_logger.log_events([
+            AuditEvent(action="tool_invocation", tool_name="ok"),
+            AuditEvent(action=None),
+        ])
+        assert ids == []
+        assert not health_db.connection.in_transaction
+
+        audit_logger.log_tool_call("later")
+        assert [e["tool_name"] for e in audit_logger.get_events()] == ["later"]
+
+
 # ---------------------------------------------------------------------------
 # AuditLogger.log_data_delete
 # ---------------------------------------------------------------------------
@@ -169,15 +200,16 @@ class TestGetEvents:
         assert len(events) == 2
 
     def test_limit_respected(self, audit_logger):
-        for i in range(10):
-            audit_logger.log_tool_call(f"tool_{i}")
+        audit_logger.log_events(
+            [AuditEvent(action="tool_invocation", tool_name=f"tool_{i}") for i in range(10)]
+        )
         events = audit_logger.get_events(limit=3)
         assert len(events) == 3
 
-    def test_newest_first(self, audit_logger):
+    def test_newest_first(self, audit_db):
+        clock = iter(["2024-01-01T00:00:00+00:00", "2024-01-01T00:00:01+00:00"])
+        audit_logger = AuditLogger(audit_db, clock=clock.__next__)
         audit_logger.log_tool_call("first")
-        # Tiny sleep to ensure different timestamps
-        time.sleep(0.01)
         audit_logger.log_tool_call("second")
 
         events = audit_logger.get_events()
@@ -186,6 +218,22 @@ class TestGetEvents:
         assert events[0]["tool_name"] == "second"
         assert events[1]["tool_name"] == "first"
 
+    @pytest.mark.parametrize(
+        ("filters", "index"),
+        [
+            ({}, "idx_audit_timestamp"),
+            ({"action": "tool_invocation"}, "idx_audit_action"),
+            ({"tool_name": "alpha"}, "idx_audit_tool"),
+            ({"since": "2024-01-01T00:00:00+00:00"}, "idx_audit_timestamp"),
+        ],
+    )
+    def test_query_uses_index(self, audit_db, filters, index):
+        kwargs = {"action": None, "tool_name": None, "since": None, "limit": 50, **filters}
+        query, params = _events_query(**kwargs)
+        plan = audit_db.connection.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+        details = " ".join(row["detail"] for row in plan)
+        assert index in details
+
 
 # ---------------------------------------------------------------------------
 # AuditLogger.count_events / count_disclosures
@@ -225,10 +273,12 @@ class TestSchemaV2:
         assert cursor.fetchone() is not None
 
     def test_audit_log_indexes_exist(self, audit_db):
-        cursor = audit_db.connection.execute(
-            "SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_audit_%'"
-        )
-        indexes = {row[0] for row in cursor.fetchall()}
+        indexes = {
+            row[0]
+            for row in audit_db.connection.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_audit_%'"
+            )
+        }
         assert "idx_audit_timestamp" in indexes
         assert "idx_audit_action" in indexes
         assert "idx_audit_tool" in indexes
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import json
 from dataclasses import dataclass
 from typing import Any
 
 import pytest
 
+from cip.core.mantic import models
 from cip.core.mantic.client import (
     ManticClientError,
     ManticConnectionError,
@@ -23,34 +25,60 @@ from cip.core.mantic.models import ManticEnvelope
 # Helpers
 # ------------------------------------------------------------------
 
+# One runner (and event loop) for the whole module, closed at exit.
+_RUNNER = asyncio.Runner()
+atexit.register(_RUNNER.close)
+
+
 def _run(coro):
     """Run an async coroutine synchronously (no pytest-asyncio needed)."""
-    return asyncio.get_event_loop().run_until_complete(coro)
+    return _RUNNER.run(coro)
 
 
-@dataclass
+@dataclass(slots=True)
 class _TextBlock:
     """Mimics a fastmcp content block."""
     type: str = "text"
     text: str = ""
 
 
+_DEFAULT_TEXT = json.dumps({"status": "ok"})
+
+
+def _encode(response: dict | str) -> str:
+    return response if isinstance(response, str) else json.dumps(response)
+
+
 class MockMCPClient:
     """Fake fastmcp.Client for testing."""
 
+    __slots__ = ("responses", "_texts", "last_tool", "last_args", "call_count", "_raise_on_call")
+
     def __init__(self, responses: dict[str, Any] | None = None):
         self.responses: dict[str, Any] = responses or {}
+        # Encoded once per response; dicts or pre-encoded JSON strings both work.
+        self._texts: dict[str, str] = {
+            name: _encode(data) for name, data in self.responses.items()
+        }
         self.last_tool: str | None = None
         self.last_args: dict[str, Any] | None = None
         self.call_count = 0
         self._raise_on_call: Exception | None = None
 
-    def set_response(self, tool_name: str, response: dict) -> None:
+    def set_response(self, tool_name: str, response: dict | str) -> None:
         self.responses[tool_name] = response
+        self._texts[tool_name] = _encode(response)
 
     def raise_on_call(self, exc: Exception) -> None:
         self._raise_on_call = exc
 
+    def reset(self) -> None:
+        """Forget recorded calls and any pending error (responses are kept)."""
+        self.last_tool = None
+        self.last_args = None
+        self.call_count = 0
+        self._raise_on_call = None
+
     async def call_tool(self, tool_name: str, arguments: dict) -> list:
         self.last_tool = tool_name
         self.last_args = arguments
@@ -59,8 +87,7 @@ class MockMCPClient:
         if self._raise_on_call:
             raise self._raise_on_call
 
-        data = self.responses.get(tool_name, {"status": "ok"})
-        return [_TextBlock(text=json.dumps(data))]
+        return [_TextBlock(text=self._texts.get(tool_name, _DEFAULT_TEXT))]
 
 
 # ------------------------------------------------------------------
@@ -122,89 +149,123 @@ EMERGENCE_ENVELOPE = {
 }
 
 
+_FRICTION_JSON = json.dumps(FRICTION_ENVELOPE)
+_EMERGENCE_JSON = json.dumps(EMERGENCE_ENVELOPE)
+
+
 def _friction_mock() -> MockMCPClient:
     m = MockMCPClient()
-    m.set_response("mantic_detect_friction", FRICTION_ENVELOPE)
+    m.set_response("mantic_detect_friction", _FRICTION_JSON)
     return m
 
 
 def _emergence_mock() -> MockMCPClient:
     m = MockMCPClient()
-    m.set_response("mantic_detect_emergence", EMERGENCE_ENVELOPE)
+    m.set_response("mantic_detect_emergence", _EMERGENCE_JSON)
     return m
 
 
-# ------------------------------------------------------------------
-# Tests: Friction detection
-# ------------------------------------------------------------------
+# One mock/client pair per class; the function-scoped fixtures reset the
+# mock's recorded call state before each test.
+@pytest.fixture(scope="class")
+def _class_friction_pair() -> tuple[MockMCPClient, ManticMCPClient]:
+    m = _friction_mock()
+    return m, ManticMCPClient(m)
 
-class TestDetectFriction:
-    """Test friction detection calls."""
 
-    def test_calls_correct_tool(self):
-        mock = _friction_mock()
-        client = ManticMCPClient(mock)
-        _run(client.detect_friction("consumer_health", [0.7, 0.6, 0.5, 0.8]))
-        assert mock.last_tool == "mantic_detect_friction"
+@pytest.fixture(scope="class")
+def _class_emergence_pair() -> tuple[MockMCPClient, ManticMCPClient]:
+    m = _emergence_mock()
+    return m, ManticMCPClient(m)
 
-    def test_passes_profile_name(self):
-        mock = _friction_mock()
-        client = ManticMCPClient(mock)
-        _run(client.detect_friction("consumer_health", [0.7, 0.6, 0.5, 0.8]))
-        assert mock.last_args["profile_name"] == "consumer_health"
 
-    def test_passes_layer_values(self):
-        mock = _friction_mock()
-        client = ManticMCPClient(mock)
-        values = [0.7, 0.6, 0.5, 0.8]
-        _run(client.detect_friction("consumer_health", values))
-        assert mock.last_args["layer_values"] == values
+@pytest.fixture
+def friction_pair(_class_friction_pair):
+    _class_friction_pair[0].reset()
+    return _class_friction_pair
 
-    def test_passes_default_f_time(self):
-        mock = _friction_mock()
-        client = ManticMCPClient(mock)
-        _run(client.detect_friction("consumer_health", [0.7, 0.6, 0.5, 0.8]))
-        assert mock.last_args["f_time"] == 1.0
 
-    def test_passes_custom_f_time(self):
-        mock = _friction_mock()
-        client = ManticMCPClient(mock)
-        _run(client.detect_friction("consumer_health", [0.7, 0.6, 0.5, 0.8], f_time=1.5))
-        assert mock.last_args["f_time"] == 1.5
+@pytest.fixture
+def emergence_pair(_class_emergence_pair):
+    _class_emergence_pair[0].reset()
+    return _class_emergence_pair
 
-    def test_omits_threshold_override_when_none(self):
-        mock = _friction_mock()
-        client = ManticMCPClient(mock)
-        _run(client.detect_friction("consumer_health", [0.7, 0.6, 0.5, 0.8]))
-        assert "threshold_override" not in mock.last_args
 
-    def test_passes_threshold_override(self):
-        mock = _friction_mock()
-        client = ManticMCPClient(mock)
-        _run(client.detect_friction(
-            "consumer_health", [0.7, 0.6, 0.5, 0.8], threshold_override=0.5
-        ))
-        assert mock.last_args["threshold_override"] == 0.5
+# ------------------------------------------------------------------
+# Tests: Friction detection
+# ------------------------------------------------------------------
 
-    def test_returns_full_envelope(self):
-        mock = _friction_mock()
-        client = ManticMCPClient(mock)
-        envelope = _run(client.detect_friction("consumer_health", [0.7, 0.6, 0.5, 0.8]))
+_FRICTION_VALUES = [0.7, 0.6, 0.5, 0.8]
+
+
+@pytest.fixture(scope="class")
+def default_friction_call(_class_friction_pair):
+    """(tool name, arguments, envelope) from one detect_friction call with defaults."""
+    mock, client = _class_friction_pair
+    mock.reset()
+    envelope = _run(client.detect_friction("consumer_health", list(_FRICTION_VALUES)))
+    return mock.last_tool, dict(mock.last_args), envelope
+
+
+class TestDetectFriction:
+    """Test friction detection calls."""
+
+    def test_calls_correct_tool(self, default_friction_call):
+        tool, _, _ = default_friction_call
+        assert tool == "mantic_detect_friction"
+
+    @pytest.mark.parametrize(
+        ("arg", "expected"),
+        [
+            ("profile_name", "consumer_health"),
+            ("layer_values", _FRICTION_VALUES),
+            ("f_time", 1.0),
+        ],
+    )
+    def test_passes_default_args(self, default_friction_call, arg, expected):
+        _, args, _ = default_friction_call
+        assert args[arg] == expected
+
+    def test_omits_threshold_override_when_none(self, default_friction_call):
+        _, args, _ = default_friction_call
+        assert "threshold_override" not in args
+
+    @pytest.mark.parametrize(
+        ("kwargs", "arg", "expected"),
+        [
+            ({"f_time": 1.5}, "f_time", 1.5),
+            ({"threshold_override": 0.5}, "threshold_override", 0.5),
+        ],
+    )
+    def test_passes_optional_args(self, friction_pair, kwargs, arg, expected):
+        mock, client = friction_pair
+        _run(client.detect_friction("consumer_health", list(_FRICTION_VALUES), **kwargs))
+        assert mock.last_args[arg] == expected
+
+    def test_returns_full_envelope(self, default_friction_call):
+        _, _, envelope = default_friction_call
         assert envelope["status"] == "ok"
         assert envelope["contract_version"] == "1.0.0"
         assert "result" in envelope
 
-    def test_result_has_m_score(self):
-        mock = _friction_mock()
-        client = ManticMCPClient(mock)
-        envelope = _run(client.detect_friction("consumer_health", [0.7, 0.6, 0.5, 0.8]))
-        assert "m_score" in envelope["result"]
+    @pytest.mark.parametrize("key", ["m_score", "layer_attribution"])
+    def test_result_has_key(self, default_friction_call, key):
+        _, _, envelope = default_friction_call
+        assert key in envelope["result"]
 
-    def test_result_has_layer_attribution(self):
-        mock = _friction_mock()
+    def test_legacy_layer_coupling_list_is_normalized(self):
+        legacy = json.loads(_FRICTION_JSON)
+        pairs = [{"pair": ["vital_stability", "metabolic_balance"], "coherence": 0.61}]
+        legacy["result"]["layer_coupling"] = pairs
+        mock = MockMCPClient()
+        mock.set_response("mantic_detect_friction", legacy)
         client = ManticMCPClient(mock)
         envelope = _run(client.detect_friction("consumer_health", [0.7, 0.6, 0.5, 0.8]))
-        assert "layer_attribution" in envelope["result"]
+        assert envelope["result"]["layer_coupling"] == {"coherence": 0.61, "pairs": pairs}
+
+    def test_modern_layer_coupling_unchanged(self, default_friction_call):
+        _, _, envelope = default_friction_call
+        assert envelope["result"]["layer_coupling"] == {"coherence": 0.78}
 
 
 # ------------------------------------------------------------------
@@ -214,27 +275,23 @@ class TestDetectFriction:
 class TestDetectEmergence:
     """Test emergence detection calls."""
 
-    def test_calls_correct_tool(self):
-        mock = _emergence_mock()
-        client = ManticMCPClient(mock)
+    def test_calls_correct_tool(self, emergence_pair):
+        mock, client = emergence_pair
         _run(client.detect_emergence("consumer_health", [0.7, 0.6, 0.5, 0.8]))
         assert mock.last_tool == "mantic_detect_emergence"
 
-    def test_result_has_window_detected(self):
-        mock = _emergence_mock()
-        client = ManticMCPClient(mock)
+    def test_result_has_window_detected(self, emergence_pair):
+        mock, client = emergence_pair
         envelope = _run(client.detect_emergence("consumer_health", [0.7, 0.6, 0.5, 0.8]))
         assert "window_detected" in envelope["result"]
 
-    def test_result_has_alignment_floor(self):
-        mock = _emergence_mock()
-        client = ManticMCPClient(mock)
+    def test_result_has_alignment_floor(self, emergence_pair):
+        mock, client = emergence_pair
         envelope = _run(client.detect_emergence("consumer_health", [0.7, 0.6, 0.5, 0.8]))
         assert "alignment_floor" in envelope["result"]
 
-    def test_result_has_m_score(self):
-        mock = _emergence_mock()
-        client = ManticMCPClient(mock)
+    def test_result_has_m_score(self, emergence_pair):
+        mock, client = emergence_pair
         envelope = _run(client.detect_emergence("consumer_health", [0.7, 0.6, 0.5, 0.8]))
         assert "m_score" in envelope["result"]
 
@@ -243,6 +300,17 @@ class TestDetectEmergence:
 # Tests: Envelope parsing
 # ------------------------------------------------------------------
 
+# The field-extraction tests only read the envelope, so parse each once.
+@pytest.fixture(scope="module")
+def friction_env() -> ManticEnvelope:
+    return ManticEnvelope.from_dict(FRICTION_ENVELOPE)
+
+
+@pytest.fixture(scope="module")
+def emergence_env() -> ManticEnvelope:
+    return ManticEnvelope.from_dict(EMERGENCE_ENVELOPE)
+
+
 class TestEnvelopeParsing:
     """Test ManticEnvelope model parsing."""
 
@@ -257,27 +325,39 @@ class TestEnvelopeParsing:
         assert env.ok
         assert env.mode == "emergence"
 
-    def test_as_friction_extracts_m_score(self):
-        env = ManticEnvelope.from_dict(FRICTION_ENVELOPE)
-        friction = env.as_friction()
+    def test_as_friction_extracts_m_score(self, friction_env):
+        friction = friction_env.as_friction()
         assert friction.m_score == 0.645
 
-    def test_as_friction_extracts_attribution(self):
-        env = ManticEnvelope.from_dict(FRICTION_ENVELOPE)
-        friction = env.as_friction()
+    def test_as_friction_extracts_attribution(self, friction_env):
+        friction = friction_env.as_friction()
         assert "vital_stability" in friction.layer_attribution
 
-    def test_as_emergence_extracts_window(self):
-        env = ManticEnvelope.from_dict(EMERGENCE_ENVELOPE)
-        emergence = env.as_emergence()
+    def test_as_emergence_extracts_window(self, emergence_env):
+        emergence = emergence_env.as_emergence()
         assert emergence.window_detected is True
         assert emergence.alignment_floor == 0.5
 
-    def test_as_emergence_extracts_limiting_factor(self):
-        env = ManticEnvelope.from_dict(EMERGENCE_ENVELOPE)
-        emergence = env.as_emergence()
+    def test_as_emergence_extracts_limiting_factor(self, emergence_env):
+        emergence = emergence_env.as_emergence()
         assert emergence.limiting_factor == "activity_recovery"
 
+    def test_from_json_matches_from_dict(self):
+        assert ManticEnvelope.from_json(_FRICTION_JSON) == ManticEnvelope.from_dict(
+            FRICTION_ENVELOPE
+        )
+        assert ManticEnvelope.from_json(_EMERGENCE_JSON.encode()) == ManticEnvelope.from_dict(
+            EMERGENCE_ENVELOPE
+        )
+
+    def test_from_json_rejects_non_object(self):
+        with pytest.raises(ValueError, match="JSON object"):
+            ManticEnvelope.from_json("[1, 2]")
+
+    def test_parse_envelope_accepts_text(self):
+        client = ManticMCPClient(MockMCPClient())
+        assert client.parse_envelope(_FRICTION_JSON) == client.parse_envelope(FRICTION_ENVELOPE)
+
     def test_ok_false_on_error(self):
         env = ManticEnvelope.from_dict({"status": "error", "error": "bad"})
         assert not env.ok
@@ -319,13 +399,13 @@ class TestErrorHandling:
             _run(client.detect_friction("consumer_health", [0.5, 0.5, 0.5, 0.5]))
 
     def test_empty_response_raises(self):
-        mock = MockMCPClient()
+        class EmptyMCPClient(MockMCPClient):
+            __slots__ = ()
 
-        async def empty_call(*args, **kwargs):
-            return []
+            async def call_tool(self, tool_name: str, arguments: dict) -> list:
+                return []
 
-        mock.call_tool = empty_call
-        client = ManticMCPClient(mock)
+        client = ManticMCPClient(EmptyMCPClient())
         with pytest.raises(ManticResponseError, match="Empty response"):
             _run(client.detect_friction("consumer_health", [0.5, 0.5, 0.5, 0.5]))
 
@@ -341,15 +421,32 @@ class TestErrorHandling:
 
     def test_invalid_json_raises(self):
         mock = MockMCPClient()
-
-        async def bad_json_call(*args, **kwargs):
-            return [_TextBlock(text="not json at all")]
-
-        mock.call_tool = bad_json_call
+        mock.set_response("mantic_detect_friction", "not json at all")
         client = ManticMCPClient(mock)
         with pytest.raises(ManticResponseError, match="Invalid JSON"):
             _run(client.detect_friction("consumer_health", [0.5, 0.5, 0.5, 0.5]))
 
+    def test_nan_literal_is_accepted(self):
+        """Python's json emits NaN; the parse path must accept it with or without orjson."""
+        mock = MockMCPClient()
+        mock.set_response(
+            "mantic_detect_friction", '{"status": "ok", "result": {"m_score": NaN}}'
+        )
+        client = ManticMCPClient(mock)
+        envelope = _run(client.detect_friction("consumer_health", [0.5, 0.5, 0.5, 0.5]))
+        assert envelope["result"]["m_score"] != envelope["result"]["m_score"]
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_decode_json_accepts_nan(self, monkeypatch, use_orjson):
+        """decode_json parses NaN whether or not the orjson speedup is installed."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(models, "orjson", None)
+        decoded = models.decode_json('{"overall": NaN, "layers": [Infinity]}')
+        assert decoded["overall"] != decoded["overall"]
+        assert decoded["layers"] == [float("inf")]
+
     def test_all_errors_inherit_base(self):
         """All custom exceptions are ManticClientError."""
         assert issubclass(ManticConnectionError, ManticClientError)
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+
 import pytest
 
-from cip.core.privacy.policy import _round_floats, build_llm_data_context
+from cip.core.privacy.policy import (
+    _round_floats,
+    build_llm_data_context,
+    build_strict_llm_data_context,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -48,6 +54,12 @@ def _make_full_context() -> dict:
     }
 
 
+@pytest.fixture(scope="session")
+def full_context() -> MappingProxyType:
+    """Read-only full_data_context shared by every test (the builders must not mutate it)."""
+    return MappingProxyType(_make_full_context())
+
+
 # ---------------------------------------------------------------------------
 # _round_floats tests
 # ---------------------------------------------------------------------------
@@ -64,6 +76,12 @@ class TestRoundFloats:
         result = _round_floats([1.111, 2.222, 3.333], ndigits=1)
         assert result == [1.1, 2.2, 3.3]
 
+    def test_rounds_deeply_mixed_nesting(self):
+        data = {"a": [{"b": [1.005, {"c": 2.567}]}, (3.333,)], "d": True, "e": 7}
+        result = _round_floats(data, ndigits=1)
+        assert result == {"a": [{"b": [1.0, {"c": 2.6}]}, (3.333,)], "d": True, "e": 7}
+        assert result["a"] is not data["a"]
+
     def test_passes_through_non_floats(self):
         assert _round_floats("hello") == "hello"
         assert _round_floats(42) == 42
@@ -80,8 +98,8 @@ class TestRoundFloats:
 # ---------------------------------------------------------------------------
 
 class TestPrivacyStrict:
-    def test_strict_minimizes_to_signals_mantic_provenance(self):
-        ctx = _make_full_context()
+    def test_strict_minimizes_to_signals_mantic_provenance(self, full_context):
+        ctx = full_context
         result = build_llm_data_context(
             full_data_context=ctx,
             privacy_mode="strict",
@@ -110,8 +128,8 @@ class TestPrivacyStrict:
         assert "emergence" not in result
         assert "signal_details" not in result
 
-    def test_strict_rounds_signals(self):
-        ctx = _make_full_context()
+    def test_strict_rounds_signals(self, full_context):
+        ctx = full_context
         result = build_llm_data_context(
             full_data_context=ctx,
             privacy_mode="strict",
@@ -121,14 +139,30 @@ class TestPrivacyStrict:
             # Should be rounded to 4 decimal places (ndigits=4 in policy)
             assert isinstance(v, float)
 
+    def test_strict_view_matches_filtered_full_context(self, full_context):
+        ctx = full_context
+        expected = build_llm_data_context(
+            full_data_context=ctx,
+            privacy_mode="strict",
+            include_mantic_raw=False,
+        )
+        result = build_strict_llm_data_context(
+            period=ctx["period"],
+            signals=ctx["signals"],
+            mantic_summary=ctx["mantic_summary"],
+            data_source=ctx["data_source"],
+            data_source_note=ctx["data_source_note"],
+        )
+        assert result == expected
+
 
 # ---------------------------------------------------------------------------
 # build_llm_data_context — standard mode
 # ---------------------------------------------------------------------------
 
 class TestPrivacyStandard:
-    def test_standard_includes_selected_metrics(self):
-        ctx = _make_full_context()
+    def test_standard_includes_selected_metrics(self, full_context):
+        ctx = full_context
         result = build_llm_data_context(
             full_data_context=ctx,
             privacy_mode="standard",
@@ -148,8 +182,8 @@ class TestPrivacyStandard:
         assert "bmi" in result
         assert "lab_count" in result
 
-    def test_standard_rounds_to_2_decimals(self):
-        ctx = _make_full_context()
+    def test_standard_rounds_to_2_decimals(self, full_context):
+        ctx = full_context
         result = build_llm_data_context(
             full_data_context=ctx,
             privacy_mode="standard",
@@ -167,8 +201,8 @@ class TestPrivacyStandard:
 # ---------------------------------------------------------------------------
 
 class TestPrivacyExplicit:
-    def test_explicit_passes_everything(self):
-        ctx = _make_full_context()
+    def test_explicit_passes_everything(self, full_context):
+        ctx = full_context
         result = build_llm_data_context(
             full_data_context=ctx,
             privacy_mode="explicit",
@@ -182,8 +216,8 @@ class TestPrivacyExplicit:
         assert "signal_details" in result
         assert "resting_heart_rate" in result
 
-    def test_explicit_strips_mantic_raw_when_disabled(self):
-        ctx = _make_full_context()
+    def test_explicit_strips_mantic_raw_when_disabled(self, full_context):
+        ctx = full_context
         result = build_llm_data_context(
             full_data_context=ctx,
             privacy_mode="explicit",
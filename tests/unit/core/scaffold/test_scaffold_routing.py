@@ -9,6 +9,7 @@ from __future__ import annotations
 import pytest
 
 from cip.core.scaffold.engine import ScaffoldEngine
+from cip.core.scaffold.registry import ScaffoldRegistry
 
 
 # ---------------------------------------------------------------------------
@@ -201,3 +202,16 @@ class TestEdgeCases:
             tool_context={"something_else": True},
         )
         assert scaffold.id == "personal_health_signal"
+
+    def test_missing_growth_scaffold_falls_back_to_risk(self, registry: ScaffoldRegistry):
+        """Emergence + high friction routes to risk when no growth scaffold is loaded."""
+        partial = ScaffoldRegistry()
+        partial.register(registry.get("personal_health_signal"))
+        partial.register(registry.get("personal_health_signal.risk"))
+        summary = _make_mantic_summary(emergence_window=True, friction_level="high")
+        scaffold = ScaffoldEngine(partial).select(
+            tool_name="personal_health_signal",
+            user_input="last_30_days",
+            tool_context={"mantic_summary": summary},
+        )
+        assert scaffold.id == "personal_health_signal.risk"
@@ -2,10 +2,34 @@
 
 from __future__ import annotations
 
+import sqlite3
+from collections import defaultdict
+
 import pytest
 
 from cip.core.storage.database import SCHEMA_VERSION, DatabaseError, HealthDatabase
 
+_EXPECTED_TABLES = frozenset({
+    "health_snapshots",
+    "lab_results",
+    "vital_readings",
+    "data_sources",
+    "schema_version",
+    "audit_log",
+})
+
+_EXPECTED_INDEXES = frozenset({
+    "idx_snapshots_source",
+    "idx_snapshots_ts",
+    "idx_labs_test_name",
+    "idx_labs_snapshot",
+    "idx_vitals_metric",
+    "idx_vitals_snapshot",
+    "idx_audit_timestamp",
+    "idx_audit_action",
+    "idx_audit_tool",
+})
+
 
 class TestInitialization:
     def test_in_memory_initialize(self):
@@ -36,58 +60,42 @@ class TestInitialization:
 
 
 class TestSchema:
-    def test_schema_version_recorded(self):
-        with HealthDatabase(":memory:") as db:
-            assert db.get_schema_version() == SCHEMA_VERSION
-
-    def test_tables_created(self):
-        expected_tables = {
-            "health_snapshots",
-            "lab_results",
-            "vital_readings",
-            "data_sources",
-            "schema_version",
-            "audit_log",
-        }
-        with HealthDatabase(":memory:") as db:
-            cursor = db.connection.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
-            )
-            tables = {row[0] for row in cursor.fetchall()}
-            for t in expected_tables:
-                assert t in tables, f"Missing table: {t}"
-
-    def test_indexes_created(self):
-        expected_indexes = {
-            "idx_snapshots_source",
-            "idx_snapshots_ts",
-            "idx_labs_test_name",
-            "idx_labs_snapshot",
-            "idx_vitals_metric",
-            "idx_vitals_snapshot",
-            "idx_audit_timestamp",
-            "idx_audit_action",
-            "idx_audit_tool",
-        }
-        with HealthDatabase(":memory:") as db:
-            cursor = db.connection.execute(
-                "SELECT name FROM sqlite_master WHERE type='index'"
-            )
-            indexes = {row[0] for row in cursor.fetchall()}
-            for idx in expected_indexes:
-                assert idx in indexes, f"Missing index: {idx}"
-
-    def test_foreign_keys_enabled(self):
-        with HealthDatabase(":memory:") as db:
-            cursor = db.connection.execute("PRAGMA foreign_keys")
-            assert cursor.fetchone()[0] == 1
-
-    def test_wal_mode_enabled(self):
-        with HealthDatabase(":memory:") as db:
-            cursor = db.connection.execute("PRAGMA journal_mode")
-            mode = cursor.fetchone()[0].lower()
-            # In-memory databases may use 'memory' mode instead of 'wal'
-            assert mode in ("wal", "memory")
+    # Read-only schema and pragma checks use the in-memory session DB from
+    # conftest (built by the same initialize()); file-DB tests open their own.
+    def test_schema_version_recorded(self, health_db):
+        assert health_db.get_schema_version() == SCHEMA_VERSION
+
+    def test_schema_objects_present(self, health_db):
+        by_type: defaultdict[str, set[str]] = defaultdict(set)
+        for obj_type, name in health_db.connection.execute(
+            "SELECT type, name FROM sqlite_master WHERE name NOT LIKE 'sqlite_%'"
+        ):
+            by_type[obj_type].add(name)
+        assert _EXPECTED_TABLES - by_type["table"] == set(), "Missing tables"
+        assert _EXPECTED_INDEXES - by_type["index"] == set(), "Missing indexes"
+
+    def test_foreign_keys_enabled(self, health_db):
+        cursor = health_db.connection.execute("PRAGMA foreign_keys")
+        assert cursor.fetchone()[0] == 1
+
+    def test_rows_support_column_access(self, health_db):
+        # The repository reads columns by name straight off sqlite3.Row.
+        assert health_db.connection.row_factory is sqlite3.Row
+
+    def test_wal_mode_enabled(self, health_db):
+        cursor = health_db.connection.execute("PRAGMA journal_mode")
+        mode = cursor.fetchone()[0].lower()
+        # In-memory databases may use 'memory' mode instead of 'wal'
+        assert mode in ("wal", "memory")
+
+    def test_in_memory_skips_durability(self, health_db):
+        conn = health_db.connection
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+
+    def test_file_db_uses_wal(self, tmp_path):
+        with HealthDatabase(str(tmp_path / "health.db")) as db:
+            assert db.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
 
     def test_schema_version_idempotent_on_reinit(self):
         """Re-initializing should not duplicate schema version rows."""
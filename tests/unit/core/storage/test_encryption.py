@@ -5,44 +5,45 @@ from __future__ import annotations
 import pytest
 from cryptography.fernet import Fernet
 
+from cip.core.storage import encryption
 from cip.core.storage.encryption import EncryptionError, FieldEncryptor
 
 
-@pytest.fixture
+# The encryptor holds no per-test state, so one key and cipher serve the module.
+@pytest.fixture(scope="module")
 def key() -> str:
-    return Fernet.generate_key().decode()
+    return FieldEncryptor.generate_key()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def encryptor(key: str) -> FieldEncryptor:
     return FieldEncryptor(key)
 
 
+_ROUND_TRIP_PAYLOADS = (
+    ("dict", {"heart_rate": 72, "bp": {"systolic": 120, "diastolic": 80}}),
+    ("list", [{"test": "glucose", "value": 95.0}, {"test": "hba1c", "value": 5.4}]),
+    ("string", "plain text"),
+    ("int", 42),
+    ("float", 3.14),
+    ("bool", True),
+)
+
+
 class TestRoundTrip:
     """Verify encrypt → decrypt returns the original data."""
 
-    def test_dict_round_trip(self, encryptor: FieldEncryptor):
-        data = {"heart_rate": 72, "bp": {"systolic": 120, "diastolic": 80}}
+    @pytest.mark.parametrize(
+        "data", [payload for _, payload in _ROUND_TRIP_PAYLOADS],
+        ids=[label for label, _ in _ROUND_TRIP_PAYLOADS],
+    )
+    def test_round_trip(self, encryptor: FieldEncryptor, data):
         token = encryptor.encrypt(data)
         assert isinstance(token, str)
         assert token != ""
         result = encryptor.decrypt(token)
         assert result == data
-
-    def test_list_round_trip(self, encryptor: FieldEncryptor):
-        data = [{"test": "glucose", "value": 95.0}, {"test": "hba1c", "value": 5.4}]
-        assert encryptor.decrypt(encryptor.encrypt(data)) == data
-
-    def test_string_round_trip(self, encryptor: FieldEncryptor):
-        data = "plain text"
-        assert encryptor.decrypt(encryptor.encrypt(data)) == data
-
-    def test_number_round_trip(self, encryptor: FieldEncryptor):
-        assert encryptor.decrypt(encryptor.encrypt(42)) == 42
-        assert encryptor.decrypt(encryptor.encrypt(3.14)) == 3.14
-
-    def test_bool_round_trip(self, encryptor: FieldEncryptor):
-        assert encryptor.decrypt(encryptor.encrypt(True)) is True
+        assert type(result) is type(data)
 
     def test_null_round_trip(self, encryptor: FieldEncryptor):
         assert encryptor.encrypt(None) == ""
@@ -91,11 +92,10 @@ class TestGenerateKey:
         assert isinstance(key, str)
         assert len(key) == 44  # base64-encoded 32 bytes
 
-    def test_generated_key_works(self):
-        key = FieldEncryptor.generate_key()
-        enc = FieldEncryptor(key)
+    def test_generated_key_works(self, encryptor: FieldEncryptor):
+        # The module's key fixture comes from FieldEncryptor.generate_key().
         data = {"test": True}
-        assert enc.decrypt(enc.encrypt(data)) == data
+        assert encryptor.decrypt(encryptor.encrypt(data)) == data
 
     def test_each_key_is_unique(self):
         keys = {FieldEncryptor.generate_key() for _ in range(10)}
@@ -111,3 +111,15 @@ class TestTokenUniqueness:
         # Tokens may differ due to timestamp, but both decrypt correctly
         assert encryptor.decrypt(t1) == data
         assert encryptor.decrypt(t2) == data
+
+
+class TestBackend:
+    def test_backend_matches_installed_extras(self, encryptor: FieldEncryptor):
+        expected = "rfernet" if encryption.rfernet is not None else "cryptography"
+        assert encryptor._backend == expected
+
+    def test_tokens_interoperate_with_cryptography(self, key: str, encryptor: FieldEncryptor):
+        reference = Fernet(key.encode())
+        token = encryptor.encrypt({"value": 42})
+        assert reference.decrypt(token.encode()) == b'{"value":42}'
+        assert encryptor.decrypt(reference.encrypt(b'{"value":42}').decode()) == {"value": 42}
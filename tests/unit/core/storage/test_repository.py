@@ -2,63 +2,68 @@
 
 from __future__ import annotations
 
+import sqlite3
+from dataclasses import replace
+
 import pytest
-from cryptography.fernet import Fernet
 
-from cip.core.storage.database import HealthDatabase
-from cip.core.storage.encryption import FieldEncryptor
 from cip.core.storage.models import DataSource, HealthSnapshot
 from cip.core.storage.repository import HealthRepository, RepositoryError
 
 
 @pytest.fixture
-def db():
-    database = HealthDatabase(":memory:")
-    database.initialize()
-    yield database
-    database.close()
+def repo(health_db, field_encryptor):
+    """Repository over the shared schema-initialized DB (emptied per test)."""
+    return HealthRepository(health_db, field_encryptor)
+
+
+# Built once; tests only read the nested data, so copies may share it.
+_BASE_SNAPSHOT = HealthSnapshot(
+    id="",
+    timestamp="2026-02-01T12:00:00Z",
+    source="mock",
+    period="last_30_days",
+    vitals_data={"resting_heart_rate": {"current_bpm": 68}},
+    labs_data=[
+        {"test_name": "Fasting Glucose", "value": 95.0, "unit": "mg/dL",
+         "status": "normal", "date": "2026-01-10"},
+        {"test_name": "LDL Cholesterol", "value": 130.0, "unit": "mg/dL",
+         "status": "above_optimal", "date": "2026-01-10"},
+    ],
+    activity_data={"exercise": {"sessions_per_week": 3.5}},
+    preventive_data={"screenings": {}},
+    biometrics_data={"bmi": 25.5},
+    vital_stability=0.72,
+    metabolic_balance=0.58,
+    activity_recovery=0.65,
+    preventive_readiness=0.50,
+    friction_m_score=0.3842,
+    friction_detected=False,
+    emergence_m_score=0.6025,
+    emergence_detected=False,
+    emergence_window_type=None,
+    provenance={"data_source": "mock", "connector_version": "0.1.0"},
+)
 
 
-@pytest.fixture
-def encryptor():
-    return FieldEncryptor(Fernet.generate_key().decode())
+def _make_snapshot(**overrides) -> HealthSnapshot:
+    """Create a test snapshot with sensible defaults."""
+    return replace(_BASE_SNAPSHOT, **overrides)
 
 
-@pytest.fixture
-def repo(db, encryptor):
-    return HealthRepository(db, encryptor)
+def _make_bare_snapshot(**overrides) -> HealthSnapshot:
+    """Snapshot with no raw health data, for tests that only filter or order rows.
 
-
-def _make_snapshot(**overrides) -> HealthSnapshot:
-    """Create a test snapshot with sensible defaults."""
-    defaults = dict(
-        id="",
-        timestamp="2026-02-01T12:00:00Z",
-        source="mock",
-        period="last_30_days",
-        vitals_data={"resting_heart_rate": {"current_bpm": 68}},
-        labs_data=[
-            {"test_name": "Fasting Glucose", "value": 95.0, "unit": "mg/dL",
-             "status": "normal", "date": "2026-01-10"},
-            {"test_name": "LDL Cholesterol", "value": 130.0, "unit": "mg/dL",
-             "status": "above_optimal", "date": "2026-01-10"},
-        ],
-        activity_data={"exercise": {"sessions_per_week": 3.5}},
-        preventive_data={"screenings": {}},
-        biometrics_data={"bmi": 25.5},
-        vital_stability=0.72,
-        metabolic_balance=0.58,
-        activity_recovery=0.65,
-        preventive_readiness=0.50,
-        friction_m_score=0.3842,
-        friction_detected=False,
-        emergence_m_score=0.6025,
-        emergence_detected=False,
-        emergence_window_type=None,
-        provenance={"data_source": "mock", "connector_version": "0.1.0"},
+    ``encrypt(None)`` short-circuits, so saving one skips Fernet entirely.
+    """
+    return _make_snapshot(
+        vitals_data=None,
+        labs_data=None,
+        activity_data=None,
+        preventive_data=None,
+        biometrics_data=None,
+        **overrides,
     )
-    defaults.update(overrides)
-    return HealthSnapshot(**defaults)
 
 
 class TestSaveAndRetrieve:
@@ -128,18 +133,18 @@ class TestSaveAndRetrieve:
 
 class TestGetSnapshots:
     def test_returns_newest_first(self, repo):
-        repo.save_snapshot(_make_snapshot(timestamp="2026-01-01T00:00:00Z"))
-        repo.save_snapshot(_make_snapshot(timestamp="2026-02-01T00:00:00Z"))
-        repo.save_snapshot(_make_snapshot(timestamp="2026-01-15T00:00:00Z"))
+        repo.save_snapshot(_make_bare_snapshot(timestamp="2026-01-01T00:00:00Z"))
+        repo.save_snapshot(_make_bare_snapshot(timestamp="2026-02-01T00:00:00Z"))
+        repo.save_snapshot(_make_bare_snapshot(timestamp="2026-01-15T00:00:00Z"))
 
         snapshots = repo.get_snapshots()
         timestamps = [s.timestamp for s in snapshots]
         assert timestamps == sorted(timestamps, reverse=True)
 
     def test_filter_by_source(self, repo):
-        repo.save_snapshot(_make_snapshot(source="apple_health"))
-        repo.save_snapshot(_make_snapshot(source="manual"))
-        repo.save_snapshot(_make_snapshot(source="apple_health"))
+        repo.save_snapshot(_make_bare_snapshot(source="apple_health"))
+        repo.save_snapshot(_make_bare_snapshot(source="manual"))
+        repo.save_snapshot(_make_bare_snapshot(source="apple_health"))
 
         results = repo.get_snapshots(source="apple_health")
         assert len(results) == 2
@@ -154,8 +159,9 @@ class TestGetSnapshots:
         assert results[0].timestamp == "2026-02-01T00:00:00Z"
 
     def test_limit_respected(self, repo):
-        for i in range(5):
-            repo.save_snapshot(_make_snapshot(timestamp=f"2026-01-0{i+1}T00:00:00Z"))
+        repo.save_snapshots(
+            _make_bare_snapshot(timestamp=f"2026-01-0{i+1}T00:00:00Z") for i in range(5)
+        )
         results = repo.get_snapshots(limit=3)
         assert len(results) == 3
 
@@ -170,22 +176,80 @@ class TestGetSnapshots:
         assert repo.get_latest_snapshot() is None
 
 
+class TestSaveSnapshots:
+    def test_returns_ids_in_order(self, repo):
+        ids = repo.save_snapshots([
+            _make_snapshot(timestamp="2026-01-01T00:00:00Z"),
+            _make_snapshot(timestamp="2026-02-01T00:00:00Z"),
+        ])
+        assert len(ids) == 2
+        assert repo.get_snapshot(ids[0]).timestamp == "2026-01-01T00:00:00Z"
+        assert repo.get_snapshot(ids[1]).timestamp == "2026-02-01T00:00:00Z"
+
+    def test_failure_rolls_back_batch(self, repo):
+        dup = _make_snapshot(id="snap-dup")
+        with pytest.raises(sqlite3.IntegrityError):
+            repo.save_snapshots([_make_snapshot(), dup, dup])
+        assert repo.count_snapshots() == 0
+
+
 class TestCountSnapshots:
     def test_empty_db(self, repo):
         assert repo.count_snapshots() == 0
 
     def test_after_inserts(self, repo):
-        repo.save_snapshot(_make_snapshot())
-        repo.save_snapshot(_make_snapshot())
+        repo.save_snapshot(_make_bare_snapshot())
+        repo.save_snapshot(_make_bare_snapshot())
         assert repo.count_snapshots() == 2
 
 
+class TestSnapshotStats:
+    def test_empty_db(self, repo):
+        assert repo.get_snapshot_stats() == {
+            "count": 0,
+            "oldest_timestamp": None,
+            "latest_timestamp": None,
+            "latest_source": None,
+        }
+
+    def test_aggregates_without_loading_snapshots(self, repo):
+        repo.save_snapshot(_make_bare_snapshot(timestamp="2026-02-01T00:00:00Z", source="manual"))
+        repo.save_snapshot(_make_bare_snapshot(timestamp="2026-01-01T00:00:00Z"))
+        repo.save_snapshot(_make_bare_snapshot(timestamp="2026-01-15T00:00:00Z"))
+
+        stats = repo.get_snapshot_stats()
+        assert stats["count"] == 3
+        assert stats["oldest_timestamp"] == "2026-01-01T00:00:00Z"
+        assert stats["latest_timestamp"] == "2026-02-01T00:00:00Z"
+        assert stats["latest_source"] == "manual"
+
+
+class TestVersion:
+    def test_bumped_by_snapshot_writes(self, repo):
+        assert repo.version == 0
+        sid = repo.save_snapshot(_make_bare_snapshot(timestamp="2025-01-01T00:00:00Z"))
+        repo.save_snapshots([_make_bare_snapshot()])
+        repo.delete_snapshot(sid)
+        repo.purge_before("2030-01-01T00:00:00Z")
+        repo.delete_all_data()
+        assert repo.version == 5
+
+    def test_unchanged_by_reads_and_no_ops(self, repo):
+        dup = _make_bare_snapshot(id="snap-dup")
+        with pytest.raises(sqlite3.IntegrityError):
+            repo.save_snapshots([dup, dup])
+        repo.delete_snapshot("missing")
+        repo.purge_before("2000-01-01T00:00:00Z")
+        repo.get_snapshots()
+        assert repo.version == 0
+
+
 class TestSignalHistory:
     def test_returns_values_newest_first(self, repo):
-        repo.save_snapshot(_make_snapshot(
+        repo.save_snapshot(_make_bare_snapshot(
             timestamp="2026-01-01T00:00:00Z", vital_stability=0.65
         ))
-        repo.save_snapshot(_make_snapshot(
+        repo.save_snapshot(_make_bare_snapshot(
             timestamp="2026-02-01T00:00:00Z", vital_stability=0.72
         ))
 
@@ -195,10 +259,10 @@ class TestSignalHistory:
         assert history[1] == ("2026-01-01T00:00:00Z", 0.65)
 
     def test_filters_by_since(self, repo):
-        repo.save_snapshot(_make_snapshot(
+        repo.save_snapshot(_make_bare_snapshot(
             timestamp="2026-01-01T00:00:00Z", metabolic_balance=0.5
         ))
-        repo.save_snapshot(_make_snapshot(
+        repo.save_snapshot(_make_bare_snapshot(
             timestamp="2026-02-01T00:00:00Z", metabolic_balance=0.6
         ))
 
@@ -212,14 +276,47 @@ class TestSignalHistory:
             repo.get_signal_history("invalid_signal")
 
     def test_limit_respected(self, repo):
-        for i in range(5):
-            repo.save_snapshot(_make_snapshot(
+        repo.save_snapshots(
+            _make_bare_snapshot(
                 timestamp=f"2026-01-0{i+1}T00:00:00Z",
                 activity_recovery=0.6 + i * 0.02,
-            ))
+            )
+            for i in range(5)
+        )
         history = repo.get_signal_history("activity_recovery", limit=3)
         assert len(history) == 3
 
+    def test_histories_match_per_signal_queries(self, repo):
+        repo.save_snapshots(
+            _make_bare_snapshot(
+                timestamp=f"2026-01-0{i+1}T00:00:00Z",
+                vital_stability=0.6 + i * 0.02,
+            )
+            for i in range(4)
+        )
+        # Manual-entry style snapshot with no computed signals
+        repo.save_snapshot(HealthSnapshot(
+            id="", timestamp="2026-01-09T00:00:00Z", source="manual", period="point_in_time",
+        ))
+
+        histories = repo.get_signal_histories(limit=3)
+        assert list(histories) == [
+            "vital_stability", "metabolic_balance", "activity_recovery", "preventive_readiness",
+        ]
+        for name, history in histories.items():
+            assert history == repo.get_signal_history(name, limit=3)
+
+        since = repo.get_signal_histories(("metabolic_balance",), since="2026-01-03T00:00:00Z")
+        assert since == {
+            "metabolic_balance": repo.get_signal_history(
+                "metabolic_balance", since="2026-01-03T00:00:00Z"
+            ),
+        }
+
+    def test_histories_invalid_signal_name_raises(self, repo):
+        with pytest.raises(RepositoryError, match="Invalid signal name"):
+            repo.get_signal_histories(("vital_stability", "invalid_signal"))
+
 
 class TestLabHistory:
     def test_returns_lab_values_for_test(self, repo):
@@ -318,8 +415,7 @@ class TestDataSources:
                             display_name="Apple", is_active=True)
         inactive = DataSource(id="ds-2", source_type="manual",
                               display_name="Manual", is_active=False)
-        repo.upsert_data_source(active)
-        repo.upsert_data_source(inactive)
+        repo.upsert_data_sources([active, inactive])
 
         assert len(repo.get_data_sources(active_only=True)) == 1
         assert len(repo.get_data_sources(active_only=False)) == 2
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import io
 import tempfile
 from pathlib import Path
 
@@ -17,13 +19,13 @@ from cip.domains.health.connectors.apple_health_parser import (
     parse_apple_health_export,
 )
 
+# One runner (and event loop) for the whole module, closed at exit.
+_RUNNER = asyncio.Runner()
+atexit.register(_RUNNER.close)
+
 
 def _run(coro):
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+    return _RUNNER.run(coro)
 
 
 # Sample Apple Health XML with records from recent dates
@@ -115,44 +117,55 @@ _SAMPLE_XML = """\
           endDate="2026-02-02 08:45:00 -0500"/>
 </HealthData>
 """
+_SAMPLE_XML_BYTES = _SAMPLE_XML.encode()
 
 
-@pytest.fixture
-def sample_xml_path(tmp_path):
-    path = tmp_path / "export.xml"
+@pytest.fixture(scope="module")
+def sample_xml_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("apple_health") / "export.xml"
     path.write_text(_SAMPLE_XML)
     return str(path)
 
 
+# Parsing is read-only for the aggregators, so each period is parsed once,
+# straight from memory (the provider tests below still go through a file).
+@pytest.fixture(scope="module")
+def parsed_30d():
+    return parse_apple_health_export(io.BytesIO(_SAMPLE_XML_BYTES), "last_30_days")
+
+
+@pytest.fixture(scope="module")
+def parsed_365d():
+    return parse_apple_health_export(io.BytesIO(_SAMPLE_XML_BYTES), "last_365_days")
+
+
 class TestAppleHealthParser:
-    def test_parses_heart_rate(self, sample_xml_path):
-        parsed = parse_apple_health_export(sample_xml_path, "last_30_days")
+    def test_parses_heart_rate(self, parsed_30d):
         hr_key = "HKQuantityTypeIdentifierHeartRate"
-        assert hr_key in parsed
-        assert len(parsed[hr_key]) == 2
-        assert parsed[hr_key][0]["value"] == 68.0
+        assert hr_key in parsed_30d
+        assert len(parsed_30d[hr_key]) == 2
+        assert parsed_30d[hr_key][0]["value"] == 68.0
 
-    def test_parses_blood_pressure(self, sample_xml_path):
-        parsed = parse_apple_health_export(sample_xml_path, "last_30_days")
-        assert "HKQuantityTypeIdentifierBloodPressureSystolic" in parsed
-        assert "HKQuantityTypeIdentifierBloodPressureDiastolic" in parsed
+    def test_parses_blood_pressure(self, parsed_30d):
+        assert "HKQuantityTypeIdentifierBloodPressureSystolic" in parsed_30d
+        assert "HKQuantityTypeIdentifierBloodPressureDiastolic" in parsed_30d
 
-    def test_parses_steps(self, sample_xml_path):
-        parsed = parse_apple_health_export(sample_xml_path, "last_30_days")
+    def test_parses_steps(self, parsed_30d):
         steps_key = "HKQuantityTypeIdentifierStepCount"
-        assert steps_key in parsed
-        assert len(parsed[steps_key]) == 2
+        assert steps_key in parsed_30d
+        assert len(parsed_30d[steps_key]) == 2
+
+    def test_parses_workouts(self, parsed_30d):
+        assert "workouts" in parsed_30d
+        assert len(parsed_30d["workouts"]) == 2
 
-    def test_parses_workouts(self, sample_xml_path):
-        parsed = parse_apple_health_export(sample_xml_path, "last_30_days")
-        assert "workouts" in parsed
-        assert len(parsed["workouts"]) == 2
+    def test_parses_sleep(self, parsed_30d):
+        assert "sleep" in parsed_30d
+        assert len(parsed_30d["sleep"]) == 1
+        assert parsed_30d["sleep"][0]["duration_hours"] == pytest.approx(7.5, abs=0.1)
 
-    def test_parses_sleep(self, sample_xml_path):
-        parsed = parse_apple_health_export(sample_xml_path, "last_30_days")
-        assert "sleep" in parsed
-        assert len(parsed["sleep"]) == 1
-        assert parsed["sleep"][0]["duration_hours"] == pytest.approx(7.5, abs=0.1)
+    def test_path_and_file_object_parse_the_same(self, sample_xml_path, parsed_30d):
+        assert parse_apple_health_export(sample_xml_path, "last_30_days") == parsed_30d
 
     def test_nonexistent_file_raises(self, tmp_path):
         with pytest.raises(AppleHealthParseError, match="not found"):
@@ -165,71 +178,62 @@ class TestAppleHealthParser:
             parse_apple_health_export(str(bad))
 
 
-class TestAggregateVitals:
-    def test_aggregates_heart_rate(self, sample_xml_path):
-        parsed = parse_apple_health_export(sample_xml_path, "last_30_days")
-        vitals = aggregate_vitals(parsed)
-        assert "resting_heart_rate" in vitals
-        assert vitals["resting_heart_rate"]["current_bpm"] == 70.0  # avg of 68, 72
+@pytest.fixture(scope="module")
+def vitals_agg(parsed_30d):
+    return aggregate_vitals(parsed_30d)
+
+
+@pytest.fixture(scope="module")
+def activity_agg(parsed_30d):
+    return aggregate_activity(parsed_30d)
 
-    def test_aggregates_blood_pressure(self, sample_xml_path):
-        parsed = parse_apple_health_export(sample_xml_path, "last_30_days")
-        vitals = aggregate_vitals(parsed)
-        assert "blood_pressure" in vitals
-        assert vitals["blood_pressure"]["systolic_avg"] == 120.0
 
-    def test_aggregates_hrv(self, sample_xml_path):
-        parsed = parse_apple_health_export(sample_xml_path, "last_30_days")
-        vitals = aggregate_vitals(parsed)
-        assert "hrv" in vitals
-        assert vitals["hrv"]["avg_ms"] == 45.0
+@pytest.fixture(scope="module")
+def biometrics_agg(parsed_365d):
+    return aggregate_biometrics(parsed_365d)
 
-    def test_aggregates_spo2(self, sample_xml_path):
-        parsed = parse_apple_health_export(sample_xml_path, "last_30_days")
-        vitals = aggregate_vitals(parsed)
-        assert "spo2" in vitals
-        assert vitals["spo2"]["avg_pct"] == 97.0
+
+class TestAggregateVitals:
+    @pytest.mark.parametrize(
+        ("key", "subkey", "expected"),
+        [
+            ("resting_heart_rate", "current_bpm", 70.0),  # avg of 68, 72
+            ("blood_pressure", "systolic_avg", 120.0),
+            ("hrv", "avg_ms", 45.0),
+            ("spo2", "avg_pct", 97.0),
+        ],
+    )
+    def test_aggregates(self, vitals_agg, key, subkey, expected):
+        assert key in vitals_agg
+        assert vitals_agg[key][subkey] == expected
 
 
 class TestAggregateActivity:
-    def test_aggregates_exercise(self, sample_xml_path):
-        parsed = parse_apple_health_export(sample_xml_path, "last_30_days")
-        activity = aggregate_activity(parsed)
-        assert "exercise" in activity
-        assert activity["exercise"]["sessions_per_week"] > 0
+    def test_aggregates_exercise(self, activity_agg):
+        assert "exercise" in activity_agg
+        assert activity_agg["exercise"]["sessions_per_week"] > 0
 
-    def test_aggregates_sleep(self, sample_xml_path):
-        parsed = parse_apple_health_export(sample_xml_path, "last_30_days")
-        activity = aggregate_activity(parsed)
-        assert "sleep" in activity
-        assert activity["sleep"]["avg_duration_hours"] == pytest.approx(7.5, abs=0.1)
+    def test_aggregates_sleep(self, activity_agg):
+        assert "sleep" in activity_agg
+        assert activity_agg["sleep"]["avg_duration_hours"] == pytest.approx(7.5, abs=0.1)
 
-    def test_aggregates_steps(self, sample_xml_path):
-        parsed = parse_apple_health_export(sample_xml_path, "last_30_days")
-        activity = aggregate_activity(parsed)
-        assert "steps" in activity
-        assert activity["steps"]["daily_avg"] == 8200  # 4500 + 3700 on same day
+    def test_aggregates_steps(self, activity_agg):
+        assert "steps" in activity_agg
+        assert activity_agg["steps"]["daily_avg"] == 8200  # 4500 + 3700 on same day
 
 
 class TestAggregateBiometrics:
-    def test_aggregates_weight(self, sample_xml_path):
-        parsed = parse_apple_health_export(sample_xml_path, "last_365_days")
-        bio = aggregate_biometrics(parsed)
-        assert "weight_lbs" in bio
-        assert bio["weight_lbs"] == 178.0
-
-    def test_aggregates_body_fat(self, sample_xml_path):
-        parsed = parse_apple_health_export(sample_xml_path, "last_365_days")
-        bio = aggregate_biometrics(parsed)
-        assert "body_fat_pct" in bio
-        assert bio["body_fat_pct"] == 22.0
-
-    def test_calculates_bmi_from_weight_height(self, sample_xml_path):
-        parsed = parse_apple_health_export(sample_xml_path, "last_365_days")
-        bio = aggregate_biometrics(parsed)
-        assert "bmi" in bio
+    @pytest.mark.parametrize(
+        ("key", "expected"), [("weight_lbs", 178.0), ("body_fat_pct", 22.0)],
+    )
+    def test_aggregates(self, biometrics_agg, key, expected):
+        assert key in biometrics_agg
+        assert biometrics_agg[key] == expected
+
+    def test_calculates_bmi_from_weight_height(self, biometrics_agg):
+        assert "bmi" in biometrics_agg
         expected_bmi = (178.0 / (70 ** 2)) * 703
-        assert bio["bmi"] == pytest.approx(expected_bmi, abs=0.2)
+        assert biometrics_agg["bmi"] == pytest.approx(expected_bmi, abs=0.2)
 
 
 class TestAppleHealthProvider:
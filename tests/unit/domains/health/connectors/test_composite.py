@@ -3,19 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 
 import pytest
 
 from cip.domains.health.connectors.composite import CompositeHealthProvider
 from cip.domains.health.connectors.providers import MockHealthDataProvider
 
+# One runner (and event loop) for the whole module, closed at exit.
+_RUNNER = asyncio.Runner()
+atexit.register(_RUNNER.close)
+
 
 def _run(coro):
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+    return _RUNNER.run(coro)
 
 
 class EmptyProvider:
@@ -47,76 +48,74 @@ class EmptyProvider:
         return {"data_source": "empty"}
 
 
+# Both providers are stateless, so one instance of each serves the module.
+@pytest.fixture(scope="module")
+def mock_provider():
+    return MockHealthDataProvider()
+
+
+@pytest.fixture(scope="module")
+def empty_provider():
+    return EmptyProvider()
+
+
 class TestPriorityOrdering:
-    def test_first_provider_with_data_wins(self):
-        mock = MockHealthDataProvider()
-        empty = EmptyProvider()
-        composite = CompositeHealthProvider([empty, mock])
+    def test_first_provider_with_data_wins(self, mock_provider, empty_provider):
+        composite = CompositeHealthProvider([empty_provider, mock_provider])
 
         vitals = _run(composite.get_vitals())
         # Empty returns {}, so mock should win
         assert "resting_heart_rate" in vitals
 
-    def test_first_provider_wins_if_has_data(self):
-        mock = MockHealthDataProvider()
-        composite = CompositeHealthProvider([mock, EmptyProvider()])
+    def test_first_provider_wins_if_has_data(self, mock_provider, empty_provider):
+        composite = CompositeHealthProvider([mock_provider, empty_provider])
 
         vitals = _run(composite.get_vitals())
         assert "resting_heart_rate" in vitals
 
-    def test_labs_priority(self):
-        mock = MockHealthDataProvider()
-        empty = EmptyProvider()
-        composite = CompositeHealthProvider([empty, mock])
+    def test_labs_priority(self, mock_provider, empty_provider):
+        composite = CompositeHealthProvider([empty_provider, mock_provider])
 
         labs = _run(composite.get_lab_results())
         assert len(labs) > 0  # Mock has lab data
 
-    def test_all_empty_returns_empty(self):
-        composite = CompositeHealthProvider([EmptyProvider(), EmptyProvider()])
+    def test_all_empty_returns_empty(self, empty_provider):
+        composite = CompositeHealthProvider([empty_provider, empty_provider])
         assert _run(composite.get_vitals()) == {}
         assert _run(composite.get_lab_results()) == []
 
 
 class TestIsConnected:
-    def test_connected_if_any_connected(self):
-        composite = CompositeHealthProvider([EmptyProvider(), MockHealthDataProvider()])
+    def test_connected_if_any_connected(self, mock_provider, empty_provider):
+        composite = CompositeHealthProvider([empty_provider, mock_provider])
         assert composite.is_connected()
 
-    def test_not_connected_if_none_connected(self):
-        mock = MockHealthDataProvider()
+    def test_not_connected_if_none_connected(self, mock_provider):
         # MockHealthDataProvider.is_connected() returns False
-        composite = CompositeHealthProvider([mock])
+        composite = CompositeHealthProvider([mock_provider])
         assert not composite.is_connected()
 
 
 class TestDataSource:
-    def test_returns_first_connected_source(self):
-        empty = EmptyProvider()
-        mock = MockHealthDataProvider()
-        composite = CompositeHealthProvider([empty, mock])
+    def test_returns_first_connected_source(self, mock_provider, empty_provider):
+        composite = CompositeHealthProvider([empty_provider, mock_provider])
         # Empty is connected, so its data_source is returned
         assert composite.data_source == "empty"
 
-    def test_returns_last_if_none_connected(self):
-        mock = MockHealthDataProvider()
-        composite = CompositeHealthProvider([mock])
+    def test_returns_last_if_none_connected(self, mock_provider):
+        composite = CompositeHealthProvider([mock_provider])
         assert composite.data_source == "mock"
 
 
 class TestProvenance:
-    def test_provenance_lists_active_sources(self):
-        empty = EmptyProvider()
-        mock = MockHealthDataProvider()
-        composite = CompositeHealthProvider([empty, mock])
+    def test_provenance_lists_active_sources(self, mock_provider, empty_provider):
+        composite = CompositeHealthProvider([empty_provider, mock_provider])
         prov = composite.get_provenance()
         assert "active_sources" in prov
         assert "empty" in prov["active_sources"]
 
-    def test_provenance_shows_priority(self):
-        empty = EmptyProvider()
-        mock = MockHealthDataProvider()
-        composite = CompositeHealthProvider([empty, mock])
+    def test_provenance_shows_priority(self, mock_provider, empty_provider):
+        composite = CompositeHealthProvider([empty_provider, mock_provider])
         prov = composite.get_provenance()
         assert "empty > mock" in prov["data_source_note"]
 
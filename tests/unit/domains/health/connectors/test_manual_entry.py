@@ -3,19 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 
 import pytest
 
 from cip.core.storage.models import HealthSnapshot
 from cip.domains.health.connectors.manual_entry import ManualEntryProvider
 
+# One runner (and event loop) for the whole module, closed at exit.
+_RUNNER = asyncio.Runner()
+atexit.register(_RUNNER.close)
+
 
 def _run(coro):
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+    return _RUNNER.run(coro)
 
 
 class TestManualEntryProvider:
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+from importlib.resources import files
 
+import pytest
 import yaml
 
 from cip.domains.health.domain_logic.signal_models import (
@@ -14,84 +15,61 @@ from cip.domains.health.domain_logic.signal_models import (
     PROFILE_NAME,
 )
 
-def _find_project_root() -> Path:
-    """Walk up from this file until we find pyproject.toml."""
-    current = Path(__file__).resolve().parent
-    while current != current.parent:
-        if (current / "pyproject.toml").exists():
-            return current
-        current = current.parent
-    raise FileNotFoundError("Could not find project root (no pyproject.toml found)")
-
-
-_PROFILE_PATH = (
-    _find_project_root()
-    / "src"
-    / "cip"
-    / "domains"
-    / "health"
-    / "profiles"
-    / "consumer_health.v1.yaml"
-)
+_PROFILE_PATH = files("cip.domains.health.profiles").joinpath("consumer_health.v1.yaml")
+
+# libyaml's C loader when PyYAML was built with it; same safe semantics.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
-def _load_profile() -> dict:
-    text = _PROFILE_PATH.read_text()
-    return yaml.safe_load(text)
+@pytest.fixture(scope="module")
+def profile() -> dict:
+    """The profile YAML, parsed once for the module (tests only read it)."""
+    return yaml.load(_PROFILE_PATH.read_text(), Loader=_YAML_LOADER)
 
 
 class TestProfileSync:
     """Ensure the YAML profile matches the Python constants."""
 
     def test_profile_file_exists(self):
-        assert _PROFILE_PATH.exists(), f"Profile YAML not found at {_PROFILE_PATH}"
+        assert _PROFILE_PATH.is_file(), f"Profile YAML not found at {_PROFILE_PATH}"
 
-    def test_domain_name_matches(self):
-        profile = _load_profile()
+    def test_domain_name_matches(self, profile):
         assert profile["domain_name"] == HEALTH_DOMAIN
 
     def test_profile_name_matches_domain(self):
         assert PROFILE_NAME == HEALTH_DOMAIN
 
-    def test_layer_names_match(self):
-        profile = _load_profile()
+    def test_layer_names_match(self, profile):
         assert profile["layer_names"] == LAYER_NAMES
 
-    def test_weights_match(self):
-        profile = _load_profile()
+    def test_weights_match(self, profile):
         assert profile["weights"] == HEALTH_WEIGHTS
 
-    def test_weights_sum_to_one(self):
-        profile = _load_profile()
+    def test_weights_sum_to_one(self, profile):
         total = sum(profile["weights"])
         assert abs(total - 1.0) < 1e-9, f"Weights sum to {total}, expected 1.0"
 
-    def test_hierarchy_matches(self):
-        profile = _load_profile()
+    def test_hierarchy_matches(self, profile):
         assert profile["hierarchy"] == LAYER_HIERARCHY
 
-    def test_layer_count_consistent(self):
-        profile = _load_profile()
+    def test_layer_count_consistent(self, profile):
         assert len(profile["layer_names"]) == len(profile["weights"])
 
-    def test_hierarchy_covers_all_layers(self):
-        profile = _load_profile()
+    def test_hierarchy_covers_all_layers(self, profile):
         hierarchy_layers = set(profile["hierarchy"].keys())
         layer_names = set(profile["layer_names"])
         assert hierarchy_layers == layer_names, (
             f"Hierarchy keys {hierarchy_layers} != layer names {layer_names}"
         )
 
-    def test_version_is_semver(self):
-        profile = _load_profile()
+    def test_version_is_semver(self, profile):
         version = profile["version"]
         parts = version.split(".")
         assert len(parts) == 3, f"Version '{version}' is not semver (expected X.Y.Z)"
         for part in parts:
             assert part.isdigit(), f"Version part '{part}' is not numeric"
 
-    def test_has_required_fields(self):
-        profile = _load_profile()
+    def test_has_required_fields(self, profile):
         required = [
             "domain_name",
             "version",
@@ -106,17 +84,14 @@ class TestProfileSync:
         for field in required:
             assert field in profile, f"Missing required field: {field}"
 
-    def test_thresholds_detection_is_positive(self):
-        profile = _load_profile()
+    def test_thresholds_detection_is_positive(self, profile):
         threshold = profile["thresholds"]["detection"]
         assert 0 < threshold < 1, f"Detection threshold {threshold} not in (0, 1)"
 
-    def test_temporal_allowlist_not_empty(self):
-        profile = _load_profile()
+    def test_temporal_allowlist_not_empty(self, profile):
         assert len(profile["temporal_allowlist"]) > 0
 
-    def test_guardrails_present(self):
-        profile = _load_profile()
+    def test_guardrails_present(self, profile):
         assert "guardrails" in profile
         guardrails = profile["guardrails"]
         assert "disclaimers" in guardrails
@@ -5,6 +5,8 @@ Tests cover all 4 compute functions, the orchestrator, and domain constants.
 
 from __future__ import annotations
 
+from functools import cache
+
 import pytest
 
 from cip.domains.health.connectors.mock_data import (
@@ -35,7 +37,10 @@ from cip.domains.health.domain_logic.signal_translator import (
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
+# Cached: the compute_* functions only read their inputs, so tests that ask for
+# the same values share one object instead of rebuilding the nested dicts.
 
+@cache
 def _vitals(rhr=68, systolic=122, diastolic=78, hrv=42, spo2=97.2, rhr_trend=0):
     return {
         "resting_heart_rate": {"current_bpm": rhr, "trend_30d": rhr_trend},
@@ -45,6 +50,7 @@ def _vitals(rhr=68, systolic=122, diastolic=78, hrv=42, spo2=97.2, rhr_trend=0):
     }
 
 
+@cache
 def _labs(glucose=95, hba1c=5.4, ldl=130, hdl=55, trig=140):
     labs = []
     if glucose is not None:
@@ -60,10 +66,12 @@ def _labs(glucose=95, hba1c=5.4, ldl=130, hdl=55, trig=140):
     return labs
 
 
+@cache
 def _biometrics(bmi=25.5, trend=-0.3):
     return {"bmi": bmi, "bmi_trend_90d": trend}
 
 
+@cache
 def _activity(sessions=3.5, consistency=75, sleep_hours=7.1, sleep_quality=72, recovery=65, strain="slightly_high"):
     return {
         "exercise": {"sessions_per_week": sessions, "consistency_pct": consistency},
@@ -72,6 +80,7 @@ def _activity(sessions=3.5, consistency=75, sleep_hours=7.1, sleep_quality=72, r
     }
 
 
+@cache
 def _preventive(screenings_current=2, screenings_total=4, vaxx_current=3, vaxx_total=3, adherence=92, active_rx=1):
     screenings = {}
     for i in range(screenings_total):
@@ -116,13 +125,11 @@ class TestVitalStability:
         high_hrv, _ = compute_vital_stability(_vitals(hrv=50))
         assert high_hrv > low_hrv
 
-    def test_signal_always_in_bounds(self):
-        for rhr in [40, 55, 65, 80, 100, 120]:
-            for systolic in [90, 120, 150, 180]:
-                signal, _ = compute_vital_stability(
-                    _vitals(rhr=rhr, systolic=systolic)
-                )
-                assert 0.0 <= signal <= 1.0, f"Out of bounds: {signal}"
+    @pytest.mark.parametrize("rhr", [40, 55, 65, 80, 100, 120])
+    @pytest.mark.parametrize("systolic", [90, 120, 150, 180])
+    def test_signal_always_in_bounds(self, rhr, systolic):
+        signal, _ = compute_vital_stability(_vitals(rhr=rhr, systolic=systolic))
+        assert 0.0 <= signal <= 1.0, f"Out of bounds: {signal}"
 
     def test_monotonicity_resting_hr(self):
         """Signal should decrease as HR moves away from optimal (65)."""
@@ -168,13 +175,11 @@ class TestMetabolicBalance:
         normal, _ = compute_metabolic_balance(_labs(glucose=85), _biometrics())
         assert normal > high
 
-    def test_signal_always_in_bounds(self):
-        for glucose in [70, 100, 140]:
-            for ldl in [50, 100, 170]:
-                signal, _ = compute_metabolic_balance(
-                    _labs(glucose=glucose, ldl=ldl), _biometrics()
-                )
-                assert 0.0 <= signal <= 1.0
+    @pytest.mark.parametrize("glucose", [70, 100, 140])
+    @pytest.mark.parametrize("ldl", [50, 100, 170])
+    def test_signal_always_in_bounds(self, glucose, ldl):
+        signal, _ = compute_metabolic_balance(_labs(glucose=glucose, ldl=ldl), _biometrics())
+        assert 0.0 <= signal <= 1.0
 
     def test_bmi_optimal_range_gives_high(self):
         optimal, _ = compute_metabolic_balance(_labs(), _biometrics(bmi=22))
@@ -213,13 +218,11 @@ class TestActivityRecovery:
         short, _ = compute_activity_recovery(_activity(sleep_hours=5))
         assert optimal > short
 
-    def test_signal_always_in_bounds(self):
-        for sessions in [0, 2, 5, 7]:
-            for sleep in [4, 7, 10]:
-                signal, _ = compute_activity_recovery(
-                    _activity(sessions=sessions, sleep_hours=sleep)
-                )
-                assert 0.0 <= signal <= 1.0
+    @pytest.mark.parametrize("sessions", [0, 2, 5, 7])
+    @pytest.mark.parametrize("sleep", [4, 7, 10])
+    def test_signal_always_in_bounds(self, sessions, sleep):
+        signal, _ = compute_activity_recovery(_activity(sessions=sessions, sleep_hours=sleep))
+        assert 0.0 <= signal <= 1.0
 
     def test_high_strain_penalizes(self):
         high_strain, _ = compute_activity_recovery(_activity(strain="high"))
@@ -259,86 +262,60 @@ class TestPreventiveReadiness:
         signal, details = compute_preventive_readiness({})
         assert signal == FALLBACK_PARTIAL_DATA
 
-    def test_signal_always_in_bounds(self):
-        for sc in [0, 2, 4]:
-            for vc in [0, 1, 3]:
-                signal, _ = compute_preventive_readiness(
-                    _preventive(screenings_current=sc, vaxx_current=vc)
-                )
-                assert 0.0 <= signal <= 1.0
+    @pytest.mark.parametrize("sc", [0, 2, 4])
+    @pytest.mark.parametrize("vc", [0, 1, 3])
+    def test_signal_always_in_bounds(self, sc, vc):
+        signal, _ = compute_preventive_readiness(
+            _preventive(screenings_current=sc, vaxx_current=vc)
+        )
+        assert 0.0 <= signal <= 1.0
 
 
 # ===========================================================================
 # Test: Orchestrator
 # ===========================================================================
 
+# The mock generators are deterministic and the translator only reads its inputs.
+_MOCK_INPUTS = (
+    get_mock_vitals_data(),
+    get_mock_lab_results(),
+    get_mock_activity_data(),
+    get_mock_preventive_care(),
+    get_mock_biometrics(),
+)
+
+
 class TestTranslateOrchestrator:
     def test_returns_health_signals_type(self):
-        result = translate_health_to_mantic(
-            get_mock_vitals_data(),
-            get_mock_lab_results(),
-            get_mock_activity_data(),
-            get_mock_preventive_care(),
-            get_mock_biometrics(),
-        )
+        result = translate_health_to_mantic(*_MOCK_INPUTS)
         assert isinstance(result, HealthSignals)
 
     def test_as_layer_values_matches_layer_names_order(self):
-        result = translate_health_to_mantic(
-            get_mock_vitals_data(),
-            get_mock_lab_results(),
-            get_mock_activity_data(),
-            get_mock_preventive_care(),
-            get_mock_biometrics(),
-        )
+        result = translate_health_to_mantic(*_MOCK_INPUTS)
         values = result.as_layer_values()
         assert len(values) == len(LAYER_NAMES)
 
     def test_all_signals_in_bounds(self):
-        result = translate_health_to_mantic(
-            get_mock_vitals_data(),
-            get_mock_lab_results(),
-            get_mock_activity_data(),
-            get_mock_preventive_care(),
-            get_mock_biometrics(),
-        )
+        result = translate_health_to_mantic(*_MOCK_INPUTS)
         for v in result.as_layer_values():
             assert 0.0 <= v <= 1.0
 
     def test_details_has_all_signals(self):
-        result = translate_health_to_mantic(
-            get_mock_vitals_data(),
-            get_mock_lab_results(),
-            get_mock_activity_data(),
-            get_mock_preventive_care(),
-            get_mock_biometrics(),
-        )
+        result = translate_health_to_mantic(*_MOCK_INPUTS)
         for name in LAYER_NAMES:
             assert name in result.details
 
     def test_determinism(self):
         """100 identical calls produce identical output."""
-        results = [
-            translate_health_to_mantic(
-                get_mock_vitals_data(),
-                get_mock_lab_results(),
-                get_mock_activity_data(),
-                get_mock_preventive_care(),
-                get_mock_biometrics(),
-            ).as_layer_values()
-            for _ in range(100)
-        ]
-        assert all(r == results[0] for r in results)
+        first = translate_health_to_mantic(*_MOCK_INPUTS).as_layer_values()
+        assert all(
+            translate_health_to_mantic(*_MOCK_INPUTS).as_layer_values() == first
+            for _ in range(99)
+        )
 
     def test_mock_data_golden_band(self):
         """Mock data should produce all signals in [0.3, 0.9] golden band."""
-        result = translate_health_to_mantic(
-            get_mock_vitals_data(),
-            get_mock_lab_results(),
-            get_mock_activity_data(),
-            get_mock_preventive_care(),
-            get_mock_biometrics(),
-        )
+        result = translate_health_to_mantic(*_MOCK_INPUTS)
         for name, value in zip(LAYER_NAMES, result.as_layer_values()):
             assert 0.3 <= value <= 0.9, f"{name} = {value} outside golden band [0.3, 0.9]"
 
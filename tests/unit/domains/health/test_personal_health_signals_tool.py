@@ -3,123 +3,219 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import json
+import logging
 
 import pytest
 from fastmcp import Client
 
 from cip.core.server.app import create_app
 
+_TOOL_LOGGER = "cip.domains.health.tools.personal_health_signals"
+
+# One runner (and event loop) for the whole module, closed at exit.
+_RUNNER = asyncio.Runner()
+atexit.register(_RUNNER.close)
+
 
 def _run(coro):
     """Run an async coroutine synchronously (no pytest-asyncio required)."""
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+    return _RUNNER.run(coro)
+
+
+@pytest.fixture(scope="module")
+def client(mock_mantic_app):
+    """MCP client for the shared mock-Mantic server, connected once per module."""
+    client = Client(mock_mantic_app)
+    _run(client.__aenter__())
+    yield client
+    _run(client.__aexit__(None, None, None))
+
+
+# Stateless provider / Mantic stubs, defined and instantiated once per module.
+class _HighBPMockProvider:
+    """Reports a systolic average above the escalation threshold."""
+
+    async def get_vitals(self, period: str = "last_30_days"):
+        return {
+            "period": period,
+            "resting_heart_rate": {"current_bpm": 70, "trend_30d": 0},
+            "blood_pressure": {"systolic_avg": 190, "diastolic_avg": 95},
+            "hrv": {"avg_ms": 35},
+            "spo2": {"avg_pct": 97},
+        }
+
+    async def get_lab_results(self):
+        return []
+
+    async def get_activity_data(self, period: str = "last_30_days"):
+        return {
+            "period": period,
+            "exercise": {"sessions_per_week": 2, "consistency_pct": 60},
+            "sleep": {"avg_duration_hours": 7, "avg_quality_score": 60},
+            "recovery": {"avg_recovery_score": 60, "strain_balance": "balanced"},
+        }
+
+    async def get_preventive_care(self):
+        return {}
+
+    async def get_biometrics(self):
+        return {}
+
+    def is_connected(self) -> bool:
+        return True
+
+    @property
+    def data_source(self) -> str:
+        return "mock"
+
+    def get_provenance(self) -> dict[str, str]:
+        return {"data_source": "mock", "data_source_note": "test"}
+
+
+class _UnreachableMantic:
+    """Fails the test if the escalation path reaches cip-mantic-core."""
+
+    async def list_profiles(self):
+        return {"profiles": ["consumer_health"]}
+
+    async def detect_friction(self, *args, **kwargs):
+        raise AssertionError("Mantic should not be called on escalation path")
+
+    async def detect_emergence(self, *args, **kwargs):
+        raise AssertionError("Mantic should not be called on escalation path")
+
+
+class _EmptyDataProvider:
+    """Returns empty/missing data for everything — simulates a bare connection."""
+
+    async def get_vitals(self, period: str = "last_30_days"):
+        return {}
+
+    async def get_lab_results(self):
+        return []
+
+    async def get_activity_data(self, period: str = "last_30_days"):
+        return {}
+
+    async def get_preventive_care(self):
+        return {}
+
+    async def get_biometrics(self):
+        return {}
+
+    def is_connected(self) -> bool:
+        return True
+
+    @property
+    def data_source(self) -> str:
+        return "mock"
+
+    def get_provenance(self) -> dict[str, str]:
+        return {"data_source": "mock", "data_source_note": "test"}
+
+
+class _PassthroughMantic:
+    """Returns a well-formed low-signal Mantic response."""
 
+    async def list_profiles(self):
+        return {"profiles": ["consumer_health"]}
 
-@pytest.fixture
-def client(mock_mantic_client):
-    """Create an MCP client connected to the server with mock Mantic."""
-    mcp = create_app(mantic_client_override=mock_mantic_client)
-    return Client(mcp)
+    async def detect_friction(self, *args, **kwargs):
+        return {
+            "status": "ok", "contract_version": "1.0.0",
+            "domain_profile": {"domain_name": "consumer_health", "version": "1.0.0"},
+            "mode": "friction", "layer_values": [0.3, 0.3, 0.3, 0.3],
+            "result": {
+                "m_score": 0.3, "alert": None, "severity": 0,
+                "mismatch_score": 0.0, "spatial_component": 0.3,
+                "layer_attribution": {}, "layer_coupling": {"coherence": 1.0},
+                "layer_visibility": {"dominant": "Micro"},
+                "thresholds": {"detection": 0.42}, "overrides_applied": {},
+            },
+            "audit": {"clamped_fields": [], "rejected_fields": []},
+        }
+
+    async def detect_emergence(self, *args, **kwargs):
+        return {
+            "status": "ok", "contract_version": "1.0.0",
+            "domain_profile": {"domain_name": "consumer_health", "version": "1.0.0"},
+            "mode": "emergence", "layer_values": [0.3, 0.3, 0.3, 0.3],
+            "result": {
+                "m_score": 0.3, "window_detected": False, "window_type": None,
+                "confidence": 0.0, "alignment_floor": 0.3,
+                "limiting_factor": None, "recommended_action": None,
+                "spatial_component": 0.3, "layer_attribution": {},
+                "layer_coupling": {"coherence": 1.0},
+                "thresholds": {"detection": 0.42}, "overrides_applied": {},
+            },
+            "audit": {"clamped_fields": [], "rejected_fields": []},
+        }
+
+
+class _DownMantic:
+    """Simulates cip-mantic-core being down or misconfigured."""
+
+    async def list_profiles(self):
+        raise RuntimeError("down")
+
+    async def detect_friction(self, *args, **kwargs):
+        raise RuntimeError("down")
+
+    async def detect_emergence(self, *args, **kwargs):
+        raise RuntimeError("down")
+
+
+_HIGH_BP_PROVIDER = _HighBPMockProvider()
+_UNREACHABLE_MANTIC = _UnreachableMantic()
+_EMPTY_DATA_PROVIDER = _EmptyDataProvider()
+_PASSTHROUGH_MANTIC = _PassthroughMantic()
+_DOWN_MANTIC = _DownMantic()
 
 
 def test_tool_returns_content(client):
     """personal_health_signal should return non-empty LLM content."""
     async def _check():
-        async with client:
-            result = await client.call_tool("personal_health_signal", {})
-            assert result
+        result = await client.call_tool("personal_health_signal", {})
+        assert result
     _run(_check())
 
 
 def test_tool_accepts_period(client):
     """Tool should accept a period parameter."""
     async def _check():
-        async with client:
-            result = await client.call_tool(
-                "personal_health_signal", {"period": "last_90_days"}
-            )
-            assert result
+        result = await client.call_tool(
+            "personal_health_signal", {"period": "last_90_days"}
+        )
+        assert result
     _run(_check())
 
 
 def test_tool_appears_in_tool_list(client):
     """personal_health_signal should be discoverable."""
     async def _check():
-        async with client:
-            tools = await client.list_tools()
-            tool_names = [t.name for t in tools]
-            assert "personal_health_signal" in tool_names
+        tools = await client.list_tools()
+        tool_names = [t.name for t in tools]
+        assert "personal_health_signal" in tool_names
     _run(_check())
 
 
 def test_tool_accepts_tone_variant(client):
     """Tool should accept tone_variant parameter."""
     async def _check():
-        async with client:
-            result = await client.call_tool(
-                "personal_health_signal", {"tone_variant": "clinical"}
-            )
-            assert result
+        result = await client.call_tool(
+            "personal_health_signal", {"tone_variant": "clinical"}
+        )
+        assert result
     _run(_check())
 
 
 def test_escalation_trigger_bypasses_llm_and_mantic():
     """High-risk vitals should return a deterministic escalation response."""
-
-    class _HighBPMockProvider:
-        async def get_vitals(self, period: str = "last_30_days"):
-            return {
-                "period": period,
-                "resting_heart_rate": {"current_bpm": 70, "trend_30d": 0},
-                "blood_pressure": {"systolic_avg": 190, "diastolic_avg": 95},
-                "hrv": {"avg_ms": 35},
-                "spo2": {"avg_pct": 97},
-            }
-
-        async def get_lab_results(self):
-            return []
-
-        async def get_activity_data(self, period: str = "last_30_days"):
-            return {
-                "period": period,
-                "exercise": {"sessions_per_week": 2, "consistency_pct": 60},
-                "sleep": {"avg_duration_hours": 7, "avg_quality_score": 60},
-                "recovery": {"avg_recovery_score": 60, "strain_balance": "balanced"},
-            }
-
-        async def get_preventive_care(self):
-            return {}
-
-        async def get_biometrics(self):
-            return {}
-
-        def is_connected(self) -> bool:
-            return True
-
-        @property
-        def data_source(self) -> str:
-            return "mock"
-
-        def get_provenance(self) -> dict[str, str]:
-            return {"data_source": "mock", "data_source_note": "test"}
-
-    class _FailingMantic:
-        async def list_profiles(self):
-            return {"profiles": ["consumer_health"]}
-
-        async def detect_friction(self, *args, **kwargs):
-            raise AssertionError("Mantic should not be called on escalation path")
-
-        async def detect_emergence(self, *args, **kwargs):
-            raise AssertionError("Mantic should not be called on escalation path")
-
     mcp = create_app(
-        health_data_provider_override=_HighBPMockProvider(),
-        mantic_client_override=_FailingMantic(),
+        health_data_provider_override=_HIGH_BP_PROVIDER,
+        mantic_client_override=_UNREACHABLE_MANTIC,
     )
     client = Client(mcp)
 
@@ -142,73 +238,9 @@ def test_missing_data_does_not_trigger_all_signals_escalation():
     The safety gate should only fire on genuinely low real data, so the user gets
     a normal LLM analysis (not a scary escalation) when data is simply absent.
     """
-
-    class _EmptyDataProvider:
-        """Returns empty/missing data for everything — simulates a bare connection."""
-
-        async def get_vitals(self, period: str = "last_30_days"):
-            return {}
-
-        async def get_lab_results(self):
-            return []
-
-        async def get_activity_data(self, period: str = "last_30_days"):
-            return {}
-
-        async def get_preventive_care(self):
-            return {}
-
-        async def get_biometrics(self):
-            return {}
-
-        def is_connected(self) -> bool:
-            return True
-
-        @property
-        def data_source(self) -> str:
-            return "mock"
-
-        def get_provenance(self) -> dict[str, str]:
-            return {"data_source": "mock", "data_source_note": "test"}
-
-    class _PassthroughMantic:
-        async def list_profiles(self):
-            return {"profiles": ["consumer_health"]}
-
-        async def detect_friction(self, *args, **kwargs):
-            return {
-                "status": "ok", "contract_version": "1.0.0",
-                "domain_profile": {"domain_name": "consumer_health", "version": "1.0.0"},
-                "mode": "friction", "layer_values": [0.3, 0.3, 0.3, 0.3],
-                "result": {
-                    "m_score": 0.3, "alert": None, "severity": 0,
-                    "mismatch_score": 0.0, "spatial_component": 0.3,
-                    "layer_attribution": {}, "layer_coupling": {"coherence": 1.0},
-                    "layer_visibility": {"dominant": "Micro"},
-                    "thresholds": {"detection": 0.42}, "overrides_applied": {},
-                },
-                "audit": {"clamped_fields": [], "rejected_fields": []},
-            }
-
-        async def detect_emergence(self, *args, **kwargs):
-            return {
-                "status": "ok", "contract_version": "1.0.0",
-                "domain_profile": {"domain_name": "consumer_health", "version": "1.0.0"},
-                "mode": "emergence", "layer_values": [0.3, 0.3, 0.3, 0.3],
-                "result": {
-                    "m_score": 0.3, "window_detected": False, "window_type": None,
-                    "confidence": 0.0, "alignment_floor": 0.3,
-                    "limiting_factor": None, "recommended_action": None,
-                    "spatial_component": 0.3, "layer_attribution": {},
-                    "layer_coupling": {"coherence": 1.0},
-                    "thresholds": {"detection": 0.42}, "overrides_applied": {},
-                },
-                "audit": {"clamped_fields": [], "rejected_fields": []},
-            }
-
     mcp = create_app(
-        health_data_provider_override=_EmptyDataProvider(),
-        mantic_client_override=_PassthroughMantic(),
+        health_data_provider_override=_EMPTY_DATA_PROVIDER,
+        mantic_client_override=_PASSTHROUGH_MANTIC,
     )
     client = Client(mcp)
 
@@ -233,7 +265,7 @@ def test_detect_escalation_triggers_unit():
         "activity_recovery": {"exercise_signal": 0.1},
         "preventive_readiness": {"screening_signal": 0.1},
     }
-    triggers = _detect_escalation_triggers(
+    triggers, _ = _detect_escalation_triggers(
         layer_values=[0.1, 0.2, 0.15, 0.1],
         vitals_data={},
         signal_details=real_details,
@@ -247,7 +279,7 @@ def test_detect_escalation_triggers_unit():
         "activity_recovery": {"fallback": "no_activity_data"},
         "preventive_readiness": {"fallback": "no_preventive_data"},
     }
-    triggers = _detect_escalation_triggers(
+    triggers, _ = _detect_escalation_triggers(
         layer_values=[0.1, 0.2, 0.15, 0.1],
         vitals_data={},
         signal_details=fallback_details,
@@ -261,7 +293,7 @@ def test_detect_escalation_triggers_unit():
         "activity_recovery": {"exercise_signal": 0.1},
         "preventive_readiness": {"screening_signal": 0.1},
     }
-    triggers = _detect_escalation_triggers(
+    triggers, _ = _detect_escalation_triggers(
         layer_values=[0.1, 0.2, 0.15, 0.1],
         vitals_data={},
         signal_details=mixed_details,
@@ -269,7 +301,7 @@ def test_detect_escalation_triggers_unit():
     assert "all_signals_below_0.3" not in triggers
 
     # Systolic trigger still works independently
-    triggers = _detect_escalation_triggers(
+    triggers, _ = _detect_escalation_triggers(
         layer_values=[0.7, 0.6, 0.5, 0.8],
         vitals_data={"blood_pressure": {"systolic_avg": 195}},
         signal_details=real_details,
@@ -277,26 +309,177 @@ def test_detect_escalation_triggers_unit():
     assert "systolic_over_180" in triggers
     assert "all_signals_below_0.3" not in triggers
 
+    # Parsed BP readings are returned for the escalation renderer
+    triggers, parsed = _detect_escalation_triggers(
+        layer_values=[0.7, 0.6, 0.5, 0.8],
+        vitals_data={"blood_pressure": {"systolic_avg": "195", "diastolic_avg": 101}},
+    )
+    assert parsed == {"systolic": 195.0, "diastolic": 101.0}
+
 
 def test_mantic_failure_falls_back_to_local_summary():
     """If cip-mantic-core is down/misconfigured, the tool should still return content."""
+    mcp = create_app(mantic_client_override=_DOWN_MANTIC)
+    client = Client(mcp)
+
+    async def _check():
+        async with client:
+            result = await client.call_tool("personal_health_signal", {})
+            assert result
+
+    _run(_check())
 
-    class _FailingMantic:
-        async def list_profiles(self):
-            raise RuntimeError("down")
 
-        async def detect_friction(self, *args, **kwargs):
-            raise RuntimeError("down")
+def test_strict_mode_with_extra_provenance_keys(mock_mantic_client):
+    """Strict mode must ignore provenance keys beyond data_source/data_source_note."""
+    from cip.domains.health.connectors.composite import CompositeHealthProvider
+    from cip.domains.health.connectors.providers import MockHealthDataProvider
 
-        async def detect_emergence(self, *args, **kwargs):
-            raise RuntimeError("down")
+    provider = CompositeHealthProvider([MockHealthDataProvider()])
+    assert "active_sources" in provider.get_provenance()
 
-    mcp = create_app(mantic_client_override=_FailingMantic())
+    mcp = create_app(
+        health_data_provider_override=provider,
+        mantic_client_override=mock_mantic_client,
+    )
     client = Client(mcp)
 
     async def _check():
         async with client:
-            result = await client.call_tool("personal_health_signal", {})
+            result = await client.call_tool(
+                "personal_health_signal", {"privacy_mode": "strict"}
+            )
             assert result
 
     _run(_check())
+
+
+def test_local_mantic_summary_from_signals():
+    """Local fallback summary picks the weakest layer and gates emergence on the floor."""
+    from cip.domains.health.tools.personal_health_signals import (
+        _local_mantic_summary_from_signals,
+    )
+
+    summary = _local_mantic_summary_from_signals([0.5, 0.9, 0.2, 0.9])
+    assert summary["limiting_factor"] == "activity_recovery"
+    assert summary["friction_level"] == "high"
+    assert summary["coherence"] == 0.3
+    assert summary["emergence_window"] is False
+
+    summary = _local_mantic_summary_from_signals([0.8, 0.75, 0.8, 0.7])
+    assert summary["limiting_factor"] == "preventive_readiness"
+    assert summary["friction_level"] == "low"
+    assert summary["emergence_window"] is True
+
+
+def test_repeated_calls_persist_snapshots(mock_mantic_client, health_repository):
+    """Each call should persist a snapshot, and later calls should still succeed
+    once enough history exists for trend analysis."""
+    mcp = create_app(
+        mantic_client_override=mock_mantic_client,
+        repository_override=health_repository,
+    )
+    client = Client(mcp)
+
+    async def _check():
+        async with client:
+            for _ in range(3):
+                result = await client.call_tool(
+                    "personal_health_signal", {"privacy_mode": "explicit"}
+                )
+                assert result
+
+    _run(_check())
+    assert health_repository.count_snapshots() == 3
+
+
+def test_deleted_history_is_not_injected(mock_mantic_client, health_repository, caplog):
+    """After the user deletes their data, the next call must not report stale history."""
+    mcp = create_app(
+        mantic_client_override=mock_mantic_client,
+        repository_override=health_repository,
+    )
+    client = Client(mcp)
+
+    async def _call():
+        async with client:
+            await client.call_tool("personal_health_signal", {"privacy_mode": "explicit"})
+
+    with caplog.at_level(logging.INFO, logger=_TOOL_LOGGER):
+        for _ in range(3):
+            _run(_call())
+        assert "Injected historical context" in caplog.text
+
+        health_repository.delete_all_data()
+        caplog.clear()
+        _run(_call())
+    assert "Injected historical context" not in caplog.text
+
+
+def test_make_snapshot_fills_mantic_fields_only_when_given():
+    """Escalation snapshots leave Mantic fields at their defaults."""
+    from cip.domains.health.tools.personal_health_signals import _make_snapshot
+
+    common = dict(
+        source="mock",
+        period="last_30_days",
+        vitals_data={},
+        lab_results=[],
+        activity_data={},
+        preventive_care={},
+        biometrics={},
+        layer_values=[0.7, 0.55, 0.65, 0.5],
+        provenance={"data_source": "mock"},
+    )
+
+    snap = _make_snapshot(**common)
+    assert snap.vital_stability == 0.7
+    assert snap.preventive_readiness == 0.5
+    assert snap.friction_m_score is None
+    assert snap.friction_detected is False
+    assert snap.emergence_detected is False
+
+    snap = _make_snapshot(
+        **common,
+        friction_result={"m_score": 0.38, "alert": "friction"},
+        emergence_result={"m_score": 0.6, "window_detected": True, "window_type": "growth"},
+    )
+    assert snap.friction_m_score == 0.38
+    assert snap.friction_detected is True
+    assert snap.emergence_m_score == 0.6
+    assert snap.emergence_detected is True
+    assert snap.emergence_window_type == "growth"
+
+
+def test_mantic_layer_values_for_profile():
+    """signal_core reorders to [micro, meso, macro, meta]; other profiles pass through."""
+    from cip.domains.health.tools.personal_health_signals import (
+        _mantic_layer_values_for_profile,
+    )
+
+    values = [0.1, 0.2, 0.3, 0.4]
+    assert _mantic_layer_values_for_profile("signal_core", values) == [0.1, 0.3, 0.2, 0.4]
+    assert _mantic_layer_values_for_profile("consumer_health", values) is values
+    assert _mantic_layer_values_for_profile("signal_core", [0.1, 0.2]) == [0.1, 0.2]
+
+
+def test_cross_domain_context_accepts_nan(client, caplog):
+    """NaN/Infinity (as emitted by Python's json) must not drop the context."""
+    async def _check():
+        result = await client.call_tool(
+            "personal_health_signal",
+            {"cross_domain_context": json.dumps({"finance": {"score": float("nan")}})},
+        )
+        assert result
+    _run(_check())
+    assert "Invalid cross_domain_context" not in caplog.text
+
+
+def test_invalid_cross_domain_context_is_ignored(client):
+    """Malformed cross_domain_context JSON should be ignored, not fail the call."""
+    async def _check():
+        result = await client.call_tool(
+            "personal_health_signal", {"cross_domain_context": "{not json"}
+        )
+        assert result
+    _run(_check())
@@ -31,6 +31,39 @@ def _snapshot(
     )
 
 
+# Canonical oldest-first series. save_snapshot() does not mutate its input,
+# so the same snapshots are reused and each set is stored in one transaction.
+_IMPROVING_VS = tuple(
+    _snapshot(ts, vs=vs)
+    for ts, vs in [
+        ("2026-01-01T00:00:00Z", 0.5), ("2026-01-15T00:00:00Z", 0.55),
+        ("2026-02-01T00:00:00Z", 0.65), ("2026-02-15T00:00:00Z", 0.72),
+    ]
+)
+_DECLINING_VS = tuple(
+    _snapshot(ts, vs=vs)
+    for ts, vs in [
+        ("2026-01-01T00:00:00Z", 0.8), ("2026-01-15T00:00:00Z", 0.75),
+        ("2026-02-01T00:00:00Z", 0.68), ("2026-02-15T00:00:00Z", 0.60),
+    ]
+)
+_STABLE_VS = tuple(
+    _snapshot(ts, vs=vs)
+    for ts, vs in [
+        ("2026-01-01T00:00:00Z", 0.70), ("2026-01-15T00:00:00Z", 0.71),
+        ("2026-02-01T00:00:00Z", 0.69), ("2026-02-15T00:00:00Z", 0.70),
+    ]
+)
+# vital_stability improving while metabolic_balance declines
+_DIVERGING_VS_MB = tuple(
+    _snapshot(ts, vs=vs, mb=mb)
+    for ts, vs, mb in [
+        ("2026-01-01T00:00:00Z", 0.5, 0.7), ("2026-01-15T00:00:00Z", 0.55, 0.65),
+        ("2026-02-01T00:00:00Z", 0.65, 0.55), ("2026-02-15T00:00:00Z", 0.72, 0.48),
+    ]
+)
+
+
 class TestComputeSignalTrend:
     def test_no_data_returns_no_data(self, health_repository):
         analyzer = TrendAnalyzer(health_repository)
@@ -46,11 +79,7 @@ class TestComputeSignalTrend:
         assert result["current"] == 0.7
 
     def test_improving_trend_detected(self, health_repository):
-        # Older snapshots with lower values, newer with higher
-        health_repository.save_snapshot(_snapshot("2026-01-01T00:00:00Z", vs=0.5))
-        health_repository.save_snapshot(_snapshot("2026-01-15T00:00:00Z", vs=0.55))
-        health_repository.save_snapshot(_snapshot("2026-02-01T00:00:00Z", vs=0.65))
-        health_repository.save_snapshot(_snapshot("2026-02-15T00:00:00Z", vs=0.72))
+        health_repository.save_snapshots(_IMPROVING_VS)
 
         analyzer = TrendAnalyzer(health_repository)
         result = analyzer.compute_signal_trend("vital_stability")
@@ -59,28 +88,24 @@ class TestComputeSignalTrend:
         assert result["current"] == 0.72
 
     def test_declining_trend_detected(self, health_repository):
-        health_repository.save_snapshot(_snapshot("2026-01-01T00:00:00Z", vs=0.8))
-        health_repository.save_snapshot(_snapshot("2026-01-15T00:00:00Z", vs=0.75))
-        health_repository.save_snapshot(_snapshot("2026-02-01T00:00:00Z", vs=0.68))
-        health_repository.save_snapshot(_snapshot("2026-02-15T00:00:00Z", vs=0.60))
+        health_repository.save_snapshots(_DECLINING_VS)
 
         analyzer = TrendAnalyzer(health_repository)
         result = analyzer.compute_signal_trend("vital_stability")
         assert result["direction"] == "declining"
 
     def test_stable_trend_detected(self, health_repository):
-        health_repository.save_snapshot(_snapshot("2026-01-01T00:00:00Z", vs=0.70))
-        health_repository.save_snapshot(_snapshot("2026-01-15T00:00:00Z", vs=0.71))
-        health_repository.save_snapshot(_snapshot("2026-02-01T00:00:00Z", vs=0.69))
-        health_repository.save_snapshot(_snapshot("2026-02-15T00:00:00Z", vs=0.70))
+        health_repository.save_snapshots(_STABLE_VS)
 
         analyzer = TrendAnalyzer(health_repository)
         result = analyzer.compute_signal_trend("vital_stability")
         assert result["direction"] == "stable"
 
     def test_includes_statistics(self, health_repository):
-        health_repository.save_snapshot(_snapshot("2026-01-01T00:00:00Z", vs=0.5))
-        health_repository.save_snapshot(_snapshot("2026-02-01T00:00:00Z", vs=0.7))
+        health_repository.save_snapshots([
+            _snapshot("2026-01-01T00:00:00Z", vs=0.5),
+            _snapshot("2026-02-01T00:00:00Z", vs=0.7),
+        ])
 
         analyzer = TrendAnalyzer(health_repository)
         result = analyzer.compute_signal_trend("vital_stability")
@@ -91,6 +116,49 @@ class TestComputeSignalTrend:
         assert "std_dev" in result
         assert "volatility" in result
 
+    def test_all_signal_trends_match_single_signal(self, health_repository):
+        health_repository.save_snapshots(_DIVERGING_VS_MB)
+
+        analyzer = TrendAnalyzer(health_repository)
+        trends = analyzer.compute_all_signal_trends()
+        assert set(trends) == {
+            "vital_stability", "metabolic_balance", "activity_recovery", "preventive_readiness",
+        }
+        for name, trend in trends.items():
+            assert trend == analyzer.compute_signal_trend(name)
+
+    def test_trends_cached_until_repository_changes(self, health_repository, monkeypatch):
+        health_repository.save_snapshot(_snapshot("2026-01-01T00:00:00Z", vs=0.5))
+        health_repository.save_snapshot(_snapshot("2026-02-01T00:00:00Z", vs=0.7))
+
+        fetches = []
+        fetch = health_repository.get_signal_histories
+        monkeypatch.setattr(
+            health_repository, "get_signal_histories",
+            lambda *args, **kwargs: fetches.append(1) or fetch(*args, **kwargs),
+        )
+
+        analyzer = TrendAnalyzer(health_repository)
+        trend = analyzer.compute_all_signal_trends()["vital_stability"]
+        assert analyzer.compute_signal_trend("vital_stability") == trend
+        analyzer.detect_divergence_patterns()
+        assert len(fetches) == 1
+
+        health_repository.save_snapshot(_snapshot("2026-03-01T00:00:00Z", vs=0.9))
+        updated = analyzer.compute_signal_trend("vital_stability")
+        assert updated["data_points"] == 3
+        assert updated["current"] == 0.9
+
+    def test_cached_trends_are_copies(self, health_repository):
+        health_repository.save_snapshots(_IMPROVING_VS)
+
+        analyzer = TrendAnalyzer(health_repository)
+        analyzer.compute_signal_trend("vital_stability")["direction"] = "tampered"
+        analyzer.compute_all_signal_trends()["vital_stability"]["current"] = -1.0
+        trend = analyzer.compute_signal_trend("vital_stability")
+        assert trend["direction"] == "improving"
+        assert trend["current"] == 0.72
+
 
 class TestComputeLabTrend:
     def test_no_data(self, health_repository):
@@ -138,11 +206,7 @@ class TestDetectDivergencePatterns:
         assert analyzer.detect_divergence_patterns() == []
 
     def test_detects_divergence(self, health_repository):
-        # vital_stability improving, metabolic_balance declining
-        health_repository.save_snapshot(_snapshot("2026-01-01T00:00:00Z", vs=0.5, mb=0.7))
-        health_repository.save_snapshot(_snapshot("2026-01-15T00:00:00Z", vs=0.55, mb=0.65))
-        health_repository.save_snapshot(_snapshot("2026-02-01T00:00:00Z", vs=0.65, mb=0.55))
-        health_repository.save_snapshot(_snapshot("2026-02-15T00:00:00Z", vs=0.72, mb=0.48))
+        health_repository.save_snapshots(_DIVERGING_VS_MB)
 
         analyzer = TrendAnalyzer(health_repository)
         divergences = analyzer.detect_divergence_patterns()
@@ -182,10 +246,11 @@ class TestSnapshotSummary:
 
     def test_with_data(self, health_repository):
         health_repository.save_snapshot(_snapshot("2026-01-01T00:00:00Z"))
-        health_repository.save_snapshot(_snapshot("2026-02-01T00:00:00Z"))
+        health_repository.save_snapshot(_snapshot("2026-02-01T00:00:00Z", source="manual"))
 
         analyzer = TrendAnalyzer(health_repository)
         summary = analyzer.get_snapshot_summary()
         assert summary["snapshots_available"] == 2
-        assert "latest_timestamp" in summary
-        assert "oldest_timestamp" in summary
+        assert summary["latest_timestamp"] == "2026-02-01T00:00:00Z"
+        assert summary["oldest_timestamp"] == "2026-01-01T00:00:00Z"
+        assert summary["latest_source"] == "manual"